@@ -1,12 +1,17 @@
 from fastapi import APIRouter
-from app.api.v1.endpoints import auth, users, status, incidents, blockers, decisions, summaries
+from app.api.v1.endpoints import auth, users, status, incidents, blockers, decisions, summaries, jobs, tags, search, dashboard, events
 
 api_router = APIRouter()
 
 api_router.include_router(auth.router, prefix="/auth", tags=["authentication"])
+api_router.include_router(dashboard.router, prefix="/dashboard", tags=["dashboard"])
 api_router.include_router(users.router, prefix="/users", tags=["users"])
 api_router.include_router(status.router, prefix="/status", tags=["status updates"])
 api_router.include_router(incidents.router, prefix="/incidents", tags=["incidents"])
 api_router.include_router(blockers.router, prefix="/blockers", tags=["blockers"])
 api_router.include_router(decisions.router, prefix="/decisions", tags=["decisions"])
-api_router.include_router(summaries.router, prefix="/summaries", tags=["daily summaries"])
\ No newline at end of file
+api_router.include_router(tags.router, prefix="/tags", tags=["tags"])
+api_router.include_router(search.router, prefix="/search", tags=["search"])
+api_router.include_router(events.router, prefix="/events", tags=["events"])
+api_router.include_router(summaries.router, prefix="/summaries", tags=["daily summaries"])
+api_router.include_router(jobs.router, prefix="/jobs", tags=["jobs"])
\ No newline at end of file
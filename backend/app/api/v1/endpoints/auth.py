@@ -1,22 +1,30 @@
-from datetime import timedelta
+from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
-from app.core.config import settings
-from app.core.security import verify_password, get_password_hash, create_access_token
-from app.core.dependencies import get_db, get_current_user
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.security import verify_password_async, get_password_hash_async
+from app.core.dependencies import CurrentUser, get_async_db, get_current_user
 from app.db.models.user import User
-from app.schemas.user import UserCreate, UserResponse, Token
+from app.schemas.user import UserCreate, UserResponse, Token, RefreshTokenRequest
+from app.services.token_service import (
+    issue_tokens,
+    consume_refresh_token,
+    revoke_refresh_token,
+    revoke_user_refresh_tokens,
+)
 from app.core.dependencies import oauth2_scheme
+from app.core.response_cache import invalidate
 
 router = APIRouter()
 
 
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-async def register(user_data: UserCreate, db: Session = Depends(get_db)):
+async def register(user_data: UserCreate, db: AsyncSession = Depends(get_async_db)):
     """Register a new user."""
     # Check if user already exists
-    existing_user = db.query(User).filter(User.email == user_data.email).first()
+    result = await db.execute(select(User).where(User.email == user_data.email))
+    existing_user = result.scalar_one_or_none()
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
@@ -24,7 +32,7 @@ async def register(user_data: UserCreate, db: Session = Depends(get_db)):
         )
     
     # Create new user
-    hashed_password = get_password_hash(user_data.password)
+    hashed_password = await get_password_hash_async(user_data.password)
     new_user = User(
         email=user_data.email,
         password_hash=hashed_password,
@@ -33,8 +41,9 @@ async def register(user_data: UserCreate, db: Session = Depends(get_db)):
     )
     
     db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    await db.commit()
+    await invalidate("users")
+    await db.refresh(new_user)
     
     return new_user
 
@@ -42,12 +51,13 @@ async def register(user_data: UserCreate, db: Session = Depends(get_db)):
 @router.post("/login", response_model=Token)
 async def login(
     form_data: OAuth2PasswordRequestForm = Depends(),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Login and get access token."""
-    user = db.query(User).filter(User.email == form_data.username).first()
+    """Login and get an access token plus a refresh token."""
+    result = await db.execute(select(User).where(User.email == form_data.username))
+    user = result.scalar_one_or_none()
     
-    if not user or not verify_password(form_data.password, user.password_hash):
+    if not user or not await verify_password_async(form_data.password, user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -60,19 +70,53 @@ async def login(
             detail="User account is inactive"
         )
     
-    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    access_token = create_access_token(
-        data={"sub": str(user.id), "email": user.email, "role": user.role},
-        expires_delta=access_token_expires
-    )
+    return await issue_tokens(db, user)
+
+
+@router.post("/refresh", response_model=Token)
+async def refresh(
+    token_data: RefreshTokenRequest,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Exchange a refresh token for a new access token (the refresh token is rotated)."""
+    user_id = await consume_refresh_token(db, token_data.refresh_token)
+    if user_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired refresh token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
     
-    return {
-        "access_token": access_token,
-        "token_type": "bearer"
-    }
+    user = await db.get(User, user_id)
+    if user is None or not user.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="User account is inactive"
+        )
+    
+    # Commits the old token's revocation together with the new token
+    return await issue_tokens(db, user)
 
 
 @router.post("/logout")
-async def logout(current_user: User = Depends(get_current_user)):
-    """Logout (client-side token removal)."""
+async def logout(
+    token_data: Optional[RefreshTokenRequest] = None,
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Logout: revokes the given refresh token; the client discards its access token."""
+    if token_data is not None:
+        await revoke_refresh_token(db, current_user.id, token_data.refresh_token)
+        await db.commit()
     return {"message": "Logged out successfully"}
+
+
+@router.post("/logout-all")
+async def logout_all(
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Revoke all of the current user's refresh tokens (signs out every session)."""
+    await revoke_user_refresh_tokens(db, current_user.id)
+    await db.commit()
+    return {"message": "All sessions logged out successfully"}
@@ -1,34 +1,74 @@
-from typing import Optional
+from typing import Any, Dict, List, Optional
 from datetime import datetime, timezone
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import desc
-from app.core.dependencies import get_db, get_current_user, get_current_active_admin
-from app.db.models.user import User
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+from sqlalchemy import and_, select, func
+from app.core.response_cache import invalidate
+from app.core.bulk import existing_ids, insert_returning, item_error, raise_item_errors, update_in_chunks
+from app.core.export import ExportFormat, export_response
+from app.core.dependencies import CurrentUser, get_async_db, get_current_user, get_current_active_admin
+from app.core.pagination import CountStrategy, apply_pagination, count_total, split_page
 from app.db.models.blocker import Blocker
 from app.db.models.status_update import StatusUpdate
 from app.db.models.incident import Incident
+from app.schemas.bulk import BulkCreateResult, BulkUpdateResult
 from app.schemas.blocker import (
     BlockerCreate,
+    BlockerBulkCreate,
+    BlockerBulkFilter,
+    BlockerBulkSelection,
+    BlockerBulkResolve,
     BlockerUpdate,
     BlockerResolve,
     Blocker as BlockerSchema,
     BlockerList
 )
+from app.services.change_feed import record_change, record_changes
+from app.services.summary_service import record_summary_change, record_summary_changes
 
 router = APIRouter()
 
+# Relationships serialized by BlockerSchema, loaded with the rows to avoid per-row queries
+_blocker_load_options = (
+    joinedload(Blocker.reported_by),
+)
+
+# List ordering: active first, then resolved, both by newest first.
+# 'active' < 'resolved', so this is served by the (archived, status, created_at) index.
+_blocker_sort_key = (
+    (Blocker.status, False),
+    (Blocker.created_at, True),
+    (Blocker.id, True),
+)
+
+# Columns written by the export endpoint, in output order
+_blocker_export_columns = (
+    Blocker.id,
+    Blocker.description,
+    Blocker.impact,
+    Blocker.status,
+    Blocker.resolution_notes,
+    Blocker.archived,
+    Blocker.reported_by_id,
+    Blocker.related_status_id,
+    Blocker.related_incident_id,
+    Blocker.created_at,
+    Blocker.updated_at,
+    Blocker.resolved_at,
+)
+
 
 @router.post("", response_model=BlockerSchema, status_code=status.HTTP_201_CREATED)
 async def create_blocker(
     blocker_data: BlockerCreate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user)
 ):
     """Create a new blocker."""
     # Validate related_status_id if provided
     if blocker_data.related_status_id:
-        status_update = db.query(StatusUpdate).filter(StatusUpdate.id == blocker_data.related_status_id).first()
+        status_update = await db.get(StatusUpdate, blocker_data.related_status_id)
         if not status_update:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -37,7 +77,7 @@ async def create_blocker(
     
     # Validate related_incident_id if provided
     if blocker_data.related_incident_id:
-        incident = db.query(Incident).filter(Incident.id == blocker_data.related_incident_id).first()
+        incident = await db.get(Incident, blocker_data.related_incident_id)
         if not incident:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -54,66 +94,216 @@ async def create_blocker(
     )
     
     db.add(new_blocker)
-    db.commit()
-    db.refresh(new_blocker)
+    await db.flush()
+    await record_summary_change(db, "blocker", new_blocker)
+    await record_change(db, "blockers", "created", new_blocker.id)
+    await db.commit()
+    await invalidate("blockers")
+    await db.refresh(new_blocker)
     
     # Load relationships
-    db.refresh(new_blocker, ["reported_by"])
+    await db.refresh(new_blocker, ["reported_by"])
     
     return new_blocker
 
 
+@router.post("/bulk", response_model=BulkCreateResult, status_code=status.HTTP_201_CREATED)
+async def bulk_create_blockers(
+    bulk_data: BlockerBulkCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user)
+):
+    """Create many blockers in one transaction; nothing is created if any item is invalid."""
+    items = bulk_data.items
+    
+    # Validate related status updates and incidents with one query each
+    known_statuses = await existing_ids(
+        db, StatusUpdate.id, (item.related_status_id for item in items if item.related_status_id)
+    )
+    known_incidents = await existing_ids(
+        db, Incident.id, (item.related_incident_id for item in items if item.related_incident_id)
+    )
+    errors = []
+    for index, item in enumerate(items):
+        if item.related_status_id and item.related_status_id not in known_statuses:
+            errors.append(item_error(index, "related_status_id", "Related status update not found"))
+        if item.related_incident_id and item.related_incident_id not in known_incidents:
+            errors.append(item_error(index, "related_incident_id", "Related incident not found"))
+    raise_item_errors(errors)
+    
+    new_blockers = await insert_returning(db, Blocker, [
+        {
+            "reported_by_id": current_user.id,
+            "description": item.description,
+            "impact": item.impact,
+            "related_status_id": item.related_status_id,
+            "related_incident_id": item.related_incident_id,
+            "status": "active"
+        }
+        for item in items
+    ])
+    ids = [new_blocker.id for new_blocker in new_blockers]
+    
+    await record_summary_changes(db, "blocker", new_blockers)
+    await record_changes(db, "blockers", "created", ids)
+    await db.commit()
+    await invalidate("blockers")
+    
+    return {"created": len(ids), "ids": ids}
+
+
+def _bulk_filter_criteria(bulk_filter: Optional[BlockerBulkFilter]) -> List[Any]:
+    """WHERE clauses for the filter of a bulk update."""
+    if bulk_filter is None:
+        return []
+    criteria = []
+    if bulk_filter.status is not None:
+        criteria.append(Blocker.status.in_(bulk_filter.status))
+    if bulk_filter.archived is not None:
+        criteria.append(Blocker.archived == bulk_filter.archived)
+    if bulk_filter.created_before is not None:
+        criteria.append(Blocker.created_at < bulk_filter.created_before)
+    if bulk_filter.resolved_before is not None:
+        criteria.append(Blocker.resolved_at < bulk_filter.resolved_before)
+    return criteria
+
+
+async def _bulk_update_blockers(
+    db: AsyncSession,
+    selection: BlockerBulkSelection,
+    pending: Any,
+    values: Dict[str, Any],
+    action: str
+) -> int:
+    """Apply ``values`` to the selected blockers matching ``pending`` (not yet in the target state)."""
+    async def on_chunk(blockers):
+        await record_summary_changes(db, "blocker", blockers)
+        await record_changes(db, "blockers", action, [blocker.id for blocker in blockers])
+    
+    try:
+        return await update_in_chunks(
+            db, Blocker, and_(pending, *_bulk_filter_criteria(selection.filter)), values, on_chunk,
+            ids=selection.ids
+        )
+    finally:
+        # Earlier chunks are committed even if a later one fails
+        await invalidate("blockers")
+
+
+@router.patch("/bulk/archive", response_model=BulkUpdateResult)
+async def bulk_archive_blockers(
+    selection: BlockerBulkSelection,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user)
+):
+    """Archive the blockers selected by ids or filter."""
+    affected = await _bulk_update_blockers(
+        db, selection, Blocker.archived.is_(False), {"archived": True}, "archived"
+    )
+    return {"affected": affected}
+
+
+@router.patch("/bulk/unarchive", response_model=BulkUpdateResult)
+async def bulk_unarchive_blockers(
+    selection: BlockerBulkSelection,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user)
+):
+    """Unarchive the blockers selected by ids or filter."""
+    affected = await _bulk_update_blockers(
+        db, selection, Blocker.archived.is_(True), {"archived": False}, "unarchived"
+    )
+    return {"affected": affected}
+
+
+@router.patch("/bulk/resolve", response_model=BulkUpdateResult)
+async def bulk_resolve_blockers(
+    resolve_data: BlockerBulkResolve,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user)
+):
+    """Resolve the blockers selected by ids or filter; resolved blockers are skipped."""
+    values = {
+        "status": "resolved",
+        "resolved_at": func.coalesce(Blocker.resolved_at, datetime.now(timezone.utc))
+    }
+    if resolve_data.resolution_notes:
+        values["resolution_notes"] = resolve_data.resolution_notes
+    
+    affected = await _bulk_update_blockers(
+        db, resolve_data, Blocker.status != "resolved", values, "resolved"
+    )
+    return {"affected": affected}
+
+
+def _blocker_filters(status_filter: Optional[str], archived: Optional[bool]) -> List[Any]:
+    """WHERE clauses for the list and export filters."""
+    # Filter by archived status (default to False if not specified)
+    criteria = [Blocker.archived == archived]
+    
+    if status_filter:
+        criteria.append(Blocker.status == status_filter)
+    
+    return criteria
+
+
 @router.get("", response_model=BlockerList)
 async def get_blockers(
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=100),
     status_filter: Optional[str] = Query(None, alias="status"),
     archived: Optional[bool] = Query(False),
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    cursor: Optional[str] = Query(None, description="Opaque next_cursor from a previous page; overrides page"),
+    count: CountStrategy = Query("exact", description="How to compute total: exact, estimated, cached or none"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user)
 ):
     """Get list of blockers with pagination and filtering."""
-    query = db.query(Blocker)
-    
-    # Filter by archived status (default to False if not specified)
-    query = query.filter(Blocker.archived == archived)
-    
-    # Apply filters
-    if status_filter:
-        query = query.filter(Blocker.status == status_filter)
+    query = select(Blocker).where(*_blocker_filters(status_filter, archived))
     
     # Get total count
-    total = query.count()
-    
-    # Get all blockers first (we'll sort in Python for status priority)
-    all_blockers = query.order_by(desc(Blocker.created_at)).all()
-    
-    # Sort: active first, then resolved, both by newest first
-    all_blockers.sort(key=lambda x: (x.status != "active", x.created_at), reverse=True)
+    total = await count_total(db, query, count)
     
-    # Apply pagination
-    blockers = all_blockers[(page - 1) * limit:page * limit]
-    
-    # Load relationships
-    for blocker in blockers:
-        db.refresh(blocker, ["reported_by"])
+    # Apply ordering and pagination (keyset when a cursor is given)
+    query = apply_pagination(query, _blocker_sort_key, page, limit, cursor)
+    result = await db.execute(query.options(*_blocker_load_options))
+    blockers, next_cursor = split_page(result.scalars().all(), _blocker_sort_key, limit)
     
     return {
         "items": blockers,
         "total": total,
         "page": page,
-        "limit": limit
+        "limit": limit,
+        "next_cursor": next_cursor,
+        "has_more": next_cursor is not None
     }
 
 
+@router.get("/export")
+async def export_blockers(
+    export_format: ExportFormat = Query("ndjson", alias="format", description="ndjson or csv"),
+    status_filter: Optional[str] = Query(None, alias="status"),
+    archived: Optional[bool] = Query(False),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user)
+):
+    """Stream every blocker matching the list filters, in id order."""
+    query = (
+        select(*_blocker_export_columns)
+        .where(*_blocker_filters(status_filter, archived))
+        .order_by(Blocker.id)
+    )
+    return await export_response(db, query, export_format, "blockers")
+
+
 @router.get("/{blocker_id}", response_model=BlockerSchema)
 async def get_blocker(
     blocker_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user)
 ):
     """Get a single blocker by ID."""
-    blocker = db.query(Blocker).filter(Blocker.id == blocker_id).first()
+    blocker = await db.get(Blocker, blocker_id, options=_blocker_load_options)
     
     if not blocker:
         raise HTTPException(
@@ -121,8 +311,6 @@ async def get_blocker(
             detail="Blocker not found"
         )
     
-    db.refresh(blocker, ["reported_by"])
-    
     return blocker
 
 
@@ -130,11 +318,11 @@ async def get_blocker(
 async def update_blocker(
     blocker_id: int,
     blocker_data: BlockerUpdate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user)
 ):
     """Update a blocker."""
-    blocker = db.query(Blocker).filter(Blocker.id == blocker_id).first()
+    blocker = await db.get(Blocker, blocker_id)
     
     if not blocker:
         raise HTTPException(
@@ -145,7 +333,7 @@ async def update_blocker(
     # Validate related_status_id if provided
     if blocker_data.related_status_id is not None:
         if blocker_data.related_status_id:
-            status_update = db.query(StatusUpdate).filter(StatusUpdate.id == blocker_data.related_status_id).first()
+            status_update = await db.get(StatusUpdate, blocker_data.related_status_id)
             if not status_update:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
@@ -155,7 +343,7 @@ async def update_blocker(
     # Validate related_incident_id if provided
     if blocker_data.related_incident_id is not None:
         if blocker_data.related_incident_id:
-            incident = db.query(Incident).filter(Incident.id == blocker_data.related_incident_id).first()
+            incident = await db.get(Incident, blocker_data.related_incident_id)
             if not incident:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
@@ -167,9 +355,12 @@ async def update_blocker(
     for field, value in update_data.items():
         setattr(blocker, field, value)
     
-    db.commit()
-    db.refresh(blocker)
-    db.refresh(blocker, ["reported_by"])
+    await record_summary_change(db, "blocker", blocker)
+    await record_change(db, "blockers", "updated", blocker.id)
+    await db.commit()
+    await invalidate("blockers")
+    await db.refresh(blocker)
+    await db.refresh(blocker, ["reported_by"])
     
     return blocker
 
@@ -178,11 +369,11 @@ async def update_blocker(
 async def resolve_blocker(
     blocker_id: int,
     resolve_data: BlockerResolve,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user)
 ):
     """Resolve a blocker."""
-    blocker = db.query(Blocker).filter(Blocker.id == blocker_id).first()
+    blocker = await db.get(Blocker, blocker_id)
     
     if not blocker:
         raise HTTPException(
@@ -199,9 +390,12 @@ async def resolve_blocker(
     if not blocker.resolved_at:
         blocker.resolved_at = datetime.now(timezone.utc)
     
-    db.commit()
-    db.refresh(blocker)
-    db.refresh(blocker, ["reported_by"])
+    await record_summary_change(db, "blocker", blocker)
+    await record_change(db, "blockers", "resolved", blocker.id)
+    await db.commit()
+    await invalidate("blockers")
+    await db.refresh(blocker)
+    await db.refresh(blocker, ["reported_by"])
     
     return blocker
 
@@ -209,11 +403,11 @@ async def resolve_blocker(
 @router.patch("/{blocker_id}/reopen", response_model=BlockerSchema)
 async def reopen_blocker(
     blocker_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user)
 ):
     """Reopen a resolved blocker (change status from resolved to active)."""
-    blocker = db.query(Blocker).filter(Blocker.id == blocker_id).first()
+    blocker = await db.get(Blocker, blocker_id)
     
     if not blocker:
         raise HTTPException(
@@ -238,9 +432,12 @@ async def reopen_blocker(
     # Clear resolved_at timestamp
     blocker.resolved_at = None
     
-    db.commit()
-    db.refresh(blocker)
-    db.refresh(blocker, ["reported_by"])
+    await record_summary_change(db, "blocker", blocker)
+    await record_change(db, "blockers", "reopened", blocker.id)
+    await db.commit()
+    await invalidate("blockers")
+    await db.refresh(blocker)
+    await db.refresh(blocker, ["reported_by"])
     
     return blocker
 
@@ -248,11 +445,11 @@ async def reopen_blocker(
 @router.patch("/{blocker_id}/archive", response_model=BlockerSchema)
 async def archive_blocker(
     blocker_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user)
 ):
     """Archive a blocker."""
-    blocker = db.query(Blocker).filter(Blocker.id == blocker_id).first()
+    blocker = await db.get(Blocker, blocker_id)
     
     if not blocker:
         raise HTTPException(
@@ -261,9 +458,12 @@ async def archive_blocker(
         )
     
     blocker.archived = True
-    db.commit()
-    db.refresh(blocker)
-    db.refresh(blocker, ["reported_by"])
+    await record_summary_change(db, "blocker", blocker)
+    await record_change(db, "blockers", "archived", blocker.id)
+    await db.commit()
+    await invalidate("blockers")
+    await db.refresh(blocker)
+    await db.refresh(blocker, ["reported_by"])
     
     return blocker
 
@@ -271,11 +471,11 @@ async def archive_blocker(
 @router.patch("/{blocker_id}/unarchive", response_model=BlockerSchema)
 async def unarchive_blocker(
     blocker_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user)
 ):
     """Unarchive a blocker."""
-    blocker = db.query(Blocker).filter(Blocker.id == blocker_id).first()
+    blocker = await db.get(Blocker, blocker_id)
     
     if not blocker:
         raise HTTPException(
@@ -284,9 +484,12 @@ async def unarchive_blocker(
         )
     
     blocker.archived = False
-    db.commit()
-    db.refresh(blocker)
-    db.refresh(blocker, ["reported_by"])
+    await record_summary_change(db, "blocker", blocker)
+    await record_change(db, "blockers", "unarchived", blocker.id)
+    await db.commit()
+    await invalidate("blockers")
+    await db.refresh(blocker)
+    await db.refresh(blocker, ["reported_by"])
     
     return blocker
 
@@ -294,11 +497,11 @@ async def unarchive_blocker(
 @router.delete("/{blocker_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_blocker(
     blocker_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_admin)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_active_admin)
 ):
     """Permanently delete an archived blocker (admin only)."""
-    blocker = db.query(Blocker).filter(Blocker.id == blocker_id).first()
+    blocker = await db.get(Blocker, blocker_id)
     
     if not blocker:
         raise HTTPException(
@@ -312,7 +515,9 @@ async def delete_blocker(
             detail="Can only delete archived blockers"
         )
     
-    db.delete(blocker)
-    db.commit()
+    await db.delete(blocker)
+    await record_change(db, "blockers", "deleted", blocker.id)
+    await db.commit()
+    await invalidate("blockers")
     
     return None
@@ -0,0 +1,72 @@
+from datetime import datetime, timezone
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy import and_, desc, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
+from app.core.dependencies import CurrentUser, get_async_db, get_current_user
+from app.core.response_cache import cached_response
+from app.db.models.blocker import Blocker
+from app.db.models.decision import Decision, DecisionParticipant
+from app.db.models.incident import Incident
+from app.db.models.status_update import StatusUpdate
+from app.schemas.dashboard import Dashboard
+from app.services.summary_service import ACTIVE_INCIDENT_STATUSES
+
+router = APIRouter()
+
+_severities = ("critical", "high", "medium", "low")
+
+
+@router.get("", response_model=Dashboard)
+@cached_response(Dashboard, "incidents", "blockers", "status_updates", "decisions", "users")
+async def get_dashboard(
+    limit: int = Query(5, ge=1, le=20, description="Recent status updates and decisions to include"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user)
+):
+    """Get open incident and active blocker counts with recent status updates and decisions."""
+    open_incident = and_(Incident.status.in_(ACTIVE_INCIDENT_STATUSES), Incident.archived.is_(False))
+
+    # Every count in one round trip; severities share one aggregate (COUNT ... FILTER)
+    incident_counts = select(
+        func.count(Incident.id).label("total"),
+        *[func.count(Incident.id).filter(Incident.severity == severity).label(severity) for severity in _severities],
+    ).where(open_incident).subquery()
+    active_blockers = (
+        select(func.count(Blocker.id))
+        .where(Blocker.status == "active", Blocker.archived.is_(False))
+        .scalar_subquery()
+    )
+    counts = (
+        await db.execute(select(incident_counts, active_blockers.label("active_blockers")))
+    ).one()
+
+    status_updates = (
+        await db.execute(
+            select(StatusUpdate)
+            .options(joinedload(StatusUpdate.user))
+            .order_by(desc(StatusUpdate.created_at), desc(StatusUpdate.id))
+            .limit(limit)
+        )
+    ).scalars().all()
+
+    decisions = (
+        await db.execute(
+            select(Decision)
+            .options(
+                joinedload(Decision.created_by),
+                selectinload(Decision.participants).joinedload(DecisionParticipant.user),
+            )
+            .order_by(desc(Decision.decision_date), desc(Decision.id))
+            .limit(limit)
+        )
+    ).scalars().all()
+
+    return {
+        "open_incidents": counts.total,
+        "open_incidents_by_severity": {severity: getattr(counts, severity) for severity in _severities},
+        "active_blockers": counts.active_blockers,
+        "recent_status_updates": status_updates,
+        "recent_decisions": decisions,
+        "generated_at": datetime.now(timezone.utc),
+    }
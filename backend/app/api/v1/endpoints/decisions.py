@@ -1,26 +1,64 @@
-from typing import Optional, List
+from typing import Any, Optional, List, Tuple
 from datetime import date
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import desc, and_, or_, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy import desc, and_, or_, func, select, delete, insert
 from sqlalchemy.dialects.postgresql import array
-from app.core.dependencies import get_db, get_current_user, get_current_active_admin
+from app.core.response_cache import cached_response, invalidate
+from app.core.bulk import existing_ids, insert_returning, item_error, raise_item_errors
+from app.core.export import ExportFormat, export_response
+from app.core.dependencies import CurrentUser, get_async_db, get_current_user, get_current_active_admin
+from app.core.pagination import CountStrategy, apply_pagination, count_total, order_by_keys, split_page
+from app.core.search import build_tsquery, ilike_contains, matches, rank, supports_text_search
+from app.core.tags import TagMatch, tag_filter
 from app.db.models.user import User
 from app.db.models.decision import Decision, DecisionParticipant, DecisionAuditLog
+from app.schemas.bulk import BulkCreateResult
 from app.schemas.decision import (
     DecisionCreate,
+    DecisionBulkCreate,
     DecisionUpdate,
     Decision as DecisionSchema,
     DecisionList,
     DecisionAuditLogEntry,
     DecisionAuditLogResponse
 )
+from app.services.change_feed import record_change, record_changes
+from app.services.summary_service import record_summary_change, record_summary_changes
 
 router = APIRouter()
 
+# Relationships serialized by DecisionSchema: the creator is joined, participants and
+# their users arrive in one extra SELECT ... IN query for the whole page
+_decision_load_options = (
+    joinedload(Decision.created_by),
+    selectinload(Decision.participants).joinedload(DecisionParticipant.user),
+)
+
+# List ordering: decision_date DESC (newest first)
+_decision_sort_key = (
+    (Decision.decision_date, True),
+    (Decision.id, True),
+)
+
+# Columns written by the export endpoint, in output order
+_decision_export_columns = (
+    Decision.id,
+    Decision.title,
+    Decision.description,
+    Decision.context,
+    Decision.outcome,
+    Decision.decision_date,
+    Decision.tags,
+    Decision.created_by_id,
+    Decision.created_at,
+    Decision.updated_at,
+)
+
 
-def _log_audit_entry(
-    db: Session,
+async def _log_audit_entry(
+    db: AsyncSession,
     decision_id: int,
     changed_by_id: int,
     change_type: str,
@@ -38,7 +76,7 @@ def _log_audit_entry(
         new_value=new_value
     )
     db.add(audit_entry)
-    db.flush()
+    await db.flush()
 
 
 @router.post(
@@ -50,14 +88,16 @@ def _log_audit_entry(
 )
 async def create_decision(
     decision_data: DecisionCreate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user)
 ):
     """Create a new decision with participants."""
     # Validate participant IDs if provided
     participant_ids = decision_data.participant_ids or []
     if participant_ids:
-        participant_users = db.query(User).filter(User.id.in_(participant_ids)).all()
+        participant_users = (
+            await db.execute(select(User).where(User.id.in_(participant_ids)))
+        ).scalars().all()
         if len(participant_users) != len(participant_ids):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -76,7 +116,7 @@ async def create_decision(
     )
     
     db.add(new_decision)
-    db.flush()  # Flush to get the ID
+    await db.flush()  # Flush to get the ID
     
     # Create participants
     for user_id in participant_ids:
@@ -87,25 +127,129 @@ async def create_decision(
         db.add(participant)
     
     # Log creation in audit trail
-    _log_audit_entry(
+    await _log_audit_entry(
         db=db,
         decision_id=new_decision.id,
         changed_by_id=current_user.id,
         change_type="created"
     )
     
-    db.commit()
-    db.refresh(new_decision)
+    await record_summary_change(db, "decision", new_decision)
+    await record_change(db, "decisions", "created", new_decision.id)
+    await db.commit()
+    await invalidate("decisions")
+    
+    # Reload with relationships
+    return await db.get(
+        Decision, new_decision.id, options=_decision_load_options, populate_existing=True
+    )
+
+
+@router.post(
+    "/bulk",
+    response_model=BulkCreateResult,
+    status_code=status.HTTP_201_CREATED,
+    operation_id="bulk_create_decisions",
+    summary="Create many decisions"
+)
+async def bulk_create_decisions(
+    bulk_data: DecisionBulkCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user)
+):
+    """Create many decisions with participants in one transaction; nothing is created if any item is invalid."""
+    items = bulk_data.items
+    # Repeated ids within an item would violate the participant unique constraint
+    participant_ids = [list(dict.fromkeys(item.participant_ids or [])) for item in items]
+    
+    # Validate every participant with one query
+    known_users = await existing_ids(db, User.id, (user_id for ids in participant_ids for user_id in ids))
+    raise_item_errors([
+        item_error(index, "participant_ids", "One or more participant users not found")
+        for index, ids in enumerate(participant_ids)
+        if not known_users.issuperset(ids)
+    ])
+    
+    new_decisions = await insert_returning(db, Decision, [
+        {
+            "created_by_id": current_user.id,
+            "title": item.title,
+            "description": item.description,
+            "context": item.context,
+            "outcome": item.outcome,
+            "decision_date": item.decision_date,
+            "tags": item.tags
+        }
+        for item in items
+    ])
+    ids = [new_decision.id for new_decision in new_decisions]
+    
+    # Participants and the "created" audit entries, one multi-row INSERT each
+    participant_rows = [
+        {"decision_id": decision_id, "user_id": user_id}
+        for decision_id, user_ids in zip(ids, participant_ids)
+        for user_id in user_ids
+    ]
+    if participant_rows:
+        await db.execute(insert(DecisionParticipant), participant_rows)
+    await db.execute(insert(DecisionAuditLog), [
+        {"decision_id": decision_id, "changed_by_id": current_user.id, "change_type": "created"}
+        for decision_id in ids
+    ])
+    
+    await record_summary_changes(db, "decision", new_decisions)
+    await record_changes(db, "decisions", "created", ids)
+    await db.commit()
+    await invalidate("decisions")
+    
+    return {"created": len(ids), "ids": ids}
+
+
+def _decision_filters(
+    db: AsyncSession,
+    start_date: Optional[date],
+    end_date: Optional[date],
+    participant_id: Optional[int],
+    tag: Optional[str],
+    tags: Optional[List[str]],
+    tag_match: TagMatch,
+    search: Optional[str]
+) -> Tuple[List[Any], Optional[Any]]:
+    """WHERE clauses for the list and export filters, and the search relevance if ranked."""
+    criteria = []
+    
+    if start_date:
+        criteria.append(Decision.decision_date >= start_date)
     
-    # Load relationships
-    db.refresh(new_decision, ["created_by", "participants"])
-    for participant in new_decision.participants:
-        db.refresh(participant, ["user"])
+    if end_date:
+        criteria.append(Decision.decision_date <= end_date)
     
-    return new_decision
+    if participant_id:
+        # EXISTS rather than JOIN + DISTINCT, so relevance ordering stays valid
+        criteria.append(Decision.participants.any(DecisionParticipant.user_id == participant_id))
+    
+    # The single tag parameter combines with tags like any other listed tag
+    tags = (tags or []) + ([tag] if tag else [])
+    if tags:
+        criteria.append(tag_filter(db, Decision.tags, tags, tag_match))
+    
+    ranking = None
+    if search and supports_text_search(db):
+        # GIN-indexed full-text match over title, description, context and outcome
+        tsquery = build_tsquery(search)
+        criteria.append(matches(Decision.search_vector, tsquery))
+        ranking = rank(Decision.search_vector, tsquery)
+    elif search:
+        criteria.append(or_(
+            ilike_contains(Decision.title, search),
+            ilike_contains(Decision.description, search)
+        ))
+    
+    return criteria, ranking
 
 
 @router.get("", response_model=DecisionList)
+@cached_response(DecisionList, "decisions", "users")
 async def get_decisions(
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=100),
@@ -113,67 +257,80 @@ async def get_decisions(
     end_date: Optional[date] = Query(None),
     participant_id: Optional[int] = Query(None),
     tag: Optional[str] = Query(None),
+    tags: Optional[List[str]] = Query(None, description="Filter by tags (repeat the parameter for several)"),
+    tag_match: TagMatch = Query("all", description="Match items with all of the tags, or any of them"),
     search: Optional[str] = Query(None),
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    cursor: Optional[str] = Query(None, description="Opaque next_cursor from a previous page; overrides page"),
+    count: CountStrategy = Query("exact", description="How to compute total: exact, estimated, cached or none"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user)
 ):
     """Get list of decisions with filtering and search."""
-    query = db.query(Decision)
-    
-    # Apply filters
-    if start_date:
-        query = query.filter(Decision.decision_date >= start_date)
-    
-    if end_date:
-        query = query.filter(Decision.decision_date <= end_date)
-    
-    if participant_id:
-        query = query.join(DecisionParticipant).filter(
-            DecisionParticipant.user_id == participant_id
-        ).distinct()
-    
-    if tag:
-        query = query.filter(Decision.tags.contains([tag]))
-    
-    if search:
-        # Full-text search on title and description
-        search_filter = or_(
-            Decision.title.ilike(f"%{search}%"),
-            Decision.description.ilike(f"%{search}%")
-        )
-        query = query.filter(search_filter)
+    criteria, ranking = _decision_filters(
+        db, start_date, end_date, participant_id, tag, tags, tag_match, search
+    )
+    query = select(Decision).where(*criteria)
     
     # Get total count
-    total = query.count()
-    
-    # Apply ordering: decision_date DESC (newest first)
-    query = query.order_by(desc(Decision.decision_date))
-    
-    # Apply pagination
-    decisions = query.offset((page - 1) * limit).limit(limit).all()
-    
-    # Load relationships
-    for decision in decisions:
-        db.refresh(decision, ["created_by", "participants"])
-        for participant in decision.participants:
-            db.refresh(participant, ["user"])
+    total = await count_total(db, query, count)
+    
+    if ranking is not None and not cursor:
+        # Most relevant first; ranks aren't a keyset, so these pages are offset-only
+        query = (
+            query.order_by(desc(ranking), *order_by_keys(_decision_sort_key))
+            .offset((page - 1) * limit)
+            .limit(limit + 1)
+        )
+        result = await db.execute(query.options(*_decision_load_options))
+        rows = result.scalars().all()
+        decisions, next_cursor = list(rows[:limit]), None
+        has_more = len(rows) > limit
+    else:
+        # Apply ordering and pagination (keyset when a cursor is given)
+        query = apply_pagination(query, _decision_sort_key, page, limit, cursor)
+        result = await db.execute(query.options(*_decision_load_options))
+        decisions, next_cursor = split_page(result.scalars().all(), _decision_sort_key, limit)
+        has_more = next_cursor is not None
     
     return {
         "items": decisions,
         "total": total,
         "page": page,
-        "limit": limit
+        "limit": limit,
+        "next_cursor": next_cursor,
+        "has_more": has_more
     }
 
 
+@router.get("/export", operation_id="export_decisions", summary="Export decisions")
+async def export_decisions(
+    export_format: ExportFormat = Query("ndjson", alias="format", description="ndjson or csv"),
+    start_date: Optional[date] = Query(None),
+    end_date: Optional[date] = Query(None),
+    participant_id: Optional[int] = Query(None),
+    tag: Optional[str] = Query(None),
+    tags: Optional[List[str]] = Query(None, description="Filter by tags (repeat the parameter for several)"),
+    tag_match: TagMatch = Query("all", description="Match items with all of the tags, or any of them"),
+    search: Optional[str] = Query(None),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user)
+):
+    """Stream every decision matching the list filters, in id order (search filters but doesn't rank)."""
+    criteria, _ = _decision_filters(
+        db, start_date, end_date, participant_id, tag, tags, tag_match, search
+    )
+    query = select(*_decision_export_columns).where(*criteria).order_by(Decision.id)
+    return await export_response(db, query, export_format, "decisions")
+
+
 @router.get("/{decision_id}", response_model=DecisionSchema)
 async def get_decision(
     decision_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user)
 ):
     """Get a single decision by ID."""
-    decision = db.query(Decision).filter(Decision.id == decision_id).first()
+    decision = await db.get(Decision, decision_id, options=_decision_load_options)
     
     if not decision:
         raise HTTPException(
@@ -181,10 +338,6 @@ async def get_decision(
             detail="Decision not found"
         )
     
-    db.refresh(decision, ["created_by", "participants"])
-    for participant in decision.participants:
-        db.refresh(participant, ["user"])
-    
     return decision
 
 
@@ -197,11 +350,11 @@ async def get_decision(
 async def update_decision(
     decision_id: int,
     decision_data: DecisionUpdate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user)
 ):
     """Update a decision. Only creator or admin can update."""
-    decision = db.query(Decision).filter(Decision.id == decision_id).first()
+    decision = await db.get(Decision, decision_id)
     
     if not decision:
         raise HTTPException(
@@ -220,7 +373,9 @@ async def update_decision(
     if decision_data.participant_ids is not None:
         participant_ids = decision_data.participant_ids
         if participant_ids:
-            participant_users = db.query(User).filter(User.id.in_(participant_ids)).all()
+            participant_users = (
+                await db.execute(select(User).where(User.id.in_(participant_ids)))
+            ).scalars().all()
             if len(participant_users) != len(participant_ids):
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
@@ -238,7 +393,7 @@ async def update_decision(
             # Convert to string for storage
             old_str = str(old_value) if old_value is not None else None
             new_str = str(new_value) if new_value is not None else None
-            _log_audit_entry(
+            await _log_audit_entry(
                 db=db,
                 decision_id=decision.id,
                 changed_by_id=current_user.id,
@@ -252,9 +407,11 @@ async def update_decision(
     # Update participants if provided
     if participant_ids_to_update is not None:
         # Remove existing participants
-        db.query(DecisionParticipant).filter(
-            DecisionParticipant.decision_id == decision.id
-        ).delete()
+        await db.execute(
+            delete(DecisionParticipant).where(
+                DecisionParticipant.decision_id == decision.id
+            )
+        )
         
         # Add new participants
         for user_id in participant_ids_to_update:
@@ -265,7 +422,7 @@ async def update_decision(
             db.add(participant)
         
         # Log participant change
-        _log_audit_entry(
+        await _log_audit_entry(
             db=db,
             decision_id=decision.id,
             changed_by_id=current_user.id,
@@ -275,13 +432,15 @@ async def update_decision(
             new_value=str(participant_ids_to_update)
         )
     
-    db.commit()
-    db.refresh(decision)
-    db.refresh(decision, ["created_by", "participants"])
-    for participant in decision.participants:
-        db.refresh(participant, ["user"])
+    await record_summary_change(db, "decision", decision)
+    await record_change(db, "decisions", "updated", decision.id)
+    await db.commit()
+    await invalidate("decisions")
     
-    return decision
+    # Reload with relationships (participants may have been replaced)
+    return await db.get(
+        Decision, decision.id, options=_decision_load_options, populate_existing=True
+    )
 
 
 @router.delete(
@@ -292,11 +451,11 @@ async def update_decision(
 )
 async def delete_decision(
     decision_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user)
 ):
     """Delete a decision. Only creator or admin can delete."""
-    decision = db.query(Decision).filter(Decision.id == decision_id).first()
+    decision = await db.get(Decision, decision_id)
     
     if not decision:
         raise HTTPException(
@@ -312,7 +471,7 @@ async def delete_decision(
         )
     
     # Log deletion in audit trail
-    _log_audit_entry(
+    await _log_audit_entry(
         db=db,
         decision_id=decision.id,
         changed_by_id=current_user.id,
@@ -320,8 +479,11 @@ async def delete_decision(
     )
     
     # Delete the decision (cascade will handle participants and audit logs)
-    db.delete(decision)
-    db.commit()
+    await record_summary_change(db, "decision", decision)
+    await db.delete(decision)
+    await record_change(db, "decisions", "deleted", decision.id)
+    await db.commit()
+    await invalidate("decisions")
     
     return None
 
@@ -334,11 +496,11 @@ async def delete_decision(
 )
 async def get_decision_audit(
     decision_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user)
 ):
     """Get the audit trail for a decision."""
-    decision = db.query(Decision).filter(Decision.id == decision_id).first()
+    decision = await db.get(Decision, decision_id)
     
     if not decision:
         raise HTTPException(
@@ -347,13 +509,13 @@ async def get_decision_audit(
         )
     
     # Get audit log entries
-    audit_entries = db.query(DecisionAuditLog).filter(
-        DecisionAuditLog.decision_id == decision_id
-    ).order_by(desc(DecisionAuditLog.changed_at)).all()
-    
-    # Load relationships
-    for entry in audit_entries:
-        db.refresh(entry, ["changed_by"])
+    result = await db.execute(
+        select(DecisionAuditLog)
+        .options(joinedload(DecisionAuditLog.changed_by))
+        .where(DecisionAuditLog.decision_id == decision_id)
+        .order_by(desc(DecisionAuditLog.changed_at))
+    )
+    audit_entries = result.scalars().all()
     
     return {
         "items": audit_entries
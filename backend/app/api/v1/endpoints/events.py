@@ -0,0 +1,125 @@
+import asyncio
+import json
+from typing import Any, Dict, Optional, Sequence
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.core.dependencies import CurrentUser, authenticate_token, get_async_db, get_current_user
+from app.db.models.outbox_event import OutboxEvent
+from app.schemas.user import EventStreamTicket
+from app.services.change_feed import change_feed
+from app.services.token_service import EVENTS_TICKET_PURPOSE, create_events_ticket
+
+router = APIRouter()
+
+# EventSource can't send headers, so browsers connect with a ticket in the URL instead
+_optional_bearer = OAuth2PasswordBearer(tokenUrl="/api/auth/login", auto_error=False)
+
+
+def _format_change(change: Dict[str, Any]) -> str:
+    return f"id: {change['position']}\nevent: change\ndata: {json.dumps(change)}\n\n"
+
+
+async def _event_stream(request: Request, queue: asyncio.Queue, missed: Sequence[Dict[str, Any]] = (), reset: bool = False):
+    try:
+        # Tell EventSource how long to wait before reconnecting
+        yield f"retry: {settings.EVENTS_RECONNECT_SECONDS * 1000}\n\n"
+        if reset:
+            # Too much was missed to replay; the client should reload what it shows
+            yield "event: reset\ndata: {}\n\n"
+        last_position = 0
+        for change in missed:
+            yield _format_change(change)
+            last_position = change["position"]
+        while not await request.is_disconnected():
+            try:
+                change = await asyncio.wait_for(queue.get(), timeout=settings.EVENTS_HEARTBEAT_SECONDS)
+            except asyncio.TimeoutError:
+                # Comment line: keeps proxies from closing an idle stream
+                yield ": keepalive\n\n"
+                continue
+            if change is None:
+                break
+            # Subscribed before the replay query, so the first live events may repeat it. Positions
+            # are assigned in commit order and announced in that order, so nothing newer is skipped.
+            if change["position"] <= last_position:
+                continue
+            yield _format_change(change)
+    finally:
+        change_feed.unsubscribe(queue)
+
+
+async def _missed_changes(db: AsyncSession, last_position: int):
+    """Outbox events positioned after ``last_position``, in commit order, and whether more were left out."""
+    events = (
+        await db.execute(
+            select(OutboxEvent)
+            .where(OutboxEvent.position > last_position)
+            .order_by(OutboxEvent.position)
+            .limit(settings.OUTBOX_REPLAY_LIMIT + 1)
+        )
+    ).scalars().all()
+    if len(events) > settings.OUTBOX_REPLAY_LIMIT:
+        return [], True
+    return [
+        {
+            "event_id": event.id,
+            "position": event.position,
+            "collection": event.collection,
+            "action": event.action,
+            "id": event.entity_id,
+        }
+        for event in events
+    ], False
+
+
+@router.post("/ticket", response_model=EventStreamTicket)
+async def create_stream_ticket(current_user: CurrentUser = Depends(get_current_user)):
+    """Issue a short-lived ticket for opening an event stream from a browser."""
+    return create_events_ticket(current_user.id)
+
+
+@router.get("")
+async def stream_events(
+    request: Request,
+    ticket: Optional[str] = Query(None, description="Ticket from POST /api/events/ticket, for clients that can't set headers"),
+    after: Optional[int] = Query(None, description="Resume after this event position, when opening a new connection"),
+    last_event_id: Optional[int] = Header(
+        None, alias="Last-Event-ID", description="Resume after this event position (sent by EventSource on reconnect)"
+    ),
+    bearer_token: Optional[str] = Depends(_optional_bearer),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Stream committed status update, incident, blocker and decision changes as Server-Sent Events."""
+    if bearer_token:
+        await authenticate_token(bearer_token, db)
+    elif ticket:
+        await authenticate_token(ticket, db, purpose=EVENTS_TICKET_PURPOSE)
+    else:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    if last_event_id is None:
+        last_event_id = after
+
+    queue = change_feed.subscribe()
+    missed, reset = [], False
+    if last_event_id is not None:
+        try:
+            missed, reset = await _missed_changes(db, last_event_id)
+        except Exception:
+            change_feed.unsubscribe(queue)
+            raise
+    # Return the connection to the pool; the live stream needs no database access
+    await db.close()
+
+    return StreamingResponse(
+        _event_stream(request, queue, missed, reset),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
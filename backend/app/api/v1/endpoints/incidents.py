@@ -1,22 +1,63 @@
-from typing import Optional
+from typing import Any, Dict, List, Optional
 from datetime import datetime, timezone
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import desc, and_, or_
-from app.core.dependencies import get_db, get_current_user, get_current_active_admin
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+from sqlalchemy import and_, select, func
+from app.core.response_cache import cached_response, invalidate
+from app.core.bulk import existing_ids, insert_returning, item_error, raise_item_errors, update_in_chunks
+from app.core.export import ExportFormat, export_response
+from app.core.dependencies import CurrentUser, get_async_db, get_current_user, get_current_active_admin
+from app.core.pagination import CountStrategy, apply_pagination, count_total, split_page
 from app.db.models.user import User
 from app.db.models.incident import Incident
+from app.schemas.bulk import BulkCreateResult, BulkUpdateResult
 from app.schemas.incident import (
     IncidentCreate,
+    IncidentBulkCreate,
+    IncidentBulkFilter,
+    IncidentBulkSelection,
+    IncidentBulkStatusUpdate,
     IncidentUpdate,
     IncidentStatusUpdate,
     IncidentAssign,
     Incident as IncidentSchema,
     IncidentList
 )
+from app.services.change_feed import record_change, record_changes
+from app.services.summary_service import record_summary_change, record_summary_changes
 
 router = APIRouter()
 
+# Relationships serialized by IncidentSchema, loaded with the rows to avoid per-row queries
+_incident_load_options = (
+    joinedload(Incident.reported_by),
+    joinedload(Incident.assigned_to),
+)
+
+# List ordering: severity (critical first), then created_at (newest first)
+_incident_sort_key = (
+    (Incident.severity_rank, False),
+    (Incident.created_at, True),
+    (Incident.id, True),
+)
+
+# Columns written by the export endpoint, in output order
+_incident_export_columns = (
+    Incident.id,
+    Incident.title,
+    Incident.description,
+    Incident.severity,
+    Incident.status,
+    Incident.resolution_notes,
+    Incident.archived,
+    Incident.reported_by_id,
+    Incident.assigned_to_id,
+    Incident.created_at,
+    Incident.updated_at,
+    Incident.resolved_at,
+)
+
 
 @router.post(
     "", 
@@ -27,13 +68,13 @@ router = APIRouter()
 )
 async def create_incident(
     incident_data: IncidentCreate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user)
 ):
     """Create a new incident. POST to /api/incidents (no ID in path)."""
     # Validate assigned_to_id if provided
     if incident_data.assigned_to_id:
-        assigned_user = db.query(User).filter(User.id == incident_data.assigned_to_id).first()
+        assigned_user = await db.get(User, incident_data.assigned_to_id)
         if not assigned_user:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -50,16 +91,193 @@ async def create_incident(
     )
     
     db.add(new_incident)
-    db.commit()
-    db.refresh(new_incident)
+    await db.flush()
+    await record_summary_change(db, "incident", new_incident)
+    await record_change(db, "incidents", "created", new_incident.id)
+    await db.commit()
+    await invalidate("incidents")
+    await db.refresh(new_incident)
     
     # Load relationships
-    db.refresh(new_incident, ["reported_by", "assigned_to"])
+    await db.refresh(new_incident, ["reported_by", "assigned_to"])
     
     return new_incident
 
 
+@router.post(
+    "/bulk",
+    response_model=BulkCreateResult,
+    status_code=status.HTTP_201_CREATED,
+    operation_id="bulk_create_incidents",
+    summary="Create many incidents"
+)
+async def bulk_create_incidents(
+    bulk_data: IncidentBulkCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user)
+):
+    """Create many incidents in one transaction; nothing is created if any item is invalid."""
+    items = bulk_data.items
+    
+    # Validate every assigned_to_id with one query
+    known_users = await existing_ids(
+        db, User.id, (item.assigned_to_id for item in items if item.assigned_to_id)
+    )
+    raise_item_errors([
+        item_error(index, "assigned_to_id", "Assigned user not found")
+        for index, item in enumerate(items)
+        if item.assigned_to_id and item.assigned_to_id not in known_users
+    ])
+    
+    new_incidents = await insert_returning(db, Incident, [
+        {
+            "reported_by_id": current_user.id,
+            "assigned_to_id": item.assigned_to_id,
+            "title": item.title,
+            "description": item.description,
+            "severity": item.severity,
+            "status": "open"
+        }
+        for item in items
+    ])
+    ids = [new_incident.id for new_incident in new_incidents]
+    
+    await record_summary_changes(db, "incident", new_incidents)
+    await record_changes(db, "incidents", "created", ids)
+    await db.commit()
+    await invalidate("incidents")
+    
+    return {"created": len(ids), "ids": ids}
+
+
+def _bulk_filter_criteria(bulk_filter: Optional[IncidentBulkFilter]) -> List[Any]:
+    """WHERE clauses for the filter of a bulk update."""
+    if bulk_filter is None:
+        return []
+    criteria = []
+    if bulk_filter.status is not None:
+        criteria.append(Incident.status.in_(bulk_filter.status))
+    if bulk_filter.severity is not None:
+        criteria.append(Incident.severity.in_(bulk_filter.severity))
+    if bulk_filter.archived is not None:
+        criteria.append(Incident.archived == bulk_filter.archived)
+    if bulk_filter.created_before is not None:
+        criteria.append(Incident.created_at < bulk_filter.created_before)
+    if bulk_filter.resolved_before is not None:
+        criteria.append(Incident.resolved_at < bulk_filter.resolved_before)
+    return criteria
+
+
+async def _bulk_update_incidents(
+    db: AsyncSession,
+    selection: IncidentBulkSelection,
+    pending: Any,
+    values: Dict[str, Any],
+    action: str
+) -> int:
+    """Apply ``values`` to the selected incidents matching ``pending`` (not yet in the target state)."""
+    async def on_chunk(incidents):
+        await record_summary_changes(db, "incident", incidents)
+        await record_changes(db, "incidents", action, [incident.id for incident in incidents])
+    
+    try:
+        return await update_in_chunks(
+            db, Incident, and_(pending, *_bulk_filter_criteria(selection.filter)), values, on_chunk,
+            ids=selection.ids
+        )
+    finally:
+        # Earlier chunks are committed even if a later one fails
+        await invalidate("incidents")
+
+
+@router.patch(
+    "/bulk/archive",
+    response_model=BulkUpdateResult,
+    operation_id="bulk_archive_incidents",
+    summary="Archive many incidents"
+)
+async def bulk_archive_incidents(
+    selection: IncidentBulkSelection,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user)
+):
+    """Archive the incidents selected by ids or filter."""
+    affected = await _bulk_update_incidents(
+        db, selection, Incident.archived.is_(False), {"archived": True}, "archived"
+    )
+    return {"affected": affected}
+
+
+@router.patch(
+    "/bulk/unarchive",
+    response_model=BulkUpdateResult,
+    operation_id="bulk_unarchive_incidents",
+    summary="Unarchive many incidents"
+)
+async def bulk_unarchive_incidents(
+    selection: IncidentBulkSelection,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user)
+):
+    """Unarchive the incidents selected by ids or filter."""
+    affected = await _bulk_update_incidents(
+        db, selection, Incident.archived.is_(True), {"archived": False}, "unarchived"
+    )
+    return {"affected": affected}
+
+
+@router.patch(
+    "/bulk/status",
+    response_model=BulkUpdateResult,
+    operation_id="bulk_update_incident_status",
+    summary="Change the status of many incidents"
+)
+async def bulk_update_incident_status(
+    status_data: IncidentBulkStatusUpdate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user)
+):
+    """Set the status of the incidents selected by ids or filter; incidents already in it are skipped."""
+    values = {"status": status_data.status}
+    if status_data.resolution_notes:
+        values["resolution_notes"] = status_data.resolution_notes
+    
+    # Same resolved_at rules as the single-incident endpoint
+    if status_data.status in ["resolved", "closed"]:
+        values["resolved_at"] = func.coalesce(Incident.resolved_at, datetime.now(timezone.utc))
+    else:
+        values["resolved_at"] = None
+    
+    affected = await _bulk_update_incidents(
+        db, status_data, Incident.status != status_data.status, values, "status_changed"
+    )
+    return {"affected": affected}
+
+
+def _incident_filters(
+    status_filter: Optional[str],
+    severity: Optional[str],
+    assigned_to_id: Optional[int],
+    archived: Optional[bool]
+) -> List[Any]:
+    """WHERE clauses for the list and export filters."""
+    # Filter by archived status (default to False if not specified)
+    criteria = [Incident.archived == archived]
+    
+    if status_filter:
+        criteria.append(Incident.status == status_filter)
+    
+    if severity:
+        criteria.append(Incident.severity == severity)
+    
+    if assigned_to_id:
+        criteria.append(Incident.assigned_to_id == assigned_to_id)
+    
+    return criteria
+
+
 @router.get("", response_model=IncidentList)
+@cached_response(IncidentList, "incidents", "users")
 async def get_incidents(
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=100),
@@ -67,58 +285,59 @@ async def get_incidents(
     severity: Optional[str] = Query(None),
     assigned_to_id: Optional[int] = Query(None),
     archived: Optional[bool] = Query(False),
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    cursor: Optional[str] = Query(None, description="Opaque next_cursor from a previous page; overrides page"),
+    count: CountStrategy = Query("exact", description="How to compute total: exact, estimated, cached or none"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user)
 ):
     """Get list of incidents with pagination and filtering."""
-    query = db.query(Incident)
-    
-    # Filter by archived status (default to False if not specified)
-    query = query.filter(Incident.archived == archived)
-    
-    # Apply filters
-    if status_filter:
-        query = query.filter(Incident.status == status_filter)
-    
-    if severity:
-        query = query.filter(Incident.severity == severity)
-    
-    if assigned_to_id:
-        query = query.filter(Incident.assigned_to_id == assigned_to_id)
+    query = select(Incident).where(*_incident_filters(status_filter, severity, assigned_to_id, archived))
     
     # Get total count
-    total = query.count()
-    
-    # Apply ordering: severity (critical first), then created_at (newest first)
-    # Map severity to numeric order for sorting
-    severity_order = {"critical": 0, "high": 1, "medium": 2, "low": 3}
+    total = await count_total(db, query, count)
     
-    incidents = query.all()
-    incidents.sort(key=lambda x: (severity_order.get(x.severity, 99), x.created_at), reverse=True)
-    
-    # Apply pagination
-    incidents = incidents[(page - 1) * limit:page * limit]
-    
-    # Load relationships
-    for incident in incidents:
-        db.refresh(incident, ["reported_by", "assigned_to"])
+    # Apply ordering and pagination (keyset when a cursor is given)
+    query = apply_pagination(query, _incident_sort_key, page, limit, cursor)
+    result = await db.execute(query.options(*_incident_load_options))
+    incidents, next_cursor = split_page(result.scalars().all(), _incident_sort_key, limit)
     
     return {
         "items": incidents,
         "total": total,
         "page": page,
-        "limit": limit
+        "limit": limit,
+        "next_cursor": next_cursor,
+        "has_more": next_cursor is not None
     }
 
 
+@router.get("/export", operation_id="export_incidents", summary="Export incidents")
+async def export_incidents(
+    export_format: ExportFormat = Query("ndjson", alias="format", description="ndjson or csv"),
+    status_filter: Optional[str] = Query(None, alias="status"),
+    severity: Optional[str] = Query(None),
+    assigned_to_id: Optional[int] = Query(None),
+    archived: Optional[bool] = Query(False),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user)
+):
+    """Stream every incident matching the list filters, in id order."""
+    query = (
+        select(*_incident_export_columns)
+        .where(*_incident_filters(status_filter, severity, assigned_to_id, archived))
+        .order_by(Incident.id)
+    )
+    return await export_response(db, query, export_format, "incidents")
+
+
 @router.get("/{incident_id}", response_model=IncidentSchema)
 async def get_incident(
     incident_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user)
 ):
     """Get a single incident by ID."""
-    incident = db.query(Incident).filter(Incident.id == incident_id).first()
+    incident = await db.get(Incident, incident_id, options=_incident_load_options)
     
     if not incident:
         raise HTTPException(
@@ -126,8 +345,6 @@ async def get_incident(
             detail="Incident not found"
         )
     
-    db.refresh(incident, ["reported_by", "assigned_to"])
-    
     return incident
 
 
@@ -140,11 +357,11 @@ async def get_incident(
 async def update_incident(
     incident_id: int,
     incident_data: IncidentUpdate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user)
 ):
     """Update an incident by ID. Use PATCH method to /api/incidents/{incident_id}, not POST."""
-    incident = db.query(Incident).filter(Incident.id == incident_id).first()
+    incident = await db.get(Incident, incident_id)
     
     if not incident:
         raise HTTPException(
@@ -155,7 +372,7 @@ async def update_incident(
     # Validate assigned_to_id if provided
     if incident_data.assigned_to_id is not None:
         if incident_data.assigned_to_id:
-            assigned_user = db.query(User).filter(User.id == incident_data.assigned_to_id).first()
+            assigned_user = await db.get(User, incident_data.assigned_to_id)
             if not assigned_user:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
@@ -167,9 +384,12 @@ async def update_incident(
     for field, value in update_data.items():
         setattr(incident, field, value)
     
-    db.commit()
-    db.refresh(incident)
-    db.refresh(incident, ["reported_by", "assigned_to"])
+    await record_summary_change(db, "incident", incident)
+    await record_change(db, "incidents", "updated", incident.id)
+    await db.commit()
+    await invalidate("incidents")
+    await db.refresh(incident)
+    await db.refresh(incident, ["reported_by", "assigned_to"])
     
     return incident
 
@@ -178,11 +398,11 @@ async def update_incident(
 async def update_incident_status(
     incident_id: int,
     status_data: IncidentStatusUpdate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user)
 ):
     """Update incident status."""
-    incident = db.query(Incident).filter(Incident.id == incident_id).first()
+    incident = await db.get(Incident, incident_id)
     
     if not incident:
         raise HTTPException(
@@ -201,9 +421,12 @@ async def update_incident_status(
     elif status_data.status not in ["resolved", "closed"]:
         incident.resolved_at = None
     
-    db.commit()
-    db.refresh(incident)
-    db.refresh(incident, ["reported_by", "assigned_to"])
+    await record_summary_change(db, "incident", incident)
+    await record_change(db, "incidents", "status_changed", incident.id)
+    await db.commit()
+    await invalidate("incidents")
+    await db.refresh(incident)
+    await db.refresh(incident, ["reported_by", "assigned_to"])
     
     return incident
 
@@ -212,11 +435,11 @@ async def update_incident_status(
 async def assign_incident(
     incident_id: int,
     assign_data: IncidentAssign,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user)
 ):
     """Assign or unassign an incident to a user."""
-    incident = db.query(Incident).filter(Incident.id == incident_id).first()
+    incident = await db.get(Incident, incident_id)
     
     if not incident:
         raise HTTPException(
@@ -227,7 +450,7 @@ async def assign_incident(
     # Validate assigned_to_id if provided
     if assign_data.assigned_to_id is not None:
         if assign_data.assigned_to_id:
-            assigned_user = db.query(User).filter(User.id == assign_data.assigned_to_id).first()
+            assigned_user = await db.get(User, assign_data.assigned_to_id)
             if not assigned_user:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
@@ -235,9 +458,11 @@ async def assign_incident(
                 )
         incident.assigned_to_id = assign_data.assigned_to_id
     
-    db.commit()
-    db.refresh(incident)
-    db.refresh(incident, ["reported_by", "assigned_to"])
+    await record_change(db, "incidents", "assigned", incident.id)
+    await db.commit()
+    await invalidate("incidents")
+    await db.refresh(incident)
+    await db.refresh(incident, ["reported_by", "assigned_to"])
     
     return incident
 
@@ -245,11 +470,11 @@ async def assign_incident(
 @router.patch("/{incident_id}/archive", response_model=IncidentSchema)
 async def archive_incident(
     incident_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user)
 ):
     """Archive an incident."""
-    incident = db.query(Incident).filter(Incident.id == incident_id).first()
+    incident = await db.get(Incident, incident_id)
     
     if not incident:
         raise HTTPException(
@@ -258,9 +483,12 @@ async def archive_incident(
         )
     
     incident.archived = True
-    db.commit()
-    db.refresh(incident)
-    db.refresh(incident, ["reported_by", "assigned_to"])
+    await record_summary_change(db, "incident", incident)
+    await record_change(db, "incidents", "archived", incident.id)
+    await db.commit()
+    await invalidate("incidents")
+    await db.refresh(incident)
+    await db.refresh(incident, ["reported_by", "assigned_to"])
     
     return incident
 
@@ -268,11 +496,11 @@ async def archive_incident(
 @router.patch("/{incident_id}/unarchive", response_model=IncidentSchema)
 async def unarchive_incident(
     incident_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user)
 ):
     """Unarchive an incident."""
-    incident = db.query(Incident).filter(Incident.id == incident_id).first()
+    incident = await db.get(Incident, incident_id)
     
     if not incident:
         raise HTTPException(
@@ -281,9 +509,12 @@ async def unarchive_incident(
         )
     
     incident.archived = False
-    db.commit()
-    db.refresh(incident)
-    db.refresh(incident, ["reported_by", "assigned_to"])
+    await record_summary_change(db, "incident", incident)
+    await record_change(db, "incidents", "unarchived", incident.id)
+    await db.commit()
+    await invalidate("incidents")
+    await db.refresh(incident)
+    await db.refresh(incident, ["reported_by", "assigned_to"])
     
     return incident
 
@@ -291,11 +522,11 @@ async def unarchive_incident(
 @router.delete("/{incident_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_incident(
     incident_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_admin)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_active_admin)
 ):
     """Permanently delete an archived incident (admin only)."""
-    incident = db.query(Incident).filter(Incident.id == incident_id).first()
+    incident = await db.get(Incident, incident_id)
     
     if not incident:
         raise HTTPException(
@@ -309,7 +540,9 @@ async def delete_incident(
             detail="Can only delete archived incidents"
         )
     
-    db.delete(incident)
-    db.commit()
+    await db.delete(incident)
+    await record_change(db, "incidents", "deleted", incident.id)
+    await db.commit()
+    await invalidate("incidents")
     
     return None
@@ -0,0 +1,52 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.dependencies import CurrentUser, get_async_db, get_current_active_admin
+from app.db.models.job import Job
+from app.schemas.job import JobCreate, JobResponse
+from app.services import job_handlers  # noqa: F401  (registers the job types)
+from app.services.job_queue import enqueue_job, get_job_types
+
+router = APIRouter()
+
+
+@router.post("", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def create_job(
+    job_data: JobCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_active_admin)
+):
+    """Queue a background job (admin only)."""
+    if job_data.job_type not in get_job_types():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown job type. Available: {', '.join(sorted(get_job_types()))}"
+        )
+
+    job = enqueue_job(
+        db,
+        job_data.job_type,
+        payload=job_data.payload,
+        priority=job_data.priority,
+        run_at=job_data.run_at
+    )
+    await db.commit()
+    await db.refresh(job)
+    return job
+
+
+@router.get("/{job_id}", response_model=JobResponse)
+async def get_job(
+    job_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_active_admin)
+):
+    """Get a background job's status (admin only)."""
+    job = await db.get(Job, job_id)
+
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found"
+        )
+
+    return job
@@ -0,0 +1,99 @@
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import desc, func, literal, literal_column, or_, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.dependencies import CurrentUser, get_async_db, get_current_user
+from app.core.search import build_tsquery, ilike_contains, matches, rank, supports_text_search
+from app.db.models.blocker import Blocker
+from app.db.models.decision import Decision
+from app.db.models.incident import Incident
+from app.db.models.status_update import StatusUpdate
+from app.schemas.search import SearchResults
+
+router = APIRouter()
+
+# types parameter value -> (hit type, model, title expression, ILIKE fallback columns)
+_searchable = {
+    "status": ("status_update", StatusUpdate, StatusUpdate.title, (StatusUpdate.title, StatusUpdate.content)),
+    "incidents": ("incident", Incident, Incident.title, (Incident.title, Incident.description)),
+    "blockers": (
+        "blocker", Blocker, func.substr(Blocker.description, 1, 200), (Blocker.description, Blocker.impact)
+    ),
+    "decisions": ("decision", Decision, Decision.title, (Decision.title, Decision.description)),
+}
+
+# Archived incidents and blockers are hidden from search like they are from the default lists
+_visible = {
+    "incidents": Incident.archived.is_(False),
+    "blockers": Blocker.archived.is_(False),
+}
+
+
+def _parse_types(types: Optional[str]):
+    if not types:
+        return list(_searchable)
+    requested = [name.strip() for name in types.split(",") if name.strip()]
+    unknown = [name for name in requested if name not in _searchable]
+    if unknown or not requested:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown search types. Available: {', '.join(_searchable)}"
+        )
+    return list(dict.fromkeys(requested))
+
+
+@router.get("", response_model=SearchResults)
+async def search(
+    q: str = Query(..., min_length=1, max_length=200, description="Search query"),
+    types: Optional[str] = Query(None, description="Comma-separated: status,incidents,blockers,decisions"),
+    page: int = Query(1, ge=1),
+    limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user)
+):
+    """Search status updates, incidents, blockers and decisions together, most relevant first."""
+    full_text = supports_text_search(db)
+    tsquery = build_tsquery(q) if full_text else None
+
+    branches = []
+    for name in _parse_types(types):
+        hit_type, model, title, fallback_columns = _searchable[name]
+        if full_text:
+            # Each branch is a GIN index scan on that table's search_vector
+            condition = matches(model.search_vector, tsquery)
+            relevance = rank(model.search_vector, tsquery)
+        else:
+            condition = or_(*[ilike_contains(column, q) for column in fallback_columns])
+            relevance = literal(0.0)
+        branch = select(
+            literal_column(f"'{hit_type}'").label("type"),
+            model.id.label("id"),
+            title.label("title"),
+            model.created_at.label("created_at"),
+            relevance.label("rank"),
+        ).where(condition)
+        if name in _visible:
+            branch = branch.where(_visible[name])
+        branches.append(branch)
+
+    hits = union_all(*branches).subquery("hits")
+    # One round trip: the window count is taken over all hits before the page is cut
+    result = await db.execute(
+        select(hits, func.count().over().label("total"))
+        .order_by(desc(hits.c.rank), desc(hits.c.created_at), hits.c.type, desc(hits.c.id))
+        .offset((page - 1) * limit)
+        .limit(limit)
+    )
+    rows = result.all()
+
+    total = rows[0].total if rows else (0 if page == 1 else None)
+    return {
+        "items": [
+            {"type": row.type, "id": row.id, "title": row.title, "created_at": row.created_at, "rank": row.rank}
+            for row in rows
+        ],
+        "total": total,
+        "page": page,
+        "limit": limit,
+        "has_more": total is not None and page * limit < total,
+    }
@@ -1,26 +1,57 @@
-from typing import Optional, List
+from typing import Any, Optional, List
 from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import desc, and_
-from app.core.dependencies import get_db, get_current_user
-from app.db.models.user import User
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+from sqlalchemy import select
+from app.core.response_cache import invalidate
+from app.core.bulk import insert_returning
+from app.core.export import ExportFormat, export_response
+from app.core.dependencies import CurrentUser, get_async_db, get_current_user
+from app.core.pagination import CountStrategy, apply_pagination, count_total, split_page
+from app.core.tags import TagMatch, tag_filter
 from app.db.models.status_update import StatusUpdate
+from app.schemas.bulk import BulkCreateResult
 from app.schemas.status_update import (
     StatusUpdateCreate,
+    StatusUpdateBulkCreate,
     StatusUpdateUpdate,
     StatusUpdate as StatusUpdateSchema,
     StatusUpdateList
 )
+from app.services.change_feed import record_change, record_changes
+from app.services.summary_service import record_summary_change, record_summary_changes
 
 router = APIRouter()
 
+# Relationships serialized by StatusUpdateSchema, loaded with the rows to avoid per-row queries
+_status_update_load_options = (
+    joinedload(StatusUpdate.user),
+)
+
+# List ordering: newest first
+_status_update_sort_key = (
+    (StatusUpdate.created_at, True),
+    (StatusUpdate.id, True),
+)
+
+# Columns written by the export endpoint, in output order
+_status_update_export_columns = (
+    StatusUpdate.id,
+    StatusUpdate.title,
+    StatusUpdate.content,
+    StatusUpdate.tags,
+    StatusUpdate.user_id,
+    StatusUpdate.created_at,
+    StatusUpdate.updated_at,
+)
+
 
 @router.post("", response_model=StatusUpdateSchema, status_code=status.HTTP_201_CREATED)
 async def create_status_update(
     status_data: StatusUpdateCreate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user)
 ):
     """Create a new status update."""
     new_status = StatusUpdate(
@@ -31,15 +62,71 @@ async def create_status_update(
     )
     
     db.add(new_status)
-    db.commit()
-    db.refresh(new_status)
+    await db.flush()
+    await record_summary_change(db, "status_update", new_status)
+    await record_change(db, "status_updates", "created", new_status.id)
+    await db.commit()
+    await invalidate("status_updates")
+    await db.refresh(new_status)
     
     # Load user relationship
-    db.refresh(new_status, ["user"])
+    await db.refresh(new_status, ["user"])
     
     return new_status
 
 
+@router.post("/bulk", response_model=BulkCreateResult, status_code=status.HTTP_201_CREATED)
+async def bulk_create_status_updates(
+    bulk_data: StatusUpdateBulkCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user)
+):
+    """Create many status updates in one transaction with a multi-row INSERT."""
+    new_statuses = await insert_returning(db, StatusUpdate, [
+        {
+            "user_id": current_user.id,
+            "title": item.title,
+            "content": item.content,
+            "tags": item.tags
+        }
+        for item in bulk_data.items
+    ])
+    ids = [new_status.id for new_status in new_statuses]
+    
+    await record_summary_changes(db, "status_update", new_statuses)
+    await record_changes(db, "status_updates", "created", ids)
+    await db.commit()
+    await invalidate("status_updates")
+    
+    return {"created": len(ids), "ids": ids}
+
+
+def _status_update_filters(
+    db: AsyncSession,
+    author_id: Optional[int],
+    start_date: Optional[datetime],
+    end_date: Optional[datetime],
+    tags: Optional[List[str]],
+    tag_match: TagMatch
+) -> List[Any]:
+    """WHERE clauses for the list and export filters."""
+    criteria = []
+    
+    if author_id:
+        criteria.append(StatusUpdate.user_id == author_id)
+    
+    if start_date:
+        criteria.append(StatusUpdate.created_at >= start_date)
+    
+    if end_date:
+        criteria.append(StatusUpdate.created_at <= end_date)
+    
+    if tags:
+        criteria.append(tag_filter(db, StatusUpdate.tags, tags, tag_match))
+    
+    return criteria
+
+
 @router.get("", response_model=StatusUpdateList)
 async def get_status_updates(
     page: int = Query(1, ge=1),
@@ -47,48 +134,66 @@ async def get_status_updates(
     author_id: Optional[int] = Query(None),
     start_date: Optional[datetime] = Query(None),
     end_date: Optional[datetime] = Query(None),
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    tags: Optional[List[str]] = Query(None, description="Filter by tags (repeat the parameter for several)"),
+    tag_match: TagMatch = Query("all", description="Match items with all of the tags, or any of them"),
+    cursor: Optional[str] = Query(None, description="Opaque next_cursor from a previous page; overrides page"),
+    count: CountStrategy = Query("exact", description="How to compute total: exact, estimated, cached or none"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user)
 ):
     """Get list of status updates with pagination and filtering."""
-    query = db.query(StatusUpdate)
-    
-    # Apply filters
-    if author_id:
-        query = query.filter(StatusUpdate.user_id == author_id)
-    
-    if start_date:
-        query = query.filter(StatusUpdate.created_at >= start_date)
-    
-    if end_date:
-        query = query.filter(StatusUpdate.created_at <= end_date)
+    query = select(StatusUpdate).where(
+        *_status_update_filters(db, author_id, start_date, end_date, tags, tag_match)
+    )
     
     # Get total count
-    total = query.count()
-    
-    # Apply pagination and ordering
-    status_updates = query.order_by(desc(StatusUpdate.created_at)).offset((page - 1) * limit).limit(limit).all()
+    total = await count_total(db, query, count)
     
-    # Load user relationships
-    for status_update in status_updates:
-        db.refresh(status_update, ["user"])
+    # Apply ordering and pagination (keyset when a cursor is given)
+    query = apply_pagination(query, _status_update_sort_key, page, limit, cursor)
+    result = await db.execute(query.options(*_status_update_load_options))
+    status_updates, next_cursor = split_page(
+        result.scalars().all(), _status_update_sort_key, limit
+    )
     
     return {
         "items": status_updates,
         "total": total,
         "page": page,
-        "limit": limit
+        "limit": limit,
+        "next_cursor": next_cursor,
+        "has_more": next_cursor is not None
     }
 
 
+@router.get("/export")
+async def export_status_updates(
+    export_format: ExportFormat = Query("ndjson", alias="format", description="ndjson or csv"),
+    author_id: Optional[int] = Query(None),
+    start_date: Optional[datetime] = Query(None),
+    end_date: Optional[datetime] = Query(None),
+    tags: Optional[List[str]] = Query(None, description="Filter by tags (repeat the parameter for several)"),
+    tag_match: TagMatch = Query("all", description="Match items with all of the tags, or any of them"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user)
+):
+    """Stream every status update matching the list filters, in id order."""
+    query = (
+        select(*_status_update_export_columns)
+        .where(*_status_update_filters(db, author_id, start_date, end_date, tags, tag_match))
+        .order_by(StatusUpdate.id)
+    )
+    return await export_response(db, query, export_format, "status_updates")
+
+
 @router.get("/{status_id}", response_model=StatusUpdateSchema)
 async def get_status_update(
     status_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user)
 ):
     """Get a single status update by ID."""
-    status_update = db.query(StatusUpdate).filter(StatusUpdate.id == status_id).first()
+    status_update = await db.get(StatusUpdate, status_id, options=_status_update_load_options)
     
     if not status_update:
         raise HTTPException(
@@ -96,8 +201,6 @@ async def get_status_update(
             detail="Status update not found"
         )
     
-    db.refresh(status_update, ["user"])
-    
     return status_update
 
 
@@ -105,11 +208,11 @@ async def get_status_update(
 async def update_status_update(
     status_id: int,
     status_data: StatusUpdateUpdate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user)
 ):
     """Update a status update (author only)."""
-    status_update = db.query(StatusUpdate).filter(StatusUpdate.id == status_id).first()
+    status_update = await db.get(StatusUpdate, status_id)
     
     if not status_update:
         raise HTTPException(
@@ -129,9 +232,12 @@ async def update_status_update(
     for field, value in update_data.items():
         setattr(status_update, field, value)
     
-    db.commit()
-    db.refresh(status_update)
-    db.refresh(status_update, ["user"])
+    await record_summary_change(db, "status_update", status_update)
+    await record_change(db, "status_updates", "updated", status_update.id)
+    await db.commit()
+    await invalidate("status_updates")
+    await db.refresh(status_update)
+    await db.refresh(status_update, ["user"])
     
     return status_update
 
@@ -139,11 +245,11 @@ async def update_status_update(
 @router.delete("/{status_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_status_update(
     status_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user)
 ):
     """Delete a status update (author only)."""
-    status_update = db.query(StatusUpdate).filter(StatusUpdate.id == status_id).first()
+    status_update = await db.get(StatusUpdate, status_id)
     
     if not status_update:
         raise HTTPException(
@@ -158,7 +264,10 @@ async def delete_status_update(
             detail="Not authorized to delete this status update"
         )
     
-    db.delete(status_update)
-    db.commit()
+    await record_summary_change(db, "status_update", status_update)
+    await db.delete(status_update)
+    await record_change(db, "status_updates", "deleted", status_update.id)
+    await db.commit()
+    await invalidate("status_updates")
     
     return None
@@ -1,16 +1,28 @@
 from typing import Optional
-from datetime import date
+from datetime import date, timedelta
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
-from sqlalchemy import desc
-from app.core.dependencies import get_db, get_current_user, get_current_active_admin
-from app.db.models.user import User
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+from app.core.response_cache import cached_response, invalidate
+from app.core.dependencies import CurrentUser, get_async_db, get_current_user, get_current_active_admin
+from app.core.pagination import CountStrategy, apply_pagination, count_total, split_page
 from app.db.models.daily_summary import DailySummary
-from app.schemas.daily_summary import DailySummary as DailySummarySchema, DailySummaryList
+from app.core.config import settings
+from app.schemas.daily_summary import DailySummary as DailySummarySchema, DailySummaryList, DailySummaryBackfill
+from app.services.job_queue import enqueue_job
 from app.services.summary_service import create_daily_summary
 
 router = APIRouter()
 
+# Below the default, so backfills don't hold up jobs queued by everyday writes
+_BACKFILL_JOB_PRIORITY = -10
+
+# List ordering: newest summary first
+_summary_sort_key = (
+    (DailySummary.summary_date, True),
+    (DailySummary.id, True),
+)
+
 
 @router.post(
     "/generate",
@@ -22,11 +34,17 @@ router = APIRouter()
 async def generate_daily_summary(
     summary_date: Optional[date] = Query(None),
     force_update: bool = Query(False, description="Force update existing summary with latest data"),
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_admin)
+    incremental: bool = Query(
+        False,
+        description="Refresh today's existing summary from the changes already applied to it instead of rebuilding"
+    ),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_active_admin)
 ):
     """Generate a daily summary for testing. If a summary already exists for the date,
-    it will be updated with latest data if force_update=True, otherwise the existing summary is returned."""
+    it will be updated with latest data if force_update=True, otherwise the existing summary is returned.
+    With incremental=True, today's summary (kept current by create/update/archive events) is only
+    pruned of aged-out items rather than rebuilt from the source tables."""
     import logging
     logger = logging.getLogger(__name__)
     # FastAPI should handle boolean parsing, but ensure it's a boolean
@@ -36,51 +54,119 @@ async def generate_daily_summary(
     else:
         force_update_bool = bool(force_update)
     logger.info(f"generate_daily_summary called: summary_date={summary_date}, force_update={force_update} (type: {type(force_update)}) -> {force_update_bool}")
-    return create_daily_summary(db, summary_date=summary_date, force_update=force_update_bool)
+    # The summary service is shared with the sync worker, so run it on the session's sync facade
+    summary = await db.run_sync(
+        create_daily_summary,
+        summary_date=summary_date,
+        force_update=force_update_bool,
+        incremental=incremental
+    )
+    await invalidate("daily_summaries")
+    return summary
+
+
+@router.post(
+    "/backfill",
+    response_model=DailySummaryBackfill,
+    status_code=status.HTTP_202_ACCEPTED,
+    operation_id="backfill_daily_summaries",
+    summary="Queue daily summary generation for a date range (admin only)"
+)
+async def backfill_summaries(
+    start_date: date = Query(...),
+    end_date: date = Query(...),
+    force_update: bool = Query(False, description="Rebuild summaries that already exist in the range"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_active_admin)
+):
+    """Queue a generate_daily_summary job for every date in the range, each windowed around its
+    own date. Dates that already have a summary are skipped unless force_update=True, so a partial
+    backfill can be re-run to queue the remaining dates. Follow the jobs with GET /api/jobs/{id}."""
+    if end_date < start_date:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="end_date must not be before start_date"
+        )
+    if (end_date - start_date).days >= settings.DAILY_SUMMARY_BACKFILL_MAX_DAYS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Backfill range is limited to {settings.DAILY_SUMMARY_BACKFILL_MAX_DAYS} days"
+        )
+
+    existing = set()
+    if not force_update:
+        result = await db.execute(
+            select(DailySummary.summary_date)
+            .where(DailySummary.summary_date.between(start_date, end_date))
+        )
+        existing = set(result.scalars().all())
+
+    dates = [start_date + timedelta(days=offset) for offset in range((end_date - start_date).days + 1)]
+    queued = [summary_date for summary_date in dates if summary_date not in existing]
+    jobs = [
+        enqueue_job(
+            db,
+            "generate_daily_summary",
+            payload={"summary_date": summary_date.isoformat(), "force_update": force_update},
+            priority=_BACKFILL_JOB_PRIORITY
+        )
+        for summary_date in queued
+    ]
+    await db.commit()
+
+    return {
+        "job_ids": [job.id for job in jobs],
+        "queued": queued,
+        "skipped": sorted(existing),
+    }
 
 
 @router.get("", response_model=DailySummaryList)
+# Today's summary is updated by summary jobs after status update, incident, blocker and decision writes
+@cached_response(DailySummaryList, "daily_summaries", "status_updates", "incidents", "blockers", "decisions")
 async def list_daily_summaries(
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=100),
     start_date: Optional[date] = Query(None),
     end_date: Optional[date] = Query(None),
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    cursor: Optional[str] = Query(None, description="Opaque next_cursor from a previous page; overrides page"),
+    count: CountStrategy = Query("exact", description="How to compute total: exact, estimated, cached or none"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user)
 ):
     """List daily summaries with pagination and date filtering."""
-    query = db.query(DailySummary)
+    query = select(DailySummary)
 
     if start_date:
-        query = query.filter(DailySummary.summary_date >= start_date)
+        query = query.where(DailySummary.summary_date >= start_date)
 
     if end_date:
-        query = query.filter(DailySummary.summary_date <= end_date)
-
-    total = query.count()
-    summaries = (
-        query.order_by(desc(DailySummary.summary_date))
-        .offset((page - 1) * limit)
-        .limit(limit)
-        .all()
+        query = query.where(DailySummary.summary_date <= end_date)
+
+    total = await count_total(db, query, count)
+    result = await db.execute(
+        apply_pagination(query, _summary_sort_key, page, limit, cursor)
     )
+    summaries, next_cursor = split_page(result.scalars().all(), _summary_sort_key, limit)
 
     return {
         "items": summaries,
         "total": total,
         "page": page,
         "limit": limit,
+        "next_cursor": next_cursor,
+        "has_more": next_cursor is not None,
     }
 
 
 @router.get("/{summary_id}", response_model=DailySummarySchema)
 async def get_daily_summary(
     summary_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user)
 ):
     """Get a single daily summary by ID."""
-    summary = db.query(DailySummary).filter(DailySummary.id == summary_id).first()
+    summary = await db.get(DailySummary, summary_id)
 
     if not summary:
         raise HTTPException(
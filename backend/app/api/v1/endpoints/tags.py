@@ -0,0 +1,31 @@
+from typing import Literal
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.dependencies import CurrentUser, get_async_db, get_current_user
+from app.core.response_cache import cached_response
+from app.core.tags import tag_counts
+from app.db.models.decision import Decision
+from app.db.models.status_update import StatusUpdate
+from app.schemas.tag import TagFacets
+
+router = APIRouter()
+
+TaggedCollection = Literal["status_updates", "decisions"]
+
+_tagged_models = {
+    "status_updates": StatusUpdate,
+    "decisions": Decision,
+}
+
+
+@router.get("", response_model=TagFacets)
+@cached_response(TagFacets, "status_updates", "decisions")
+async def get_tag_facets(
+    collection: TaggedCollection = Query(..., description="Collection whose tags to count"),
+    limit: int = Query(50, ge=1, le=500),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUser = Depends(get_current_user)
+):
+    """Get tag usage counts for a collection, most used first."""
+    tags = await tag_counts(db, _tagged_models[collection], limit)
+    return {"collection": collection, "tags": tags}
@@ -1,15 +1,31 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from sqlalchemy import desc, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
-from app.core.dependencies import get_db, get_current_user, get_current_active_admin
+from app.core.response_cache import cached_response, invalidate
+from app.core.dependencies import CurrentUser, get_async_db, get_current_user, get_current_active_admin, invalidate_cached_user
+from app.core.search import ilike_contains, supports_text_search, trigram_matches, trigram_rank
 from app.db.models.user import User
 from app.schemas.user import UserResponse, UserUpdate, PasswordChange
+from app.services.token_service import revoke_user_refresh_tokens
 
 router = APIRouter()
 
 
+def _search_users(db: AsyncSession, query, search: str):
+    """Filter users by name or email, best matches first where trigram indexes are available."""
+    columns = (User.full_name, User.email)
+    if supports_text_search(db):
+        return query.where(trigram_matches(columns, search)).order_by(
+            desc(trigram_rank(columns, search)), User.id
+        )
+    return query.where(
+        ilike_contains(User.full_name, search) | ilike_contains(User.email, search)
+    ).order_by(User.id)
+
+
 @router.get("/me", response_model=UserResponse)
-async def get_current_user_profile(current_user: User = Depends(get_current_user)):
+async def get_current_user_profile(current_user: CurrentUser = Depends(get_current_user)):
     """Get current user's profile."""
     return current_user
 
@@ -17,60 +33,78 @@ async def get_current_user_profile(current_user: User = Depends(get_current_user
 @router.patch("/me", response_model=UserResponse)
 async def update_current_user_profile(
     user_update: UserUpdate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Update current user's profile."""
+    user = await db.get(User, current_user.id)
+    
     # Update allowed fields
     if user_update.full_name is not None:
-        current_user.full_name = user_update.full_name
+        user.full_name = user_update.full_name
     
-    if user_update.email is not None and user_update.email != current_user.email:
+    if user_update.email is not None and user_update.email != user.email:
         # Check if email is already taken
-        existing_user = db.query(User).filter(User.email == user_update.email).first()
+        result = await db.execute(select(User).where(User.email == user_update.email))
+        existing_user = result.scalar_one_or_none()
         if existing_user:
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
                 detail="Email already registered"
             )
-        current_user.email = user_update.email
+        user.email = user_update.email
     
-    db.commit()
-    db.refresh(current_user)
-    return current_user
+    await db.commit()
+    await db.refresh(user)
+    invalidate_cached_user(user.id)
+    await invalidate("users")
+    return user
 
 
 @router.post("/me/change-password")
 async def change_password(
     password_data: PasswordChange,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Change current user's password."""
-    from app.core.security import verify_password, get_password_hash
+    from app.core.security import verify_password_async, get_password_hash_async
+    
+    user = await db.get(User, current_user.id)
     
     # Verify current password
-    if not verify_password(password_data.current_password, current_user.password_hash):
+    if not await verify_password_async(password_data.current_password, user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Current password is incorrect"
         )
     
     # Update password
-    current_user.password_hash = get_password_hash(password_data.new_password)
-    db.commit()
+    user.password_hash = await get_password_hash_async(password_data.new_password)
+    # Existing sessions must log in again with the new password
+    await revoke_user_refresh_tokens(db, user.id)
+    await db.commit()
+    invalidate_cached_user(user.id)
     
     return {"message": "Password changed successfully"}
 
 
 @router.get("/for-assignment", response_model=List[UserResponse])
+@cached_response(List[UserResponse], "users")
 async def get_users_for_assignment(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    search: Optional[str] = Query(None, description="Filter by name or email, best matches first"),
+    limit: int = Query(20, ge=1, le=100, description="Maximum matches returned when searching"),
+    current_user: CurrentUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get list of active users for assignment purposes (any authenticated user)."""
-    users = db.query(User).filter(User.is_active == True).order_by(User.full_name).all()
-    return users
+    query = select(User).where(User.is_active == True)
+    if search:
+        query = _search_users(db, query, search).limit(limit)
+    else:
+        query = query.order_by(User.full_name)
+    result = await db.execute(query)
+    return result.scalars().all()
 
 
 @router.get("", response_model=List[UserResponse])
@@ -79,25 +113,22 @@ async def list_users(
     limit: int = Query(20, ge=1, le=100),
     role: Optional[str] = Query(None),
     search: Optional[str] = Query(None),
-    current_user: User = Depends(get_current_active_admin),
-    db: Session = Depends(get_db)
+    current_user: CurrentUser = Depends(get_current_active_admin),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """List all users (admin only)."""
-    query = db.query(User)
+    query = select(User)
     
     # Filter by role if provided
     if role:
-        query = query.filter(User.role == role)
+        query = query.where(User.role == role)
     
     # Search by name or email
     if search:
-        search_term = f"%{search}%"
-        query = query.filter(
-            (User.full_name.ilike(search_term)) | (User.email.ilike(search_term))
-        )
+        query = _search_users(db, query, search)
+    else:
+        query = query.order_by(User.id)
     
     # Pagination
-    total = query.count()
-    users = query.offset((page - 1) * limit).limit(limit).all()
-    
-    return users
+    result = await db.execute(query.offset((page - 1) * limit).limit(limit))
+    return result.scalars().all()
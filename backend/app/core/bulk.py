@@ -0,0 +1,104 @@
+"""
+Helpers for the bulk endpoints (``/api/<collection>/bulk...``).
+
+Bulk create is all or nothing. The request schema validates each item's
+shape, and references to other rows are checked with one query per
+referenced table. Every failing item is reported in FastAPI's validation
+error format (``loc`` names the item index and field), and nothing is
+written unless all items are valid. Valid batches are inserted with
+multi-row ``INSERT ... RETURNING`` statements rather than one round trip
+per item.
+
+Bulk updates (archive, status changes) select rows by id list or filter and
+run set-based ``UPDATE ... RETURNING`` statements in id-ordered chunks of
+BULK_UPDATE_CHUNK_SIZE rows. Each chunk commits on its own, so no
+transaction holds row locks on more than one chunk.
+"""
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Sequence, Set
+from fastapi import HTTPException, status
+from sqlalchemy import insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+
+
+def item_error(index: int, field: str, message: str) -> Dict[str, Any]:
+    """Validation error for one field of the ``index``-th item of a bulk request."""
+    return {"loc": ["body", "items", index, field], "msg": message, "type": "not_found"}
+
+
+def raise_item_errors(errors: List[Dict[str, Any]]) -> None:
+    """Reject the whole request if any item failed validation."""
+    if errors:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=errors)
+
+
+async def existing_ids(db: AsyncSession, column: Any, ids: Iterable[int]) -> Set[int]:
+    """Return which of ``ids`` exist in the primary key ``column``, in one query."""
+    ids = set(ids)
+    if not ids:
+        return set()
+    return set((await db.scalars(select(column).where(column.in_(ids)))).all())
+
+
+async def insert_returning(db: AsyncSession, model: Any, rows: List[Dict[str, Any]]) -> List[Any]:
+    """Insert ``rows`` and return the new ``model`` instances in the same order.
+
+    On PostgreSQL SQLAlchemy renders one multi-row ``INSERT ... RETURNING``
+    per ``insertmanyvalues_page_size`` (1000) rows, ordered by a sentinel so
+    the ids line up with ``rows``; SQLite, which can't guarantee that order,
+    inserts row by row. The instances, including server defaults, are in the
+    session afterwards. Does not commit.
+    """
+    result = await db.scalars(insert(model).returning(model, sort_by_parameter_order=True), rows)
+    return list(result.all())
+
+
+async def update_in_chunks(
+    db: AsyncSession,
+    model: Any,
+    criteria: Any,
+    values: Dict[str, Any],
+    on_chunk: Callable[[List[Any]], Awaitable[None]],
+    ids: Optional[Sequence[int]] = None,
+) -> int:
+    """Apply ``values`` to the ``model`` rows matching ``criteria`` and return how many changed.
+
+    With ``ids`` only those rows are considered, a slice of the sorted ids per
+    chunk; otherwise each chunk is the next BULK_UPDATE_CHUNK_SIZE matching
+    rows by id. ``criteria`` should exclude rows already in the target state,
+    so they are neither rewritten nor counted. ``on_chunk`` receives each
+    chunk's updated instances before the chunk commits, for side effects
+    that must commit with it.
+    """
+    chunk_size = settings.BULK_UPDATE_CHUNK_SIZE
+    pending_ids = sorted(set(ids)) if ids is not None else None
+    last_id = None
+    affected = 0
+    while True:
+        if pending_ids is not None:
+            if not pending_ids:
+                break
+            chunk_ids, pending_ids = pending_ids[:chunk_size], pending_ids[chunk_size:]
+        else:
+            chunk_ids = select(model.id).where(criteria).order_by(model.id).limit(chunk_size).correlate(None)
+            if last_id is not None:
+                chunk_ids = chunk_ids.where(model.id > last_id)
+            chunk_ids = chunk_ids.scalar_subquery()
+
+        # criteria is repeated outside the subquery so Postgres rechecks it on rows changed concurrently
+        rows = (
+            await db.scalars(
+                update(model).where(criteria, model.id.in_(chunk_ids)).values(**values).returning(model),
+                execution_options={"synchronize_session": False},
+            )
+        ).all()
+        if rows:
+            await on_chunk(list(rows))
+        await db.commit()
+        affected += len(rows)
+
+        if pending_ids is None:
+            if len(rows) < chunk_size:
+                break
+            last_id = max(row.id for row in rows)
+    return affected
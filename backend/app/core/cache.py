@@ -0,0 +1,59 @@
+"""
+In-process caching primitives.
+
+Caches are per worker process: invalidation only reaches the process that
+made the change, so entries in other workers live until their TTL expires.
+"""
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """Size-bounded LRU cache whose entries expire after ``ttl_seconds``."""
+
+    def __init__(self, ttl_seconds: float, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            self._entries.pop(key, None)
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Per-collection write counters: cache keys that include a collection's version
+# stop matching as soon as that collection changes in this process
+_collection_versions: Dict[str, int] = {}
+
+
+def collection_version(collection: str) -> int:
+    return _collection_versions.get(collection, 0)
+
+
+def bump_collection_version(collection: str) -> None:
+    """Record a committed change to ``collection``."""
+    _collection_versions[collection] = _collection_versions.get(collection, 0) + 1
@@ -1,6 +1,7 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import field_validator
-from typing import List, Union
+import os
+from typing import List, Optional, Union
 
 
 class Settings(BaseSettings):
@@ -14,11 +15,43 @@ class Settings(BaseSettings):
     
     # Database
     DATABASE_URL: str
+    # Optional explicit async driver URL; derived from DATABASE_URL (asyncpg) when unset
+    ASYNC_DATABASE_URL: Optional[str] = None
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 40
+
+    # List totals (count=cached)
+    COUNT_CACHE_TTL_SECONDS: int = 30
+    COUNT_CACHE_MAX_ENTRIES: int = 1024
+
+    # Read endpoint responses, cached per version of the collections they draw on.
+    # In-process by default; a redis:// URL shares entries and versions between workers
+    RESPONSE_CACHE_TTL_SECONDS: int = 15
+    RESPONSE_CACHE_MAX_ENTRIES: int = 1024
+    RESPONSE_CACHE_URL: Optional[str] = None
+
+    # Live change feed (/api/events): keepalive interval, events buffered per client
+    # before a lagging client is disconnected, and LISTEN reconnect delay
+    EVENTS_HEARTBEAT_SECONDS: int = 15
+    EVENTS_QUEUE_SIZE: int = 256
+    EVENTS_RECONNECT_SECONDS: int = 5
+    # Lifetime of the single-purpose tickets EventSource connects with (POST /api/events/ticket)
+    EVENTS_TICKET_EXPIRE_SECONDS: int = 60
+
+    # Authenticated user lookups cached by get_current_user
+    USER_CACHE_TTL_SECONDS: int = 60
+    USER_CACHE_MAX_ENTRIES: int = 10000
     
     # Security
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
-    ACCESS_TOKEN_EXPIRE_MINUTES: int = 1440  # 24 hours
+    ACCESS_TOKEN_EXPIRE_MINUTES: int = 15  # Short-lived; renewed via /api/auth/refresh
+    REFRESH_TOKEN_EXPIRE_DAYS: int = 30
+    # Revoked refresh tokens are kept this long to detect their reuse, then purged
+    REVOKED_REFRESH_TOKEN_RETENTION_DAYS: int = 7
+    BCRYPT_ROUNDS: int = 12
+    # Threads for bcrypt hashing/verification; bounds concurrent CPU use by logins
+    PASSWORD_HASH_WORKERS: int = min(4, os.cpu_count() or 1)
     
     # CORS - accept as string and parse
     CORS_ORIGINS: Union[str, List[str]] = "http://localhost:3000,http://localhost:5173"
@@ -30,8 +63,42 @@ class Settings(BaseSettings):
     # Daily summary scheduling (UTC)
     DAILY_SUMMARY_RUN_HOUR_UTC: int = 9
     DAILY_SUMMARY_RUN_MINUTE_UTC: int = 0
-    DAILY_SUMMARY_POLL_INTERVAL_SECONDS: int = 300
+    # Scheduler replicas retry the leader lock this often; the leader checks its lock connection
+    DAILY_SUMMARY_LEADER_RETRY_SECONDS: int = 30
+    DAILY_SUMMARY_LEADER_HEARTBEAT_SECONDS: int = 60
     DAILY_SUMMARY_RETRY_INTERVAL_SECONDS: int = 600
+    # Dates generated at once by the backfill_summaries script; keep within DB_POOL_SIZE
+    DAILY_SUMMARY_BACKFILL_CONCURRENCY: int = 8
+    DAILY_SUMMARY_BACKFILL_MAX_DAYS: int = 366
+
+    # Background job queue (app.workers.job_worker)
+    JOB_WORKER_THREADS: int = 4
+    JOB_POLL_INTERVAL_SECONDS: float = 2.0
+    JOB_MAX_ATTEMPTS: int = 5
+    JOB_RETRY_BACKOFF_SECONDS: int = 30
+    JOB_RETRY_BACKOFF_MAX_SECONDS: int = 3600
+    # Workers refresh the claims of their running jobs this often
+    JOB_HEARTBEAT_SECONDS: int = 60
+    # Running jobs whose claim hasn't been refreshed for this long are presumed orphaned and reclaimed
+    JOB_LOCK_TIMEOUT_SECONDS: int = 300
+    # Succeeded and failed jobs are kept this long, then purged
+    JOB_RETENTION_DAYS: int = 7
+
+    # Transactional outbox relay (app.workers.outbox_relay)
+    OUTBOX_RELAY_BATCH_SIZE: int = 500
+    OUTBOX_RELAY_POLL_INTERVAL_SECONDS: float = 1.0
+    # Published events are kept this long for replay, then purged
+    OUTBOX_RETENTION_DAYS: int = 7
+    # Relayed batches are POSTed here as {"events": [...]} when set
+    OUTBOX_WEBHOOK_URL: Optional[str] = None
+    OUTBOX_WEBHOOK_TIMEOUT_SECONDS: float = 10.0
+    # Most missed events replayed to a reconnecting /api/events client
+    OUTBOX_REPLAY_LIMIT: int = 1000
+
+    # Rows updated per transaction by bulk archive/status endpoints; bounds how long row locks are held
+    BULK_UPDATE_CHUNK_SIZE: int = 1000
+    # Rows fetched per server-side cursor batch by the /export endpoints
+    EXPORT_BATCH_SIZE: int = 1000
     
     @field_validator("CORS_ORIGINS", mode="before")
     @classmethod
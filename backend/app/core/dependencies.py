@@ -1,13 +1,62 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
+from dataclasses import dataclass
+from datetime import datetime
+from typing import AsyncGenerator, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from app.db.session import SessionLocal
+from app.db.session import SessionLocal, AsyncSessionLocal
 from app.db.models.user import User
+from app.core.cache import TTLCache
+from app.core.config import settings
 from app.core.security import decode_access_token
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
 
+@dataclass(frozen=True)
+class CurrentUser:
+    """The authenticated user as seen by endpoints.
+
+    A detached snapshot of the profile fields, safe to cache across requests.
+    Endpoints that change the user load the ``User`` row themselves.
+    """
+
+    id: int
+    email: str
+    full_name: str
+    role: str
+    is_active: bool
+    created_at: datetime
+    updated_at: datetime
+
+    @classmethod
+    def from_user(cls, user: User) -> "CurrentUser":
+        return cls(
+            id=user.id,
+            email=user.email,
+            full_name=user.full_name,
+            role=user.role,
+            is_active=user.is_active,
+            created_at=user.created_at,
+            updated_at=user.updated_at,
+        )
+
+
+# Snapshots of active users keyed by id, so authenticated requests skip the users SELECT
+_user_cache = TTLCache(settings.USER_CACHE_TTL_SECONDS, settings.USER_CACHE_MAX_ENTRIES)
+
+
+def invalidate_cached_user(user_id: int) -> None:
+    """Drop a user from the authentication cache after its row changes."""
+    _user_cache.pop(user_id)
+
+
+def clear_user_cache() -> None:
+    """Drop all cached users."""
+    _user_cache.clear()
+
+
 def get_db() -> Session:
     """Dependency to get database session."""
     db = SessionLocal()
@@ -17,11 +66,26 @@ def get_db() -> Session:
         db.close()
 
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """Dependency to get an async database session."""
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db)
-) -> User:
+    db: AsyncSession = Depends(get_async_db)
+) -> CurrentUser:
     """Dependency to get current authenticated user."""
+    return await authenticate_token(token, db)
+
+
+async def authenticate_token(token: str, db: AsyncSession, purpose: Optional[str] = None) -> CurrentUser:
+    """Return the active user ``token`` was issued to.
+
+    Access tokens have no ``purpose`` claim; single-purpose tokens (such as
+    event stream tickets) are only accepted where that ``purpose`` is expected.
+    """
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -33,6 +97,9 @@ async def get_current_user(
         print(f"Failed to decode token: {token[:20]}...")
         raise credentials_exception
     
+    if payload.get("purpose") != purpose:
+        raise credentials_exception
+
     user_id_str = payload.get("sub")
     if user_id_str is None:
         print(f"Token payload missing 'sub': {payload}")
@@ -45,7 +112,11 @@ async def get_current_user(
         print(f"Invalid user_id in token: {user_id_str}")
         raise credentials_exception
     
-    user = db.query(User).filter(User.id == user_id).first()
+    current_user = _user_cache.get(user_id)
+    if current_user is not None:
+        return current_user
+    
+    user = await db.get(User, user_id)
     if user is None:
         print(f"User not found for id: {user_id}")
         raise credentials_exception
@@ -56,12 +127,14 @@ async def get_current_user(
             detail="User account is inactive"
         )
     
-    return user
+    current_user = CurrentUser.from_user(user)
+    _user_cache.set(user_id, current_user)
+    return current_user
 
 
 async def get_current_active_admin(
-    current_user: User = Depends(get_current_user)
-) -> User:
+    current_user: CurrentUser = Depends(get_current_user)
+) -> CurrentUser:
     """Dependency to ensure current user is an admin."""
     if current_user.role != "admin":
         raise HTTPException(
@@ -0,0 +1,183 @@
+"""
+Pagination helpers shared by the list endpoints.
+
+Keyset (cursor) pagination: a sort key is a sequence of ``(ORM attribute,
+descending)`` pairs ending in a unique column (usually ``id``). The cursor is
+an opaque, URL-safe encoding of the sort key values of the last row on the
+previous page.
+
+Totals: ``count_total`` computes the ``total`` field with the strategy the
+client asks for, so large filtered tables don't pay for an exact COUNT(*) on
+every page.
+"""
+import base64
+import json
+from datetime import date, datetime
+from typing import Any, List, Literal, Optional, Sequence, Tuple
+from fastapi import HTTPException, status
+from sqlalchemy import and_, or_, asc, desc, tuple_, select, func, text, Table
+from sqlalchemy.exc import CompileError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+from app.core.cache import TTLCache
+from app.core.config import settings
+
+SortKey = Sequence[Tuple[Any, bool]]
+
+# exact: COUNT(*); estimated: planner row estimate (Postgres only, exact elsewhere);
+# cached: COUNT(*) cached briefly per filter set; none: total omitted
+CountStrategy = Literal["exact", "estimated", "cached", "none"]
+
+_count_cache = TTLCache(settings.COUNT_CACHE_TTL_SECONDS, settings.COUNT_CACHE_MAX_ENTRIES)
+
+
+def order_by_keys(keys: SortKey) -> List[Any]:
+    """Build ORDER BY clauses for a sort key."""
+    return [desc(column) if descending else asc(column) for column, descending in keys]
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encode sort key values into an opaque cursor string."""
+    serialized = [
+        value.isoformat() if isinstance(value, (date, datetime)) else value
+        for value in values
+    ]
+    raw = json.dumps(serialized, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, keys: SortKey) -> List[Any]:
+    """Decode a cursor back into typed sort key values."""
+    invalid_cursor = HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Invalid cursor"
+    )
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, TypeError):
+        raise invalid_cursor
+
+    if not isinstance(values, list) or len(values) != len(keys):
+        raise invalid_cursor
+
+    decoded = []
+    for (column, _), value in zip(keys, values):
+        python_type = column.type.python_type
+        try:
+            if python_type is datetime:
+                value = datetime.fromisoformat(value)
+            elif python_type is date:
+                value = date.fromisoformat(value)
+            elif not isinstance(value, python_type):
+                raise TypeError
+        except (ValueError, TypeError):
+            raise invalid_cursor
+        decoded.append(value)
+    return decoded
+
+
+def keyset_filter(keys: SortKey, values: Sequence[Any]):
+    """Build the WHERE clause selecting rows strictly after ``values`` in sort order."""
+    directions = {descending for _, descending in keys}
+    if len(directions) == 1:
+        # Uniform direction: a row-value comparison maps directly onto a composite index
+        columns = tuple_(*[column for column, _ in keys])
+        row = tuple_(*values)
+        return columns < row if directions.pop() else columns > row
+
+    # Mixed directions: expand to (a > x) OR (a = x AND b < y) OR ...
+    clauses = []
+    for i, (column, descending) in enumerate(keys):
+        prefix = [keys[j][0] == values[j] for j in range(i)]
+        after = column < values[i] if descending else column > values[i]
+        clauses.append(and_(*prefix, after))
+    return or_(*clauses)
+
+
+def apply_pagination(
+    query: Select,
+    keys: SortKey,
+    page: int,
+    limit: int,
+    cursor: Optional[str] = None
+) -> Select:
+    """Order the query by ``keys`` and page it by cursor if given, else by offset.
+
+    One extra row is fetched so ``split_page`` can tell whether another page exists.
+    """
+    query = query.order_by(*order_by_keys(keys))
+    if cursor:
+        query = query.where(keyset_filter(keys, decode_cursor(cursor, keys)))
+    else:
+        query = query.offset((page - 1) * limit)
+    return query.limit(limit + 1)
+
+
+def split_page(rows: Sequence[Any], keys: SortKey, limit: int) -> Tuple[List[Any], Optional[str]]:
+    """Trim the look-ahead row and build the cursor for the next page, if any."""
+    items = list(rows[:limit])
+    if len(rows) <= limit or not items:
+        return items, None
+    last = items[-1]
+    return items, encode_cursor([getattr(last, column.key) for column, _ in keys])
+
+
+async def _exact_count(db: AsyncSession, query: Select) -> int:
+    return await db.scalar(select(func.count()).select_from(query.subquery()))
+
+
+async def _estimated_count(db: AsyncSession, query: Select) -> Optional[int]:
+    """Return the planner's row estimate, or None if it can't be obtained."""
+    if db.bind.dialect.name != "postgresql":
+        return None
+    try:
+        froms = query.get_final_froms()
+        if query.whereclause is None and len(froms) == 1 and isinstance(froms[0], Table):
+            # Unfiltered: table statistics maintained by VACUUM/ANALYZE
+            estimate = await db.scalar(
+                text("SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:table AS regclass)"),
+                {"table": froms[0].name}
+            )
+        else:
+            sql = str(query.compile(dialect=db.bind.dialect, compile_kwargs={"literal_binds": True}))
+            plan = await db.scalar(text(f"EXPLAIN (FORMAT JSON) {sql}"))
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            estimate = plan[0]["Plan"]["Plan Rows"]
+    except (CompileError, NotImplementedError, KeyError, IndexError, TypeError):
+        return None
+    # reltuples is -1 for tables that have never been analyzed
+    if estimate is None or estimate < 0:
+        return None
+    return int(estimate)
+
+
+async def _cached_count(db: AsyncSession, query: Select) -> int:
+    compiled = query.compile(dialect=db.bind.dialect)
+    key = f"{compiled}|{sorted(compiled.params.items())!r}"
+
+    total = _count_cache.get(key)
+    if total is None:
+        total = await _exact_count(db, query)
+        _count_cache.set(key, total)
+    return total
+
+
+def clear_count_cache() -> None:
+    """Drop all cached totals."""
+    _count_cache.clear()
+
+
+async def count_total(db: AsyncSession, query: Select, strategy: CountStrategy = "exact") -> Optional[int]:
+    """Compute the ``total`` for a filtered (unordered, unpaged) list query."""
+    if strategy == "none":
+        return None
+    if strategy == "estimated":
+        estimate = await _estimated_count(db, query)
+        if estimate is not None:
+            return estimate
+        return await _exact_count(db, query)
+    if strategy == "cached":
+        return await _cached_count(db, query)
+    return await _exact_count(db, query)
@@ -0,0 +1,220 @@
+"""
+Response cache for read endpoints.
+
+Responses are stored as encoded JSON, keyed by route, normalized query
+parameters and the current versions of the collections they are built from.
+Write handlers call ``invalidate`` after committing, which bumps those
+versions so every cached response built from the old data stops matching.
+
+The default backend is an in-process LRU, where a write only invalidates the
+worker that made it (others serve entries until RESPONSE_CACHE_TTL_SECONDS).
+Setting RESPONSE_CACHE_URL to a redis:// URL shares entries and versions
+between workers; it needs the optional ``redis`` package.
+
+Collections written outside the API processes (EXTERNALLY_WRITTEN) are only
+invalidated through the shared versions, so the in-process backend doesn't
+cache responses built from them.
+"""
+import functools
+import inspect
+import logging
+from typing import Optional, Sequence, Tuple
+from urllib.parse import urlencode
+from fastapi import Request, Response
+from pydantic import TypeAdapter
+from app.core.cache import TTLCache, bump_collection_version, collection_version
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Changed by job workers and the scheduler, whose invalidate_sync can't reach other processes' memory
+EXTERNALLY_WRITTEN = frozenset({"daily_summaries"})
+
+
+class ResponseCacheBackend:
+    """Storage for cached responses and the collection versions they are keyed on."""
+
+    # Whether invalidations from other processes reach this backend
+    shared = False
+
+    async def get(self, key: str) -> Optional[bytes]:
+        raise NotImplementedError
+
+    async def set(self, key: str, body: bytes) -> None:
+        raise NotImplementedError
+
+    async def versions(self, collections: Sequence[str]) -> Tuple[int, ...]:
+        raise NotImplementedError
+
+    async def bump(self, collections: Sequence[str]) -> None:
+        raise NotImplementedError
+
+
+class MemoryResponseCache(ResponseCacheBackend):
+    """Per-process LRU keyed on this process's collection versions."""
+
+    def __init__(self, ttl_seconds: float, max_entries: int):
+        self._entries = TTLCache(ttl_seconds, max_entries)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return self._entries.get(key)
+
+    async def set(self, key: str, body: bytes) -> None:
+        self._entries.set(key, body)
+
+    async def versions(self, collections: Sequence[str]) -> Tuple[int, ...]:
+        return tuple(collection_version(collection) for collection in collections)
+
+    async def bump(self, collections: Sequence[str]) -> None:
+        # invalidate() has already bumped the local versions
+        pass
+
+
+class RedisResponseCache(ResponseCacheBackend):
+    """Redis-backed cache shared by every API worker.
+
+    Redis errors degrade to cache misses so reads keep working without it.
+    """
+
+    _prefix = "asyncops:response-cache:"
+    shared = True
+
+    def __init__(self, url: str, ttl_seconds: int):
+        try:
+            import redis.asyncio as redis
+        except ImportError as exc:
+            raise RuntimeError("RESPONSE_CACHE_URL requires the redis package (pip install redis)") from exc
+        self._redis = redis.from_url(url)
+        self._ttl_seconds = ttl_seconds
+
+    @classmethod
+    def _version_key(cls, collection: str) -> str:
+        return f"{cls._prefix}version:{collection}"
+
+    async def get(self, key: str) -> Optional[bytes]:
+        try:
+            return await self._redis.get(self._prefix + key)
+        except Exception:
+            logger.warning("Response cache read failed", exc_info=True)
+            return None
+
+    async def set(self, key: str, body: bytes) -> None:
+        try:
+            await self._redis.set(self._prefix + key, body, ex=self._ttl_seconds)
+        except Exception:
+            logger.warning("Response cache write failed", exc_info=True)
+
+    async def versions(self, collections: Sequence[str]) -> Tuple[int, ...]:
+        values = await self._redis.mget([self._version_key(c) for c in collections])
+        return tuple(int(value or 0) for value in values)
+
+    async def bump(self, collections: Sequence[str]) -> None:
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for collection in collections:
+                pipe.incr(self._version_key(collection))
+            await pipe.execute()
+
+
+_backend: Optional[ResponseCacheBackend] = None
+# Blocking client for invalidate_sync, created on first use
+_sync_redis = None
+
+
+def get_response_cache() -> ResponseCacheBackend:
+    global _backend
+    if _backend is None:
+        if settings.RESPONSE_CACHE_URL:
+            _backend = RedisResponseCache(settings.RESPONSE_CACHE_URL, settings.RESPONSE_CACHE_TTL_SECONDS)
+        else:
+            _backend = MemoryResponseCache(settings.RESPONSE_CACHE_TTL_SECONDS, settings.RESPONSE_CACHE_MAX_ENTRIES)
+    return _backend
+
+
+def clear_response_cache() -> None:
+    """Drop the response cache backend (and with it every in-process entry)."""
+    global _backend, _sync_redis
+    _backend = None
+    _sync_redis = None
+
+
+async def invalidate(*collections: str) -> None:
+    """Record committed changes to ``collections`` for every cache keyed on their versions."""
+    for collection in collections:
+        bump_collection_version(collection)
+    try:
+        await get_response_cache().bump(collections)
+    except Exception:
+        logger.exception("Response cache invalidation failed for %s", ", ".join(collections))
+
+
+def invalidate_sync(*collections: str) -> None:
+    """``invalidate`` for synchronous code outside the API, such as job handlers.
+
+    With the in-process backend this only reaches caches in the calling
+    process; with RESPONSE_CACHE_URL it bumps the shared versions.
+    """
+    global _sync_redis
+    for collection in collections:
+        bump_collection_version(collection)
+    if not settings.RESPONSE_CACHE_URL:
+        return
+    try:
+        if _sync_redis is None:
+            import redis
+            _sync_redis = redis.from_url(settings.RESPONSE_CACHE_URL)
+        with _sync_redis.pipeline(transaction=False) as pipe:
+            for collection in collections:
+                pipe.incr(RedisResponseCache._version_key(collection))
+            pipe.execute()
+    except Exception:
+        logger.exception("Response cache invalidation failed for %s", ", ".join(collections))
+
+
+def _cache_key(request: Request, versions: Tuple[int, ...]) -> str:
+    # Parameter order doesn't change the response, so it doesn't change the key
+    query = urlencode(sorted(request.query_params.multi_items()))
+    return f"{request.url.path}?{query}#{'.'.join(map(str, versions))}"
+
+
+def cached_response(response_model, *collections: str):
+    """Serve the decorated GET endpoint from the response cache.
+
+    Apply below ``@router.get``. Dependencies (authentication included) still
+    run on every request; only the endpoint body is skipped on a hit. The
+    response must depend only on the query parameters and ``collections``.
+    Endpoints reading EXTERNALLY_WRITTEN collections are only cached by a
+    shared backend.
+    """
+    adapter = TypeAdapter(response_model)
+    external = EXTERNALLY_WRITTEN.intersection(collections)
+
+    def decorator(endpoint):
+        signature = inspect.signature(endpoint)
+
+        @functools.wraps(endpoint)
+        async def wrapper(*args, cache_request: Request, **kwargs):
+            cache = get_response_cache()
+            if external and not cache.shared:
+                return await endpoint(*args, **kwargs)
+            try:
+                key = _cache_key(cache_request, await cache.versions(collections))
+            except Exception:
+                # Without current versions a cached entry can't be trusted
+                logger.warning("Response cache version read failed", exc_info=True)
+                key = None
+            body = await cache.get(key) if key else None
+            if body is None:
+                result = await endpoint(*args, **kwargs)
+                body = adapter.dump_json(adapter.validate_python(result, from_attributes=True), by_alias=True)
+                if key:
+                    await cache.set(key, body)
+            return Response(content=body, media_type="application/json")
+
+        # FastAPI injects the request through this extra keyword-only parameter
+        wrapper.__signature__ = signature.replace(parameters=[
+            *signature.parameters.values(),
+            inspect.Parameter("cache_request", inspect.Parameter.KEYWORD_ONLY, annotation=Request),
+        ])
+        return wrapper
+
+    return decorator
@@ -0,0 +1,65 @@
+"""
+Text search helpers shared by the endpoints that search on Postgres indexes.
+
+Full-text: user input is parsed with ``websearch_to_tsquery`` (quoted
+phrases, ``or``, ``-`` exclusion) against ``tsvector`` columns. A trailing
+bare word is also matched as a prefix so search-as-you-type finds "deploy"
+while the user has typed "depl".
+
+Trigram: short identifier-like columns (names, emails) are matched by
+substring and similarity through ``pg_trgm`` GIN indexes.
+"""
+import re
+from typing import Any, Sequence
+from sqlalchemy import func, literal, or_
+
+# Configuration used both for the stored vectors and for parsing queries
+TEXT_SEARCH_CONFIG = "english"
+
+_TRAILING_WORD = re.compile(r"(?:^|\s)([^\W_]+)$")
+
+
+def build_tsquery(search: str):
+    """Build the tsquery expression for a user's search string."""
+    search = search.strip()
+    match = _TRAILING_WORD.search(search)
+    # A trailing word inside an open quote belongs to the phrase, not a prefix
+    if match is None or search.count('"') % 2 == 1:
+        return func.websearch_to_tsquery(TEXT_SEARCH_CONFIG, search)
+    head = search[:match.start(1)]
+    prefix = func.to_tsquery(TEXT_SEARCH_CONFIG, literal(match.group(1) + ":*"))
+    return func.websearch_to_tsquery(TEXT_SEARCH_CONFIG, head).op("&&")(prefix)
+
+
+def matches(vector: Any, tsquery: Any):
+    """``vector @@ tsquery``: the filter a GIN index on ``vector`` serves."""
+    return vector.op("@@")(tsquery)
+
+
+def rank(vector: Any, tsquery: Any):
+    """Relevance of a match, weighting title (A) over body text (B, C)."""
+    return func.ts_rank_cd(vector, tsquery)
+
+
+def ilike_contains(column: Any, term: str):
+    """Case-insensitive substring match; ``%``, ``_`` and ``\\`` in ``term`` match literally."""
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return column.ilike(f"%{escaped}%", escape="\\")
+
+
+def trigram_matches(columns: Sequence[Any], term: str):
+    """Substring (ILIKE) or fuzzy (``%``) match on any column; both use ``gin_trgm_ops`` indexes."""
+    return or_(
+        *[ilike_contains(column, term) for column in columns],
+        *[column.op("%")(term) for column in columns]
+    )
+
+
+def trigram_rank(columns: Sequence[Any], term: str):
+    """Best trigram similarity of ``term`` to any column (1 is an exact match)."""
+    return func.greatest(*[func.similarity(column, term) for column in columns])
+
+
+def supports_text_search(db) -> bool:
+    """Whether the session's database has Postgres full-text and trigram search."""
+    return db.bind.dialect.name == "postgresql"
@@ -1,5 +1,11 @@
+import asyncio
+import hashlib
+import hmac
+import secrets
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Callable, Dict, Optional, Tuple, TypeVar
 from jose import JWTError, jwt
 import bcrypt
 from passlib.context import CryptContext
@@ -8,6 +14,42 @@ from app.core.config import settings
 # Keep passlib context for backward compatibility with old hashes
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+T = TypeVar("T")
+
+# bcrypt is CPU-bound (~250ms at cost 12) and releases the GIL, so request handlers
+# run it on a dedicated, size-limited pool instead of blocking the event loop
+_password_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    thread_name_prefix="password-hash",
+)
+_password_stats_lock = threading.Lock()
+_password_stats = {"queued": 0, "running": 0, "completed": 0}
+
+
+def get_password_hasher_stats() -> Dict[str, int]:
+    """Snapshot of the password hashing pool: queued/running jobs and completed total."""
+    with _password_stats_lock:
+        return {"workers": settings.PASSWORD_HASH_WORKERS, **_password_stats}
+
+
+def _run_tracked(fn: Callable[..., T], *args) -> T:
+    with _password_stats_lock:
+        _password_stats["queued"] -= 1
+        _password_stats["running"] += 1
+    try:
+        return fn(*args)
+    finally:
+        with _password_stats_lock:
+            _password_stats["running"] -= 1
+            _password_stats["completed"] += 1
+
+
+async def _run_in_password_executor(fn: Callable[..., T], *args) -> T:
+    with _password_stats_lock:
+        _password_stats["queued"] += 1
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_password_executor, _run_tracked, fn, *args)
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash.
@@ -55,11 +97,21 @@ def get_password_hash(password: str) -> str:
     if len(password_bytes) > 72:
         password_bytes = password_bytes[:72]
     # Generate salt and hash
-    salt = bcrypt.gensalt(rounds=12)
+    salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
     hashed = bcrypt.hashpw(password_bytes, salt)
     return hashed.decode('utf-8')
 
 
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password on the password hashing pool (for use in request handlers)."""
+    return await _run_in_password_executor(verify_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """Hash a password on the password hashing pool (for use in request handlers)."""
+    return await _run_in_password_executor(get_password_hash, password)
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create a JWT access token."""
     to_encode = data.copy()
@@ -74,6 +126,23 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     return encoded_jwt
 
 
+def hash_refresh_token(token: str) -> str:
+    """Hash a refresh token for storage and lookup.
+
+    Refresh tokens are random and high-entropy, so a keyed HMAC is enough here;
+    unlike passwords they don't need a slow hash.
+    """
+    return hmac.new(
+        settings.SECRET_KEY.encode("utf-8"), token.encode("utf-8"), hashlib.sha256
+    ).hexdigest()
+
+
+def create_refresh_token() -> Tuple[str, str]:
+    """Create a new opaque refresh token. Returns (token, token_hash)."""
+    token = secrets.token_urlsafe(48)
+    return token, hash_refresh_token(token)
+
+
 def decode_access_token(token: str) -> Optional[dict]:
     """Decode and verify a JWT token."""
     try:
@@ -0,0 +1,57 @@
+"""
+Tag filtering and facet counts over ``tags`` array columns.
+
+On Postgres the filters are the array operators ``@>`` (all) and ``&&``
+(any), which the GIN indexes on the tags columns serve, and facet counts
+come from a single ``unnest`` aggregate. Other databases (SQLite in tests)
+store the arrays as JSON and use ``json_each`` instead.
+"""
+from typing import Any, Dict, List, Literal, Sequence
+from sqlalchemy import String, desc, exists, func, select, type_coerce
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# all: items carrying every tag; any: items carrying at least one
+TagMatch = Literal["all", "any"]
+
+
+def _is_postgres(db: AsyncSession) -> bool:
+    return db.bind.dialect.name == "postgresql"
+
+
+def tag_filter(db: AsyncSession, column: Any, tags: Sequence[str], match: TagMatch = "all"):
+    """WHERE clause selecting rows whose ``column`` has all (or any) of ``tags``."""
+    tags = list(dict.fromkeys(tags))
+    if _is_postgres(db):
+        array_column = type_coerce(column, ARRAY(String))
+        return array_column.contains(tags) if match == "all" else array_column.overlap(tags)
+
+    elements = func.json_each(column).table_valued("value", joins_implicitly=True)
+    if match == "any":
+        return exists().select_from(elements).where(elements.c.value.in_(tags))
+    matched = (
+        select(func.count(func.distinct(elements.c.value)))
+        .select_from(elements)
+        .where(elements.c.value.in_(tags))
+        .scalar_subquery()
+    )
+    return matched == len(tags)
+
+
+async def tag_counts(db: AsyncSession, model: Any, limit: int) -> List[Dict[str, Any]]:
+    """Return ``{"tag", "count"}`` for the ``limit`` most used tags of ``model``, in one query."""
+    if _is_postgres(db):
+        elements = func.unnest(model.tags).table_valued("tag", joins_implicitly=True).render_derived()
+        tag = elements.c.tag
+    else:
+        elements = func.json_each(model.tags).table_valued("value", joins_implicitly=True)
+        tag = elements.c.value
+    count = func.count().label("count")
+    result = await db.execute(
+        select(tag.label("tag"), count)
+        .select_from(model, elements)
+        .group_by(tag)
+        .order_by(desc(count), tag)
+        .limit(limit)
+    )
+    return [{"tag": row.tag, "count": row.count} for row in result]
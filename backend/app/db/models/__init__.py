@@ -4,6 +4,9 @@ from app.db.models.incident import Incident
 from app.db.models.blocker import Blocker
 from app.db.models.decision import Decision, DecisionParticipant, DecisionAuditLog
 from app.db.models.daily_summary import DailySummary
+from app.db.models.refresh_token import RefreshToken
+from app.db.models.job import Job
+from app.db.models.outbox_event import OutboxEvent
 from app.db.base import Base
 
 __all__ = [
@@ -15,5 +18,8 @@ __all__ = [
     "DecisionParticipant",
     "DecisionAuditLog",
     "DailySummary",
+    "RefreshToken",
+    "Job",
+    "OutboxEvent",
     "Base",
 ]
@@ -1,8 +1,16 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, CheckConstraint, Boolean
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, CheckConstraint, Boolean, Index, Computed
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import relationship, deferred
 from sqlalchemy.sql import func
 from app.db.base import Base
 
+# Weighted full-text document: description ranks above impact and resolution notes
+BLOCKER_SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('english', coalesce(description, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(impact, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(resolution_notes, '')), 'C')"
+)
+
 
 class Blocker(Base):
     __tablename__ = "blockers"
@@ -19,6 +27,8 @@ class Blocker(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     resolved_at = Column(DateTime(timezone=True), nullable=True)
+    # Only used in WHERE/ORDER BY, so never loaded with the row
+    search_vector = deferred(Column(TSVECTOR, Computed(BLOCKER_SEARCH_VECTOR_SQL, persisted=True)))
 
     # Relationships
     reported_by = relationship("User", back_populates="blockers")
@@ -31,4 +41,12 @@ class Blocker(Base):
             "status IN ('active', 'resolved')",
             name="check_blocker_status"
         ),
+        Index(
+            "idx_blockers_archived_status_created_at",
+            "archived",
+            "status",
+            "created_at",
+            postgresql_ops={"created_at": "DESC"},
+        ),
+        Index("idx_blockers_search_vector", "search_vector", postgresql_using="gin"),
     )
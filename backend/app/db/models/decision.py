@@ -1,8 +1,17 @@
-from sqlalchemy import Column, Integer, String, Text, Date, DateTime, ForeignKey, CheckConstraint, ARRAY, UniqueConstraint
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Text, Date, DateTime, ForeignKey, CheckConstraint, ARRAY, UniqueConstraint, Index, Computed
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import relationship, deferred
 from sqlalchemy.sql import func
 from app.db.base import Base
 
+# Weighted full-text document: title ranks above description, then context and outcome
+DECISION_SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(context, '')), 'C') || "
+    "setweight(to_tsvector('english', coalesce(outcome, '')), 'C')"
+)
+
 
 class Decision(Base):
     __tablename__ = "decisions"
@@ -17,12 +26,25 @@ class Decision(Base):
     tags = Column(ARRAY(String), nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+    # Only used in WHERE/ORDER BY, so never loaded with the row
+    search_vector = deferred(Column(TSVECTOR, Computed(DECISION_SEARCH_VECTOR_SQL, persisted=True)))
 
     # Relationships
     created_by = relationship("User", foreign_keys=[created_by_id], back_populates="decisions")
     participants = relationship("DecisionParticipant", back_populates="decision", cascade="all, delete-orphan")
     audit_logs = relationship("DecisionAuditLog", back_populates="decision", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        # Keyset pagination order (decision_date DESC, id DESC)
+        Index(
+            "idx_decisions_decision_date_id",
+            "decision_date",
+            "id",
+            postgresql_ops={"decision_date": "DESC", "id": "DESC"},
+        ),
+        Index("idx_decisions_search_vector", "search_vector", postgresql_using="gin"),
+    )
+
 
 class DecisionParticipant(Base):
     __tablename__ = "decision_participants"
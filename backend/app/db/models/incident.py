@@ -1,8 +1,22 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, CheckConstraint, Boolean
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, SmallInteger, String, Text, DateTime, ForeignKey, CheckConstraint, Boolean, Computed, Index
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import relationship, deferred
 from sqlalchemy.sql import func
 from app.db.base import Base
 
+# Numeric severity used for ordering (critical first); stored as a generated column
+SEVERITY_RANK_SQL = (
+    "CASE severity WHEN 'critical' THEN 0 WHEN 'high' THEN 1 "
+    "WHEN 'medium' THEN 2 ELSE 3 END"
+)
+
+# Weighted full-text document: title ranks above description and resolution notes
+INCIDENT_SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(resolution_notes, '')), 'C')"
+)
+
 
 class Incident(Base):
     __tablename__ = "incidents"
@@ -13,12 +27,15 @@ class Incident(Base):
     title = Column(String(200), nullable=False)
     description = Column(Text, nullable=False)
     severity = Column(String(20), nullable=False, default="medium", index=True)
+    severity_rank = Column(SmallInteger, Computed(SEVERITY_RANK_SQL, persisted=True), nullable=False)
     status = Column(String(20), nullable=False, default="open", index=True)
     resolution_notes = Column(Text, nullable=True)
     archived = Column(Boolean, nullable=False, default=False, index=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     resolved_at = Column(DateTime(timezone=True), nullable=True)
+    # Only used in WHERE/ORDER BY, so never loaded with the row
+    search_vector = deferred(Column(TSVECTOR, Computed(INCIDENT_SEARCH_VECTOR_SQL, persisted=True)))
 
     # Relationships
     reported_by = relationship("User", foreign_keys=[reported_by_id], back_populates="reported_incidents")
@@ -35,4 +52,12 @@ class Incident(Base):
             "status IN ('open', 'in_progress', 'resolved', 'closed')",
             name="check_incident_status"
         ),
+        Index(
+            "idx_incidents_archived_severity_rank_created_at",
+            "archived",
+            "severity_rank",
+            "created_at",
+            postgresql_ops={"created_at": "DESC"},
+        ),
+        Index("idx_incidents_search_vector", "search_vector", postgresql_using="gin"),
     )
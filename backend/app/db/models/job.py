@@ -0,0 +1,46 @@
+from sqlalchemy import Column, Integer, SmallInteger, String, Text, DateTime, CheckConstraint, Index
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql import func
+from app.db.base import Base
+
+
+class Job(Base):
+    __tablename__ = "jobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    job_type = Column(String(100), nullable=False)
+    payload = Column(JSONB, nullable=False, default=dict)
+    # Higher runs first
+    priority = Column(SmallInteger, nullable=False, default=0)
+    status = Column(String(20), nullable=False, default="queued")
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=5)
+    # Not claimed before this time (set to the backoff deadline on retry)
+    run_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    locked_at = Column(DateTime(timezone=True), nullable=True)
+    locked_by = Column(String(100), nullable=True)
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        CheckConstraint(
+            "status IN ('queued', 'running', 'succeeded', 'failed')",
+            name="check_job_status"
+        ),
+        # Claim order for runnable jobs; finished jobs stay out of the index
+        Index(
+            "idx_jobs_claim",
+            "job_type",
+            "priority",
+            "run_at",
+            postgresql_ops={"priority": "DESC"},
+            postgresql_where="status IN ('queued', 'running')",
+        ),
+        # Retention purge of finished jobs
+        Index(
+            "idx_jobs_finished_at",
+            "finished_at",
+            postgresql_where="status IN ('succeeded', 'failed')",
+        ),
+    )
@@ -0,0 +1,41 @@
+from sqlalchemy import BigInteger, Column, Integer, String, DateTime, Index, Sequence
+from sqlalchemy.sql import func
+from app.db.base import Base
+
+# Feed positions on PostgreSQL, drawn only by the relay (app.services.outbox.sequence_events)
+outbox_position_seq = Sequence("outbox_events_position_seq", metadata=Base.metadata)
+
+
+class OutboxEvent(Base):
+    """A committed entity change, written in the same transaction as the change itself."""
+
+    __tablename__ = "outbox_events"
+
+    # Allocated at insert, so a transaction that commits late can hold a lower id than events before it
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True)
+    collection = Column(String(50), nullable=False)
+    action = Column(String(50), nullable=False)
+    entity_id = Column(Integer, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    # Commit order, assigned once the event is committed: the order events are relayed and replayed in
+    position = Column(BigInteger().with_variant(Integer, "sqlite"), nullable=True)
+    published_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        # Committed events still waiting for a position
+        Index(
+            "idx_outbox_events_unsequenced",
+            "id",
+            postgresql_where="position IS NULL",
+        ),
+        # Replay after a client's Last-Event-ID
+        Index("idx_outbox_events_position", "position", unique=True),
+        # The relay's backlog; published events stay out of the index
+        Index(
+            "idx_outbox_events_unpublished",
+            "position",
+            postgresql_where="published_at IS NULL",
+        ),
+        # Retention purge of published events
+        Index("idx_outbox_events_published_at", "published_at"),
+    )
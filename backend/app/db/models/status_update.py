@@ -1,8 +1,15 @@
-from sqlalchemy import Column, Integer, String, Text, ARRAY, DateTime, ForeignKey
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Text, ARRAY, DateTime, ForeignKey, Index, Computed
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import relationship, deferred
 from sqlalchemy.sql import func
 from app.db.base import Base
 
+# Weighted full-text document: title ranks above content
+STATUS_UPDATE_SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(content, '')), 'B')"
+)
+
 
 class StatusUpdate(Base):
     __tablename__ = "status_updates"
@@ -14,7 +21,20 @@ class StatusUpdate(Base):
     tags = Column(ARRAY(String), nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+    # Only used in WHERE/ORDER BY, so never loaded with the row
+    search_vector = deferred(Column(TSVECTOR, Computed(STATUS_UPDATE_SEARCH_VECTOR_SQL, persisted=True)))
 
     # Relationships
     user = relationship("User", back_populates="status_updates")
     blockers = relationship("Blocker", back_populates="related_status")
+
+    __table_args__ = (
+        # Keyset pagination order (created_at DESC, id DESC)
+        Index(
+            "idx_status_updates_created_at_id",
+            "created_at",
+            "id",
+            postgresql_ops={"created_at": "DESC", "id": "DESC"},
+        ),
+        Index("idx_status_updates_search_vector", "search_vector", postgresql_using="gin"),
+    )
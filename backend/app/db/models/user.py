@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.db.base import Base
@@ -24,3 +24,10 @@ class User(Base):
     decisions = relationship("Decision", foreign_keys="Decision.created_by_id", back_populates="created_by", cascade="all, delete-orphan")
     decision_participations = relationship("DecisionParticipant", foreign_keys="DecisionParticipant.user_id", back_populates="user", cascade="all, delete-orphan")
     decision_audit_logs = relationship("DecisionAuditLog", foreign_keys="DecisionAuditLog.changed_by_id", back_populates="changed_by", cascade="all, delete-orphan")
+    refresh_tokens = relationship("RefreshToken", back_populates="user", cascade="all, delete-orphan")
+
+    __table_args__ = (
+        # pg_trgm indexes serving the substring/similarity user search
+        Index("idx_users_full_name_trgm", "full_name", postgresql_using="gin", postgresql_ops={"full_name": "gin_trgm_ops"}),
+        Index("idx_users_email_trgm", "email", postgresql_using="gin", postgresql_ops={"email": "gin_trgm_ops"}),
+    )
@@ -1,7 +1,41 @@
+from typing import Optional
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
 
+
+# libpq connection parameters asyncpg names differently
+_ASYNCPG_RENAMED_PARAMS = {"sslmode": "ssl", "connect_timeout": "timeout"}
+# libpq-only parameters asyncpg.connect() rejects; configure these through ASYNC_DATABASE_URL instead
+_LIBPQ_ONLY_PARAMS = {
+    "sslcert", "sslkey", "sslrootcert", "sslcrl", "sslpassword", "sslcompression",
+    "application_name", "options", "client_encoding", "gssencmode", "channel_binding",
+    "keepalives", "keepalives_idle", "keepalives_interval", "keepalives_count",
+}
+
+
+def get_async_database_url(url: str, override: Optional[str] = None) -> str:
+    """Derive the asyncpg URL from the sync DATABASE_URL unless explicitly configured.
+
+    Query parameters meant for libpq (e.g. ``?sslmode=require``) are renamed
+    to their asyncpg equivalents or dropped, since asyncpg rejects them.
+    """
+    if override:
+        return override
+    parsed = make_url(url)
+    if parsed.get_backend_name() not in ("postgresql", "postgres"):
+        return url
+    query = {}
+    for key, value in parsed.query.items():
+        if key in _LIBPQ_ONLY_PARAMS:
+            continue
+        query[_ASYNCPG_RENAMED_PARAMS.get(key, key)] = value
+    return parsed.set(drivername="postgresql+asyncpg", query=query).render_as_string(hide_password=False)
+
+
+# Sync engine: used by scripts, migrations and the background worker
 engine = create_engine(
     settings.DATABASE_URL,
     pool_pre_ping=True,
@@ -10,3 +44,18 @@ engine = create_engine(
 )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+# Async engine: used by the API request handlers so queries don't block the event loop
+async_engine = create_async_engine(
+    get_async_database_url(settings.DATABASE_URL, settings.ASYNC_DATABASE_URL),
+    pool_pre_ping=True,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+)
+
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
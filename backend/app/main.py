@@ -1,10 +1,15 @@
+import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.openapi.docs import get_swagger_ui_html
 from fastapi.responses import HTMLResponse
 from app.core.config import settings
+from app.core.security import get_password_hasher_stats
 from app.api.v1.api import api_router
+from app.db.session import async_engine
+from app.services.change_feed import start_change_listener
 import logging
 import sys
 import os
@@ -17,12 +22,27 @@ logger = logging.getLogger(__name__)
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 STATIC_DIR = os.path.join(BASE_DIR, "static")
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Relay change notifications to this process's /api/events subscribers
+    listener = start_change_listener(async_engine)
+    yield
+    if listener:
+        listener.cancel()
+        try:
+            await listener
+        except asyncio.CancelledError:
+            pass
+
+
 app = FastAPI(
     title="AsyncOps API",
     version="1.0.0",
     description="Async-first operations dashboard API",
     docs_url=None,  # We'll override this with custom endpoint
     redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
 # Log CORS origins for debugging
@@ -72,7 +92,11 @@ app.include_router(api_router, prefix="/api")
 @app.get("/health")
 async def health_check():
     """Health check endpoint for load balancers and monitoring."""
-    return {"status": "healthy", "service": "asyncops-api"}
+    return {
+        "status": "healthy",
+        "service": "asyncops-api",
+        "password_hashing": get_password_hasher_stats(),
+    }
 
 
 @app.get("/")
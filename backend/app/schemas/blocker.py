@@ -1,6 +1,7 @@
 from pydantic import BaseModel, Field
 from datetime import datetime
 from typing import Optional, Literal, List
+from app.schemas.bulk import BULK_CREATE_MAX_ITEMS, BulkSelection
 from app.schemas.user import UserResponse
 
 
@@ -15,6 +16,10 @@ class BlockerCreate(BlockerBase):
     pass
 
 
+class BlockerBulkCreate(BaseModel):
+    items: List[BlockerCreate] = Field(..., min_length=1, max_length=BULK_CREATE_MAX_ITEMS)
+
+
 class BlockerUpdate(BaseModel):
     description: Optional[str] = Field(None, max_length=2000)
     impact: Optional[str] = Field(None, max_length=1000)
@@ -26,6 +31,21 @@ class BlockerResolve(BaseModel):
     resolution_notes: Optional[str] = Field(None, max_length=1000)
 
 
+class BlockerBulkFilter(BaseModel):
+    status: Optional[List[Literal["active", "resolved"]]] = None
+    archived: Optional[bool] = None
+    created_before: Optional[datetime] = None
+    resolved_before: Optional[datetime] = None
+
+
+class BlockerBulkSelection(BulkSelection):
+    filter: Optional[BlockerBulkFilter] = None
+
+
+class BlockerBulkResolve(BlockerBulkSelection):
+    resolution_notes: Optional[str] = Field(None, max_length=1000)
+
+
 class Blocker(BlockerBase):
     id: int
     reported_by_id: int
@@ -43,6 +63,8 @@ class Blocker(BlockerBase):
 
 class BlockerList(BaseModel):
     items: List[Blocker]
-    total: int
+    total: Optional[int] = None
     page: int
     limit: int
+    next_cursor: Optional[str] = None
+    has_more: bool = False
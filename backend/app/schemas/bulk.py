@@ -0,0 +1,33 @@
+from pydantic import BaseModel, Field, model_validator
+from typing import List, Optional
+
+# Most items accepted by one bulk create request
+BULK_CREATE_MAX_ITEMS = 1000
+# Most ids accepted by one bulk update request; larger sets should use a filter
+BULK_UPDATE_MAX_IDS = 10000
+
+
+class BulkCreateResult(BaseModel):
+    created: int
+    # Ids of the new rows, in request order
+    ids: List[int]
+
+
+class BulkSelection(BaseModel):
+    """Rows a bulk update applies to: an id list or a filter (subclasses type it), not both."""
+    ids: Optional[List[int]] = Field(None, min_length=1, max_length=BULK_UPDATE_MAX_IDS)
+    filter: Optional[BaseModel] = None
+
+    @model_validator(mode="after")
+    def check_selection(self):
+        if (self.ids is None) == (self.filter is None):
+            raise ValueError("Provide exactly one of ids or filter")
+        # An empty filter would select every row
+        if self.filter is not None and not self.filter.model_dump(exclude_none=True):
+            raise ValueError("filter must set at least one condition")
+        return self
+
+
+class BulkUpdateResult(BaseModel):
+    # Rows changed; rows already in the target state are not counted
+    affected: int
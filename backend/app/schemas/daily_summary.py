@@ -1,6 +1,6 @@
 from pydantic import BaseModel
 from datetime import datetime, date
-from typing import List
+from typing import List, Optional
 
 
 class DailySummaryStatusUpdate(BaseModel):
@@ -73,6 +73,14 @@ class DailySummary(BaseModel):
 
 class DailySummaryList(BaseModel):
     items: List[DailySummaryListItem]
-    total: int
+    total: Optional[int] = None
     page: int
     limit: int
+    next_cursor: Optional[str] = None
+    has_more: bool = False
+
+
+class DailySummaryBackfill(BaseModel):
+    job_ids: List[int]
+    queued: List[date]
+    skipped: List[date]
@@ -0,0 +1,21 @@
+from pydantic import BaseModel
+from datetime import datetime
+from typing import List
+from app.schemas.decision import Decision
+from app.schemas.status_update import StatusUpdate
+
+
+class IncidentSeverityCounts(BaseModel):
+    critical: int = 0
+    high: int = 0
+    medium: int = 0
+    low: int = 0
+
+
+class Dashboard(BaseModel):
+    open_incidents: int
+    open_incidents_by_severity: IncidentSeverityCounts
+    active_blockers: int
+    recent_status_updates: List[StatusUpdate]
+    recent_decisions: List[Decision]
+    generated_at: datetime
@@ -1,6 +1,7 @@
 from pydantic import BaseModel, Field
 from datetime import datetime, date
 from typing import Optional, List
+from app.schemas.bulk import BULK_CREATE_MAX_ITEMS
 from app.schemas.user import UserResponse
 
 
@@ -18,6 +19,10 @@ class DecisionCreate(DecisionBase):
     pass
 
 
+class DecisionBulkCreate(BaseModel):
+    items: List[DecisionCreate] = Field(..., min_length=1, max_length=BULK_CREATE_MAX_ITEMS)
+
+
 class DecisionUpdate(BaseModel):
     title: Optional[str] = Field(None, max_length=200)
     description: Optional[str] = Field(None, max_length=5000)
@@ -52,9 +57,11 @@ class Decision(DecisionBase):
 
 class DecisionList(BaseModel):
     items: List[Decision]
-    total: int
+    total: Optional[int] = None
     page: int
     limit: int
+    next_cursor: Optional[str] = None
+    has_more: bool = False
 
 
 class DecisionAuditLogEntry(BaseModel):
@@ -1,6 +1,7 @@
 from pydantic import BaseModel, Field
 from datetime import datetime
 from typing import Optional, Literal, List
+from app.schemas.bulk import BULK_CREATE_MAX_ITEMS, BulkSelection
 from app.schemas.user import UserResponse
 
 
@@ -15,6 +16,10 @@ class IncidentCreate(IncidentBase):
     pass
 
 
+class IncidentBulkCreate(BaseModel):
+    items: List[IncidentCreate] = Field(..., min_length=1, max_length=BULK_CREATE_MAX_ITEMS)
+
+
 class IncidentUpdate(BaseModel):
     title: Optional[str] = Field(None, max_length=200)
     description: Optional[str] = Field(None, max_length=5000)
@@ -31,6 +36,23 @@ class IncidentAssign(BaseModel):
     assigned_to_id: Optional[int] = None
 
 
+class IncidentBulkFilter(BaseModel):
+    status: Optional[List[Literal["open", "in_progress", "resolved", "closed"]]] = None
+    severity: Optional[List[Literal["low", "medium", "high", "critical"]]] = None
+    archived: Optional[bool] = None
+    created_before: Optional[datetime] = None
+    resolved_before: Optional[datetime] = None
+
+
+class IncidentBulkSelection(BulkSelection):
+    filter: Optional[IncidentBulkFilter] = None
+
+
+class IncidentBulkStatusUpdate(IncidentBulkSelection):
+    status: Literal["open", "in_progress", "resolved", "closed"]
+    resolution_notes: Optional[str] = Field(None, max_length=5000)
+
+
 class Incident(IncidentBase):
     id: int
     reported_by_id: int
@@ -49,6 +71,8 @@ class Incident(IncidentBase):
 
 class IncidentList(BaseModel):
     items: List[Incident]
-    total: int
+    total: Optional[int] = None
     page: int
     limit: int
+    next_cursor: Optional[str] = None
+    has_more: bool = False
@@ -0,0 +1,19 @@
+from pydantic import BaseModel
+from datetime import datetime
+from typing import List, Literal, Optional
+
+
+class SearchHit(BaseModel):
+    type: Literal["status_update", "incident", "blocker", "decision"]
+    id: int
+    title: str
+    created_at: datetime
+    rank: float
+
+
+class SearchResults(BaseModel):
+    items: List[SearchHit]
+    total: Optional[int] = None
+    page: int
+    limit: int
+    has_more: bool = False
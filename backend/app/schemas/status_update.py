@@ -1,6 +1,7 @@
 from pydantic import BaseModel, Field
 from datetime import datetime
 from typing import Optional, List
+from app.schemas.bulk import BULK_CREATE_MAX_ITEMS
 from app.schemas.user import UserResponse
 
 
@@ -14,6 +15,10 @@ class StatusUpdateCreate(StatusUpdateBase):
     pass
 
 
+class StatusUpdateBulkCreate(BaseModel):
+    items: List[StatusUpdateCreate] = Field(..., min_length=1, max_length=BULK_CREATE_MAX_ITEMS)
+
+
 class StatusUpdateUpdate(BaseModel):
     title: Optional[str] = Field(None, max_length=200)
     content: Optional[str] = Field(None, max_length=10000)
@@ -33,6 +38,8 @@ class StatusUpdate(StatusUpdateBase):
 
 class StatusUpdateList(BaseModel):
     items: List[StatusUpdate]
-    total: int
+    total: Optional[int] = None
     page: int
     limit: int
+    next_cursor: Optional[str] = None
+    has_more: bool = False
@@ -0,0 +1,12 @@
+from pydantic import BaseModel
+from typing import List
+
+
+class TagCount(BaseModel):
+    tag: str
+    count: int
+
+
+class TagFacets(BaseModel):
+    collection: str
+    tags: List[TagCount]
@@ -0,0 +1,49 @@
+"""
+Script to generate daily summaries for a range of dates.
+Usage: python -m app.scripts.backfill_summaries <start_date> <end_date> [--force] [--concurrency N]
+
+Dates are ISO formatted (YYYY-MM-DD). Dates that already have a summary are
+skipped unless --force is given, so an interrupted run can simply be repeated.
+"""
+import argparse
+import asyncio
+import sys
+from datetime import date
+from app.db.session import AsyncSessionLocal, async_engine
+from app.services.summary_service import backfill_daily_summaries
+
+
+async def backfill(start_date: date, end_date: date, force_update: bool, concurrency: int):
+    """Run the backfill and release the engine's connections."""
+    try:
+        return await backfill_daily_summaries(
+            AsyncSessionLocal,
+            start_date,
+            end_date,
+            force_update=force_update,
+            concurrency=concurrency
+        )
+    finally:
+        await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate daily summaries for a date range.")
+    parser.add_argument("start_date", type=date.fromisoformat)
+    parser.add_argument("end_date", type=date.fromisoformat)
+    parser.add_argument("--force", action="store_true", help="rebuild summaries that already exist")
+    parser.add_argument("--concurrency", type=int, default=None, help="dates generated at once")
+    args = parser.parse_args()
+
+    if args.end_date < args.start_date:
+        print("end_date must not be before start_date")
+        sys.exit(1)
+
+    result = asyncio.run(backfill(args.start_date, args.end_date, args.force, args.concurrency))
+    print(
+        f"Generated {len(result['generated'])}, skipped {len(result['skipped'])}, "
+        f"failed {len(result['failed'])} summaries"
+    )
+    if result["failed"]:
+        print("Failed dates: " + ", ".join(d.isoformat() for d in result["failed"]))
+        sys.exit(1)
@@ -0,0 +1,155 @@
+"""
+Live feed of committed entity changes for connected clients.
+
+Write handlers call ``record_change`` before committing. The change is
+written to the transactional outbox (``app.services.outbox``), whose
+``position``, assigned in commit order, becomes the event id clients resume
+from. On PostgreSQL the outbox relay sequences committed events and sends
+them with ``pg_notify`` to every API process LISTENing on CHANGE_CHANNEL, so
+they arrive within OUTBOX_RELAY_POLL_INTERVAL_SECONDS of the commit; each
+process fans events out to its own subscribers (the ``/api/events`` streams).
+Databases without NOTIFY (SQLite in development) broadcast in-process after
+the commit instead.
+"""
+import asyncio
+import json
+import logging
+from typing import Any, Dict, Optional, Sequence, Set
+from sqlalchemy import Text, event, func, literal, select
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import Session
+from app.core.cache import bump_collection_version
+from app.core.config import settings
+from app.db.models.outbox_event import OutboxEvent
+
+logger = logging.getLogger(__name__)
+
+CHANGE_CHANNEL = "asyncops_changes"
+
+# Session.info key for changes awaiting commit on databases without NOTIFY
+_PENDING_CHANGES = "pending_changes"
+
+
+class ChangeFeed:
+    """In-process fan-out of change events to subscriber queues."""
+
+    def __init__(self, queue_size: int):
+        self.queue_size = queue_size
+        self._subscribers: Set[asyncio.Queue] = set()
+
+    def subscribe(self) -> asyncio.Queue:
+        """Return a queue receiving every published event; None means the stream must end."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        self._subscribers.discard(queue)
+
+    def publish(self, change: Dict[str, Any]) -> None:
+        # Events from other processes also expire this process's version-keyed caches
+        bump_collection_version(change["collection"])
+        for queue in list(self._subscribers):
+            try:
+                queue.put_nowait(change)
+            except asyncio.QueueFull:
+                # A client this far behind has to reload anyway; end its stream so it reconnects
+                self._subscribers.discard(queue)
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(None)
+
+    def __len__(self) -> int:
+        return len(self._subscribers)
+
+
+change_feed = ChangeFeed(settings.EVENTS_QUEUE_SIZE)
+
+
+async def record_change(db: AsyncSession, collection: str, action: str, entity_id: int) -> None:
+    """Record a change to ``collection`` in the outbox and announce it once the transaction commits."""
+    await record_changes(db, collection, action, [entity_id])
+
+
+async def record_changes(db: AsyncSession, collection: str, action: str, entity_ids: Sequence[int]) -> None:
+    """Record the same change to several entities in the outbox, announced once the transaction commits."""
+    outbox_events = [
+        OutboxEvent(collection=collection, action=action, entity_id=entity_id) for entity_id in entity_ids
+    ]
+    if not outbox_events:
+        return
+    db.add_all(outbox_events)
+    if db.bind.dialect.name == "postgresql":
+        # The outbox relay positions and announces the events once they're committed
+        return
+
+    # Assigns the event ids; with one write transaction at a time they're already in commit order
+    await db.flush()
+    changes = []
+    for outbox_event in outbox_events:
+        outbox_event.position = outbox_event.id
+        changes.append({
+            "event_id": outbox_event.id,
+            "position": outbox_event.position,
+            "collection": collection,
+            "action": action,
+            "id": outbox_event.entity_id,
+        })
+    db.sync_session.info.setdefault(_PENDING_CHANGES, []).extend(changes)
+
+
+def notify_changes(changes: Sequence[Dict[str, Any]]):
+    """One ``pg_notify`` statement sending each of ``changes`` on CHANGE_CHANNEL, delivered at commit."""
+    payloads = func.unnest(
+        literal([json.dumps(change) for change in changes], ARRAY(Text))
+    ).table_valued("payload")
+    return select(func.pg_notify(CHANGE_CHANNEL, payloads.c.payload))
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_pending_changes(session: Session) -> None:
+    for change in session.info.pop(_PENDING_CHANGES, []):
+        change_feed.publish(change)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_changes(session: Session) -> None:
+    session.info.pop(_PENDING_CHANGES, None)
+
+
+def _on_notify(connection, pid: int, channel: str, payload: str) -> None:
+    try:
+        change_feed.publish(json.loads(payload))
+    except (ValueError, KeyError):
+        logger.warning("Ignoring malformed change notification: %r", payload)
+
+
+async def listen_for_changes(engine: AsyncEngine) -> None:
+    """Relay NOTIFY payloads to local subscribers until cancelled, reconnecting on failure."""
+    while True:
+        try:
+            async with engine.connect() as conn:
+                raw = (await conn.get_raw_connection()).driver_connection
+                await raw.add_listener(CHANGE_CHANNEL, _on_notify)
+                logger.info("Listening for changes on %s", CHANGE_CHANNEL)
+                try:
+                    while True:
+                        await asyncio.sleep(settings.EVENTS_HEARTBEAT_SECONDS)
+                        # Outside any transaction, so notifications keep flowing; raises if the link dropped
+                        await raw.execute("SELECT 1")
+                finally:
+                    if not raw.is_closed():
+                        await raw.remove_listener(CHANGE_CHANNEL, _on_notify)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Change listener connection failed")
+        await asyncio.sleep(settings.EVENTS_RECONNECT_SECONDS)
+
+
+def start_change_listener(engine: AsyncEngine) -> Optional[asyncio.Task]:
+    """Start relaying notifications on PostgreSQL; other databases publish in-process."""
+    if engine.dialect.name != "postgresql":
+        return None
+    return asyncio.create_task(listen_for_changes(engine))
@@ -0,0 +1,44 @@
+"""
+Handlers for background job types.
+
+Importing this module registers the handlers with the job queue; the API
+imports it to validate job types and the job worker to run them.
+"""
+from datetime import date
+from typing import Any, Dict
+from sqlalchemy.orm import Session
+from app.core.response_cache import invalidate_sync
+from app.services.job_queue import job_handler, purge_finished_jobs
+from app.services.summary_service import apply_summary_changes, create_daily_summary
+from app.services.token_service import purge_refresh_tokens
+
+
+@job_handler("generate_daily_summary", concurrency=2)
+def generate_daily_summary(db: Session, payload: Dict[str, Any]) -> None:
+    """Payload: optional ``summary_date`` (ISO date, default today) and ``force_update``."""
+    summary_date = payload.get("summary_date")
+    create_daily_summary(
+        db,
+        summary_date=date.fromisoformat(summary_date) if summary_date else None,
+        force_update=bool(payload.get("force_update", False))
+    )
+    invalidate_sync("daily_summaries")
+
+
+@job_handler("apply_summary_changes")
+def fold_summary_changes(db: Session, payload: Dict[str, Any]) -> None:
+    """Payload: ``kind`` and the ``ids`` of the changed items (see ``record_summary_changes``)."""
+    apply_summary_changes(db, payload["kind"], payload["ids"])
+    invalidate_sync("daily_summaries")
+
+
+@job_handler("purge_refresh_tokens")
+def purge_expired_refresh_tokens(db: Session, payload: Dict[str, Any]) -> None:
+    """Payload: none. Deletes expired and long-revoked refresh tokens."""
+    purge_refresh_tokens(db)
+
+
+@job_handler("purge_finished_jobs")
+def purge_old_jobs(db: Session, payload: Dict[str, Any]) -> None:
+    """Payload: none. Deletes succeeded and failed jobs past JOB_RETENTION_DAYS."""
+    purge_finished_jobs(db)
@@ -0,0 +1,206 @@
+"""
+Durable background job queue stored in the ``jobs`` table.
+
+Jobs are enqueued in the caller's transaction, so they only become visible
+if the surrounding change commits. Workers (``app.workers.job_worker``) claim
+them with ``SELECT ... FOR UPDATE SKIP LOCKED``, so any number of worker
+processes can share the queue without claiming the same job twice. While a
+job runs its worker refreshes ``locked_at`` every JOB_HEARTBEAT_SECONDS; a
+claim that stops being refreshed for JOB_LOCK_TIMEOUT_SECONDS belongs to a
+dead worker.
+"""
+import logging
+import os
+import socket
+import traceback
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Optional, Sequence
+from sqlalchemy import and_, delete, or_, select, update
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.db.models.job import Job
+
+logger = logging.getLogger(__name__)
+
+JobHandler = Callable[[Session, Dict[str, Any]], None]
+
+
+@dataclass(frozen=True)
+class JobType:
+    handler: JobHandler
+    # Most jobs of this type running at once in one worker process
+    concurrency: int
+    max_attempts: int
+
+
+_job_types: Dict[str, JobType] = {}
+
+
+def job_handler(job_type: str, concurrency: int = 1, max_attempts: Optional[int] = None):
+    """Register the decorated function as the handler for ``job_type``.
+
+    The handler receives its own session and the job payload. It may commit;
+    raising marks the attempt failed and schedules a retry with backoff.
+    ``concurrency`` applies per worker process, so up to ``concurrency`` times
+    the number of worker processes can run at once across the deployment.
+    """
+    def register(handler: JobHandler) -> JobHandler:
+        _job_types[job_type] = JobType(
+            handler=handler,
+            concurrency=concurrency,
+            max_attempts=max_attempts or settings.JOB_MAX_ATTEMPTS,
+        )
+        return handler
+    return register
+
+
+def get_job_types() -> Dict[str, JobType]:
+    return dict(_job_types)
+
+
+def worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def enqueue_job(
+    db,
+    job_type: str,
+    payload: Optional[Dict[str, Any]] = None,
+    priority: int = 0,
+    run_at: Optional[datetime] = None
+) -> Job:
+    """Add a job to the caller's session (sync or async; does not commit)."""
+    registered = _job_types.get(job_type)
+    if registered is None:
+        raise ValueError(f"Unknown job type: {job_type}")
+    job = Job(
+        job_type=job_type,
+        payload=payload or {},
+        priority=priority,
+        status="queued",
+        attempts=0,
+        max_attempts=registered.max_attempts,
+        run_at=run_at or datetime.now(timezone.utc),
+    )
+    db.add(job)
+    return job
+
+
+def claim_job(db: Session, job_types: Sequence[str], locked_by: str) -> Optional[Job]:
+    """Claim the highest-priority runnable job of the given types and commit the claim.
+
+    Runnable means queued and due, or running under a lock older than
+    JOB_LOCK_TIMEOUT_SECONDS (its worker is presumed dead) with attempts
+    left. Such orphaned jobs without attempts left are marked failed.
+    """
+    if not job_types:
+        return None
+    now = datetime.now(timezone.utc)
+    stale = now - timedelta(seconds=settings.JOB_LOCK_TIMEOUT_SECONDS)
+    orphaned = and_(Job.job_type.in_(job_types), Job.status == "running", Job.locked_at < stale)
+    db.execute(
+        update(Job)
+        .where(orphaned, Job.attempts >= Job.max_attempts)
+        .values(
+            status="failed",
+            locked_at=None,
+            finished_at=now,
+            last_error="Worker stopped responding and no attempts are left"
+        ),
+        execution_options={"synchronize_session": False},
+    )
+    job = db.execute(
+        select(Job)
+        .where(
+            Job.job_type.in_(job_types),
+            or_(
+                and_(Job.status == "queued", Job.run_at <= now),
+                and_(orphaned, Job.attempts < Job.max_attempts),
+            )
+        )
+        .order_by(Job.priority.desc(), Job.run_at, Job.id)
+        .limit(1)
+        .with_for_update(skip_locked=True)
+    ).scalar_one_or_none()
+    if job is None:
+        db.commit()
+        return None
+
+    job.status = "running"
+    job.attempts += 1
+    job.locked_at = now
+    job.locked_by = locked_by
+    db.commit()
+    # Load the committed state so the job stays usable once this session closes
+    db.refresh(job)
+    return job
+
+
+def heartbeat_jobs(db: Session, locked_by: str) -> int:
+    """Refresh ``locked_at`` on every job ``locked_by`` is running; returns how many."""
+    result = db.execute(
+        update(Job)
+        .where(Job.status == "running", Job.locked_by == locked_by)
+        .values(locked_at=datetime.now(timezone.utc))
+    )
+    db.commit()
+    return result.rowcount
+
+
+def purge_finished_jobs(db: Session) -> int:
+    """Delete succeeded and failed jobs finished over JOB_RETENTION_DAYS ago; returns how many were deleted."""
+    cutoff = datetime.now(timezone.utc) - timedelta(days=settings.JOB_RETENTION_DAYS)
+    result = db.execute(
+        delete(Job).where(Job.status.in_(("succeeded", "failed")), Job.finished_at < cutoff)
+    )
+    db.commit()
+    return result.rowcount
+
+
+def retry_delay(attempts: int) -> timedelta:
+    """Exponential backoff after the ``attempts``-th failed attempt."""
+    seconds = settings.JOB_RETRY_BACKOFF_SECONDS * 2 ** (attempts - 1)
+    return timedelta(seconds=min(seconds, settings.JOB_RETRY_BACKOFF_MAX_SECONDS))
+
+
+def _owned(job: Job, locked_by: str):
+    # Only the worker holding the claim may finish it; a reclaimed job belongs to its new worker
+    return update(Job).where(Job.id == job.id, Job.status == "running", Job.locked_by == locked_by)
+
+
+def complete_job(db: Session, job: Job, locked_by: str) -> None:
+    db.execute(
+        _owned(job, locked_by).values(
+            status="succeeded", locked_at=None, finished_at=datetime.now(timezone.utc), last_error=None
+        )
+    )
+    db.commit()
+
+
+def fail_job(db: Session, job: Job, locked_by: str, error: str) -> None:
+    """Requeue the job with backoff, or mark it failed once attempts are used up."""
+    now = datetime.now(timezone.utc)
+    if job.attempts >= job.max_attempts:
+        values = {"status": "failed", "finished_at": now}
+    else:
+        values = {"status": "queued", "run_at": now + retry_delay(job.attempts)}
+    db.execute(_owned(job, locked_by).values(locked_at=None, last_error=error, **values))
+    db.commit()
+
+
+def run_job(session_factory, job: Job, locked_by: str) -> bool:
+    """Run a claimed job's handler and record the outcome; returns whether it succeeded."""
+    db = session_factory()
+    try:
+        try:
+            _job_types[job.job_type].handler(db, dict(job.payload or {}))
+        except Exception:
+            db.rollback()
+            logger.exception("Job %s (%s) attempt %d failed", job.id, job.job_type, job.attempts)
+            fail_job(db, job, locked_by, traceback.format_exc(limit=5))
+            return False
+        complete_job(db, job, locked_by)
+        return True
+    finally:
+        db.close()
@@ -0,0 +1,174 @@
+"""
+Transactional outbox of entity changes.
+
+``app.services.change_feed.record_change`` adds an ``outbox_events`` row in
+the same transaction as each change, so the outbox holds exactly the changes
+that committed. Event ids are allocated at insert, before commit, so they
+aren't commit order: a transaction that commits late can hold a lower id
+than events already delivered. The relay (``app.workers.outbox_relay``)
+therefore first gives committed events a ``position`` (``sequence_events``)
+and announces them to the API processes; since only committed rows are
+visible to it and one relay sequences at a time, positions follow commit
+order. It then hands unpublished events, in position order, to every
+registered publisher in batches and marks them published once all publishers
+accept the batch. A failing publisher stops the relay at that batch, so later
+events are never delivered ahead of it.
+"""
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional
+import httpx
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.db.models.outbox_event import OutboxEvent, outbox_position_seq
+from app.services.change_feed import notify_changes
+
+logger = logging.getLogger(__name__)
+
+# Advisory lock keys: one relay at a time sequences events, and one publishes, which keeps order.
+# They're separate so a slow publisher doesn't hold up the live feed.
+OUTBOX_SEQUENCE_LOCK_KEY = 0x4153_4f51  # "ASOQ"
+OUTBOX_RELAY_LOCK_KEY = 0x4153_4f58  # "ASOX"
+
+OutboxPublisher = Callable[[List[Dict[str, Any]]], None]
+
+_publishers: Dict[str, OutboxPublisher] = {}
+
+
+def outbox_publisher(name: str):
+    """Register the decorated function to receive each batch of relayed events.
+
+    Publishers get the serialized events in order and must raise if the batch
+    wasn't delivered; the whole batch is retried, so delivery is at least once.
+    """
+    def register(publisher: OutboxPublisher) -> OutboxPublisher:
+        _publishers[name] = publisher
+        return publisher
+    return register
+
+
+def get_outbox_publishers() -> Dict[str, OutboxPublisher]:
+    return dict(_publishers)
+
+
+def serialize_event(event: OutboxEvent) -> Dict[str, Any]:
+    return {
+        "event_id": event.id,
+        "position": event.position,
+        "collection": event.collection,
+        "action": event.action,
+        "id": event.entity_id,
+        "created_at": event.created_at.isoformat() if event.created_at else None,
+    }
+
+
+def _try_lock(db: Session, key: int) -> bool:
+    """Take a transaction-level advisory lock on PostgreSQL; other databases serialize writers anyway."""
+    if db.bind.dialect.name != "postgresql":
+        return True
+    # Released at commit/rollback; a relay that can't get it leaves the work to the holder
+    locked = db.execute(select(func.pg_try_advisory_xact_lock(key))).scalar()
+    if not locked:
+        db.rollback()
+    return locked
+
+
+def sequence_events(db: Session, batch_size: Optional[int] = None) -> int:
+    """Give committed events the next positions, announce them and commit; returns how many were sequenced.
+
+    On databases without sequences (SQLite in development) ``record_changes``
+    already uses the id as the position, since only one write transaction runs
+    at a time there; this just covers rows added any other way.
+    """
+    if db.bind.dialect.name != "postgresql":
+        result = db.execute(
+            update(OutboxEvent).where(OutboxEvent.position.is_(None)).values(position=OutboxEvent.id)
+        )
+        db.commit()
+        return result.rowcount
+    if not _try_lock(db, OUTBOX_SEQUENCE_LOCK_KEY):
+        return 0
+
+    # nextval is evaluated after ORDER BY/LIMIT, so events sequenced together keep their id order
+    pending = (
+        select(OutboxEvent.id, outbox_position_seq.next_value().label("position"))
+        .where(OutboxEvent.position.is_(None))
+        .order_by(OutboxEvent.id)
+        .limit(batch_size or settings.OUTBOX_RELAY_BATCH_SIZE)
+        .subquery()
+    )
+    rows = db.execute(
+        update(OutboxEvent)
+        .where(OutboxEvent.id == pending.c.id)
+        .values(position=pending.c.position)
+        .returning(
+            OutboxEvent.id, OutboxEvent.position, OutboxEvent.collection, OutboxEvent.action, OutboxEvent.entity_id
+        ),
+        execution_options={"synchronize_session": False},
+    ).all()
+    if not rows:
+        db.rollback()
+        return 0
+
+    # Delivered with the commit, so listeners never see a position before it is readable for replay
+    db.execute(notify_changes([
+        {"event_id": row.id, "position": row.position, "collection": row.collection,
+         "action": row.action, "id": row.entity_id}
+        for row in sorted(rows, key=lambda row: row.position)
+    ]))
+    db.commit()
+    return len(rows)
+
+
+def relay_batch(db: Session, batch_size: Optional[int] = None) -> int:
+    """Publish the earliest sequenced, unpublished events and commit; returns how many were published."""
+    if not _try_lock(db, OUTBOX_RELAY_LOCK_KEY):
+        return 0
+
+    events = db.execute(
+        select(OutboxEvent)
+        .where(OutboxEvent.published_at.is_(None), OutboxEvent.position.is_not(None))
+        .order_by(OutboxEvent.position)
+        .limit(batch_size or settings.OUTBOX_RELAY_BATCH_SIZE)
+    ).scalars().all()
+    if not events:
+        db.rollback()
+        return 0
+
+    batch = [serialize_event(event) for event in events]
+    try:
+        for publisher in _publishers.values():
+            publisher(batch)
+    except Exception:
+        db.rollback()
+        raise
+
+    db.execute(
+        update(OutboxEvent)
+        .where(OutboxEvent.id.in_([event.id for event in events]))
+        .values(published_at=datetime.now(timezone.utc))
+    )
+    db.commit()
+    return len(events)
+
+
+def purge_published_events(db: Session) -> int:
+    """Delete published events older than OUTBOX_RETENTION_DAYS; returns how many were deleted."""
+    cutoff = datetime.now(timezone.utc) - timedelta(days=settings.OUTBOX_RETENTION_DAYS)
+    result = db.execute(delete(OutboxEvent).where(OutboxEvent.published_at < cutoff))
+    db.commit()
+    return result.rowcount
+
+
+@outbox_publisher("webhook")
+def publish_to_webhook(events: List[Dict[str, Any]]) -> None:
+    """POST each batch to OUTBOX_WEBHOOK_URL, if configured."""
+    if not settings.OUTBOX_WEBHOOK_URL:
+        return
+    response = httpx.post(
+        settings.OUTBOX_WEBHOOK_URL,
+        json={"events": events},
+        timeout=settings.OUTBOX_WEBHOOK_TIMEOUT_SECONDS,
+    )
+    response.raise_for_status()
@@ -1,147 +1,362 @@
-from datetime import datetime, timedelta, timezone, date
-from typing import Optional, Dict, Any
+import asyncio
+import logging
+from datetime import datetime, time, timedelta, timezone, date
+from typing import Optional, Dict, Any, List, Sequence
 from sqlalchemy.orm import Session
-from sqlalchemy import desc, func
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy import and_, desc, func, or_, select
+from app.core.config import settings
 from app.db.models.daily_summary import DailySummary
 from app.db.models.status_update import StatusUpdate
 from app.db.models.incident import Incident
 from app.db.models.blocker import Blocker
 from app.db.models.decision import Decision
 from app.db.models.user import User
+from app.services.job_queue import enqueue_job
 
 
-def _build_summary_content(db: Session, now: datetime) -> Dict[str, Any]:
-    import logging
-    logger = logging.getLogger(__name__)
-    
-    since = now - timedelta(hours=24)
-    decisions_since = (now.date() - timedelta(days=7))
+ACTIVE_INCIDENT_STATUSES = ("open", "in_progress")
+SEVERITY_ORDER = {"critical": 0, "high": 1, "medium": 2}
+
+
+def _status_update_item(update, author: Optional[str]) -> Dict[str, Any]:
+    return {
+        "id": update.id,
+        "title": update.title,
+        "author": author or "Unknown",
+        "created_at": update.created_at.isoformat(),
+    }
+
+
+def _incident_item(incident) -> Dict[str, Any]:
+    return {
+        "id": incident.id,
+        "title": incident.title,
+        "severity": incident.severity,
+        "status": incident.status,
+    }
+
+
+def _blocker_item(blocker) -> Dict[str, Any]:
+    return {
+        "id": blocker.id,
+        "description": blocker.description,
+        "status": blocker.status,
+    }
+
+
+def _decision_item(decision) -> Dict[str, Any]:
+    return {
+        "id": decision.id,
+        "title": decision.title,
+        "decision_date": decision.decision_date.isoformat(),
+    }
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def _windows(now: datetime):
+    """Return (status updates since, decisions since) for a summary built at ``now``."""
+    return now - timedelta(hours=24), now.date() - timedelta(days=7)
 
-    logger.info(f"_build_summary_content: now={now}, since={since}, decisions_since={decisions_since}")
 
-    status_updates = (
-        db.query(StatusUpdate)
-        .join(User)
-        .filter(StatusUpdate.created_at >= since)
-        .order_by(desc(StatusUpdate.created_at))
-        .all()
+def summary_as_of(summary_date: date, now: datetime) -> datetime:
+    """Return the moment whose data the summary for ``summary_date`` describes.
+
+    Today's (or a future) summary reflects the data at ``now``; a past date
+    reflects the data at that day's scheduled run time, as the scheduler
+    would have produced it.
+    """
+    if summary_date >= now.date():
+        return now
+    return datetime.combine(
+        summary_date,
+        time(settings.DAILY_SUMMARY_RUN_HOUR_UTC, settings.DAILY_SUMMARY_RUN_MINUTE_UTC),
+        tzinfo=timezone.utc,
     )
-    logger.info(f"Found {len(status_updates)} status updates")
+
+
+def _build_summary_content(db: Session, now: datetime, historical: bool = False) -> Dict[str, Any]:
+    """Build summary content from the source tables as of ``now``.
+
+    With ``historical`` the windows are also bounded above by ``now``, and
+    incidents and blockers resolved after it count as still active. Other
+    status changes and archiving are not versioned, so they apply as they
+    stand today.
+    """
+    logger = logging.getLogger(__name__)
     
-    incidents = (
-        db.query(Incident)
-        .filter(
-            Incident.archived.is_(False),
-            Incident.status.in_(["open", "in_progress"])
+    since, decisions_since = _windows(now)
+
+    logger.info(f"_build_summary_content: now={now}, since={since}, decisions_since={decisions_since}, historical={historical}")
+
+    status_filter = StatusUpdate.created_at >= since
+    incident_active = Incident.status.in_(ACTIVE_INCIDENT_STATUSES)
+    blocker_active = Blocker.status == "active"
+    decision_filter = Decision.decision_date >= decisions_since
+    if historical:
+        status_filter = and_(status_filter, StatusUpdate.created_at < now)
+        incident_active = and_(
+            Incident.created_at <= now,
+            or_(incident_active, Incident.resolved_at > now)
         )
-        .order_by(desc(Incident.severity), desc(Incident.created_at))
-        .all()
-    )
-    logger.info(f"Found {len(incidents)} active incidents")
-    
-    blockers = (
-        db.query(Blocker)
-        .filter(Blocker.archived.is_(False), Blocker.status == "active")
-        .order_by(desc(Blocker.created_at))
-        .all()
-    )
-    logger.info(f"Found {len(blockers)} active blockers")
-    
-    decisions = (
-        db.query(Decision)
-        .filter(Decision.decision_date >= decisions_since)
-        .order_by(desc(Decision.decision_date))
-        .all()
-    )
-    logger.info(f"Found {len(decisions)} recent decisions")
-
-    critical_incidents = (
-        db.query(func.count(Incident.id))
-        .filter(
-            Incident.archived.is_(False),
-            Incident.status.in_(["open", "in_progress"]),
-            Incident.severity == "critical"
+        blocker_active = and_(
+            Blocker.created_at <= now,
+            or_(blocker_active, Blocker.resolved_at > now)
+        )
+        decision_filter = and_(decision_filter, Decision.decision_date <= now.date())
+    incident_filter = and_(Incident.archived.is_(False), incident_active)
+    blocker_filter = and_(Blocker.archived.is_(False), blocker_active)
+
+    # All statistics in one round trip; critical incidents come from the same
+    # aggregate as the active incident count (COUNT ... FILTER)
+    stats = db.execute(
+        select(
+            select(func.count(StatusUpdate.id)).where(status_filter).scalar_subquery().label("status_updates"),
+            select(func.count(Incident.id)).where(incident_filter).scalar_subquery().label("incidents"),
+            select(func.count(Incident.id).filter(Incident.severity == "critical"))
+            .where(incident_filter).scalar_subquery().label("critical_incidents"),
+            select(func.count(Blocker.id)).where(blocker_filter).scalar_subquery().label("blockers"),
+            select(func.count(Decision.id)).where(decision_filter).scalar_subquery().label("decisions"),
         )
-        .scalar()
-        or 0
+    ).one()
+    logger.info(
+        f"Found {stats.status_updates} status updates, {stats.incidents} active incidents, "
+        f"{stats.blockers} active blockers, {stats.decisions} recent decisions"
     )
 
+    # Column-only projections: no ORM identity map, no per-row relationship loads
+    status_updates = db.execute(
+        select(StatusUpdate.id, StatusUpdate.title, StatusUpdate.created_at, User.full_name)
+        .join(User, StatusUpdate.user_id == User.id)
+        .where(status_filter)
+        .order_by(desc(StatusUpdate.created_at), desc(StatusUpdate.id))
+    ).all()
+
+    incidents = db.execute(
+        select(Incident.id, Incident.title, Incident.severity, Incident.status)
+        .where(incident_filter)
+        .order_by(Incident.severity_rank, desc(Incident.created_at), desc(Incident.id))
+    ).all()
+
+    blockers = db.execute(
+        select(Blocker.id, Blocker.description, Blocker.status)
+        .where(blocker_filter)
+        .order_by(desc(Blocker.created_at), desc(Blocker.id))
+    ).all()
+
+    decisions = db.execute(
+        select(Decision.id, Decision.title, Decision.decision_date)
+        .where(decision_filter)
+        .order_by(desc(Decision.decision_date), desc(Decision.id))
+    ).all()
+
     content = {
-        "status_updates": [
-            {
-                "id": update.id,
-                "title": update.title,
-                "author": update.user.full_name if update.user else "Unknown",
-                "created_at": update.created_at.isoformat(),
-            }
-            for update in status_updates
-        ],
-        "incidents": [
-            {
-                "id": incident.id,
-                "title": incident.title,
-                "severity": incident.severity,
-                "status": incident.status,
-            }
-            for incident in incidents
-        ],
-        "blockers": [
-            {
-                "id": blocker.id,
-                "description": blocker.description,
-                "status": blocker.status,
-            }
-            for blocker in blockers
-        ],
-        "recent_decisions": [
-            {
-                "id": decision.id,
-                "title": decision.title,
-                "decision_date": decision.decision_date.isoformat(),
-            }
-            for decision in decisions
-        ],
+        "status_updates": [_status_update_item(update, update.full_name) for update in status_updates],
+        "incidents": [_incident_item(incident) for incident in incidents],
+        "blockers": [_blocker_item(blocker) for blocker in blockers],
+        "recent_decisions": [_decision_item(decision) for decision in decisions],
         "statistics": {
-            "total_status_updates": len(status_updates),
-            "critical_incidents": critical_incidents,
-            "active_blockers": len(blockers),
-            "decisions_last_7_days": len(decisions),
+            "total_status_updates": stats.status_updates,
+            "critical_incidents": stats.critical_incidents,
+            "active_blockers": stats.blockers,
+            "decisions_last_7_days": stats.decisions,
         },
     }
 
     return {
         "content": content,
-        "status_updates_count": len(status_updates),
-        "incidents_count": len(incidents),
-        "blockers_count": len(blockers),
-        "decisions_count": len(decisions),
+        "status_updates_count": stats.status_updates,
+        "incidents_count": stats.incidents,
+        "blockers_count": stats.blockers,
+        "decisions_count": stats.decisions,
     }
 
 
+# Incremental maintenance: mutation endpoints record which items changed as
+# a job in their own transaction, and a job worker folds those changes into
+# today's summary, so the stored summary stays near-live without rescanning
+# the source tables or locking the summary row in the write path. Item lists
+# hold ids, so ``id`` stands in for ``created_at`` as the recency tie-breaker.
+_SUMMARY_SECTIONS = {
+    "status_update": (
+        "status_updates",
+        lambda item: (item["created_at"], item["id"]),
+        True,
+    ),
+    "incident": (
+        "incidents",
+        lambda item: (SEVERITY_ORDER.get(item["severity"], 3), -item["id"]),
+        False,
+    ),
+    "blocker": ("blockers", lambda item: item["id"], True),
+    "decision": ("recent_decisions", lambda item: (item["decision_date"], item["id"]), True),
+}
+
+_SUMMARY_MODELS = {
+    "status_update": StatusUpdate,
+    "incident": Incident,
+    "blocker": Blocker,
+    "decision": Decision,
+}
+
+
+def _summary_entry(kind: str, obj, now: datetime) -> Optional[Dict[str, Any]]:
+    """Return the summary item for ``obj``, or None if it doesn't belong in today's summary."""
+    since, decisions_since = _windows(now)
+    if kind == "status_update":
+        if _as_utc(obj.created_at) < since:
+            return None
+        return _status_update_item(obj, obj.user.full_name if obj.user else None)
+    if kind == "incident":
+        if obj.archived or obj.status not in ACTIVE_INCIDENT_STATUSES:
+            return None
+        return _incident_item(obj)
+    if kind == "blocker":
+        if obj.archived or obj.status != "active":
+            return None
+        return _blocker_item(obj)
+    if obj.decision_date < decisions_since:
+        return None
+    return _decision_item(obj)
+
+
+def _copy_content(summary: DailySummary) -> Dict[str, Any]:
+    return {key: list(value) if isinstance(value, list) else value for key, value in summary.content.items()}
+
+
+def _prune_expired(content: Dict[str, Any], now: datetime) -> None:
+    """Drop status updates and decisions that have aged out of their windows."""
+    since, decisions_since = _windows(now)
+    content["status_updates"] = [
+        item for item in content["status_updates"]
+        if _as_utc(datetime.fromisoformat(item["created_at"])) >= since
+    ]
+    content["recent_decisions"] = [
+        item for item in content["recent_decisions"]
+        if date.fromisoformat(item["decision_date"]) >= decisions_since
+    ]
+
+
+def _store_content(summary: DailySummary, content: Dict[str, Any]) -> None:
+    """Recompute statistics and counts from the item lists and assign the content."""
+    content["statistics"] = {
+        "total_status_updates": len(content["status_updates"]),
+        "critical_incidents": sum(1 for item in content["incidents"] if item["severity"] == "critical"),
+        "active_blockers": len(content["blockers"]),
+        "decisions_last_7_days": len(content["recent_decisions"]),
+    }
+    # Assign a new dict so the JSONB column is marked dirty
+    summary.content = content
+    summary.status_updates_count = len(content["status_updates"])
+    summary.incidents_count = len(content["incidents"])
+    summary.blockers_count = len(content["blockers"])
+    summary.decisions_count = len(content["recent_decisions"])
+
+
+async def record_summary_change(db: AsyncSession, kind: str, obj) -> None:
+    """Queue a created/updated/deleted item to be folded into today's summary.
+
+    ``kind`` is one of "status_update", "incident", "blocker" or "decision".
+    Call once ``obj`` has an id, in the transaction that changes it (does not
+    commit). The job only runs if that commits. Nothing is queued while today's
+    summary doesn't exist: its generation reads the item from the source tables.
+    """
+    await record_summary_changes(db, kind, [obj])
+
+
+async def record_summary_changes(db: AsyncSession, kind: str, objs: Sequence[Any]) -> None:
+    """Queue several items of one ``kind`` as a single job; same contract as ``record_summary_change``."""
+    if not objs:
+        return
+    today = datetime.now(timezone.utc).date()
+    summary_id = await db.scalar(select(DailySummary.id).where(DailySummary.summary_date == today))
+    if summary_id is None:
+        return
+    enqueue_job(db, "apply_summary_changes", payload={"kind": kind, "ids": [obj.id for obj in objs]})
+
+
+def apply_summary_changes(db: Session, kind: str, ids: Sequence[int]) -> None:
+    """Bring the ``kind`` items with these ``ids`` up to date in today's summary, if it exists.
+
+    Each item is reloaded: one that is gone or no longer qualifies is removed,
+    any other is added or replaced. Applying the same ids again, or out of
+    order, therefore gives the same result. The summary row is locked before
+    the items are read, so concurrent folds apply one at a time and the last
+    one sees the latest state. Commits.
+    """
+    now = datetime.now(timezone.utc)
+    summary = (
+        db.query(DailySummary)
+        .filter(DailySummary.summary_date == now.date())
+        .with_for_update()
+        .first()
+    )
+    if summary is None:
+        # Nothing to maintain; the next generation builds it in full
+        db.rollback()
+        return
+
+    model = _SUMMARY_MODELS[kind]
+    objs = db.scalars(select(model).where(model.id.in_(ids))).all()
+
+    section, sort_key, descending = _SUMMARY_SECTIONS[kind]
+    content = _copy_content(summary)
+    changed_ids = set(ids)
+    items = [item for item in content[section] if item["id"] not in changed_ids]
+    entries = [_summary_entry(kind, obj, now) for obj in objs]
+    items.extend(entry for entry in entries if entry is not None)
+    items.sort(key=sort_key, reverse=descending)
+    content[section] = items
+
+    _prune_expired(content, now)
+    _store_content(summary, content)
+    db.commit()
+
+
 def create_daily_summary(
     db: Session,
     summary_date: Optional[date] = None,
-    force_update: bool = False
+    force_update: bool = False,
+    incremental: bool = False
 ) -> DailySummary:
-    import logging
+    """Create the summary for ``summary_date`` (default today), or return the existing one.
+
+    With ``force_update`` an existing summary is rebuilt from the source tables.
+    With ``incremental`` an existing summary for today, which the
+    ``apply_summary_changes`` jobs keep current, only has aged-out items pruned
+    instead of being rebuilt.
+    Past dates are windowed around that day (see ``summary_as_of``).
+    """
     logger = logging.getLogger(__name__)
     
     now = datetime.now(timezone.utc)
     summary_date = summary_date or now.date()
+    as_of = summary_as_of(summary_date, now)
+    historical = as_of < now
 
     existing = db.query(DailySummary).filter(
         DailySummary.summary_date == summary_date
     ).first()
     
-    summary_payload = _build_summary_content(db, now)
-    
-    logger.info(f"create_daily_summary: summary_date={summary_date}, force_update={force_update}, existing={existing is not None}")
-    logger.info(f"Summary payload counts: status_updates={summary_payload['status_updates_count']}, incidents={summary_payload['incidents_count']}, blockers={summary_payload['blockers_count']}, decisions={summary_payload['decisions_count']}")
+    logger.info(f"create_daily_summary: summary_date={summary_date}, force_update={force_update}, incremental={incremental}, existing={existing is not None}")
     
     if existing:
+        if incremental and summary_date == now.date():
+            logger.info(f"Refreshing existing summary (id={existing.id}) incrementally")
+            content = _copy_content(existing)
+            _prune_expired(content, now)
+            _store_content(existing, content)
+            existing.generated_at = now
+            db.commit()
+            db.refresh(existing)
+            return existing
         if force_update:
             # Update existing summary with latest data
             logger.info(f"Updating existing summary (id={existing.id}) with force_update=True")
+            summary_payload = _build_summary_content(db, as_of, historical)
             existing.content = summary_payload["content"]
             existing.status_updates_count = summary_payload["status_updates_count"]
             existing.incidents_count = summary_payload["incidents_count"]
@@ -157,6 +372,9 @@ def create_daily_summary(
             logger.info(f"Returning existing summary without update (force_update=False)")
             return existing
 
+    summary_payload = _build_summary_content(db, as_of, historical)
+    logger.info(f"Summary payload counts: status_updates={summary_payload['status_updates_count']}, incidents={summary_payload['incidents_count']}, blockers={summary_payload['blockers_count']}, decisions={summary_payload['decisions_count']}")
+
     summary = DailySummary(
         summary_date=summary_date,
         content=summary_payload["content"],
@@ -170,3 +388,63 @@ def create_daily_summary(
     db.refresh(summary)
 
     return summary
+
+
+async def backfill_daily_summaries(
+    session_factory: async_sessionmaker,
+    start_date: date,
+    end_date: date,
+    force_update: bool = False,
+    concurrency: Optional[int] = None
+) -> Dict[str, List[date]]:
+    """Generate summaries for every date from ``start_date`` to ``end_date`` inclusive.
+
+    Dates run concurrently, each in its own session and transaction, at most
+    ``concurrency`` at a time (default ``DAILY_SUMMARY_BACKFILL_CONCURRENCY``);
+    keep it within the engine's pool size. Dates that already have a summary
+    are skipped unless ``force_update``, so an interrupted backfill resumes by
+    running it again. A failing date is logged and reported without stopping
+    the others.
+
+    Returns the dates ``generated``, ``skipped`` and ``failed``.
+    """
+    logger = logging.getLogger(__name__)
+
+    dates = [start_date + timedelta(days=offset) for offset in range((end_date - start_date).days + 1)]
+    existing = set()
+    if not force_update:
+        async with session_factory() as db:
+            result = await db.execute(
+                select(DailySummary.summary_date)
+                .where(DailySummary.summary_date.between(start_date, end_date))
+            )
+            existing = set(result.scalars().all())
+
+    semaphore = asyncio.Semaphore(concurrency or settings.DAILY_SUMMARY_BACKFILL_CONCURRENCY)
+    generated: List[date] = []
+    failed: List[date] = []
+
+    async def generate(summary_date: date) -> None:
+        async with semaphore:
+            try:
+                async with session_factory() as db:
+                    await db.run_sync(
+                        create_daily_summary, summary_date=summary_date, force_update=force_update
+                    )
+            except Exception:
+                logger.exception("Daily summary backfill failed for %s", summary_date)
+                failed.append(summary_date)
+            else:
+                generated.append(summary_date)
+
+    await asyncio.gather(*(generate(summary_date) for summary_date in dates if summary_date not in existing))
+    logger.info(
+        "Backfilled daily summaries %s..%s: %d generated, %d skipped, %d failed",
+        start_date, end_date, len(generated), len(existing), len(failed)
+    )
+
+    return {
+        "generated": sorted(generated),
+        "skipped": sorted(existing),
+        "failed": sorted(failed),
+    }
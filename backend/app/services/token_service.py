@@ -0,0 +1,127 @@
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+from sqlalchemy import delete, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.core.security import create_access_token, create_refresh_token, hash_refresh_token
+from app.db.models.refresh_token import RefreshToken
+from app.db.models.user import User
+
+
+def _access_token_for(user: User) -> str:
+    return create_access_token(
+        data={"sub": str(user.id), "email": user.email, "role": user.role},
+        expires_delta=timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    )
+
+
+# "purpose" claim of event stream tickets; access tokens have none
+EVENTS_TICKET_PURPOSE = "events"
+
+
+def create_events_ticket(user_id: int) -> Dict[str, Any]:
+    """A short-lived token that only opens ``/api/events`` streams for the user.
+
+    Browsers have to put it in the URL, where it may be logged, so it expires
+    after EVENTS_TICKET_EXPIRE_SECONDS and isn't accepted as an access token.
+    """
+    return {
+        "ticket": create_access_token(
+            data={"sub": str(user_id), "purpose": EVENTS_TICKET_PURPOSE},
+            expires_delta=timedelta(seconds=settings.EVENTS_TICKET_EXPIRE_SECONDS)
+        ),
+        "expires_in": settings.EVENTS_TICKET_EXPIRE_SECONDS,
+    }
+
+
+async def issue_tokens(db: AsyncSession, user: User) -> Dict[str, Any]:
+    """Create an access token and a new refresh token for the user (commits)."""
+    refresh_token, token_hash = create_refresh_token()
+    db.add(RefreshToken(
+        user_id=user.id,
+        token_hash=token_hash,
+        expires_at=datetime.now(timezone.utc) + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+    ))
+    await db.commit()
+
+    return {
+        "access_token": _access_token_for(user),
+        "token_type": "bearer",
+        "refresh_token": refresh_token,
+        "expires_in": settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+    }
+
+
+async def consume_refresh_token(db: AsyncSession, refresh_token: str) -> Optional[int]:
+    """Revoke a valid refresh token and return its user id, or None if it isn't valid (does not commit).
+
+    The check and the revocation are a single ``UPDATE ... RETURNING``, so of
+    concurrent refreshes with the same token only one gets the user id back.
+    A token that was already revoked being presented again means it was
+    copied: every refresh token of its user is revoked (and committed).
+    """
+    now = datetime.now(timezone.utc)
+    token_hash = hash_refresh_token(refresh_token)
+    result = await db.execute(
+        update(RefreshToken)
+        .where(
+            RefreshToken.token_hash == token_hash,
+            RefreshToken.revoked_at.is_(None),
+            RefreshToken.expires_at > now
+        )
+        .values(revoked_at=now)
+        .returning(RefreshToken.user_id)
+    )
+    user_id = result.scalar_one_or_none()
+    if user_id is not None:
+        return user_id
+
+    reused_by = await db.scalar(
+        select(RefreshToken.user_id).where(
+            RefreshToken.token_hash == token_hash, RefreshToken.revoked_at.is_not(None)
+        )
+    )
+    if reused_by is not None:
+        await revoke_user_refresh_tokens(db, reused_by)
+        await db.commit()
+    return None
+
+
+async def revoke_refresh_token(db: AsyncSession, user_id: int, refresh_token: str) -> None:
+    """Revoke one of the user's refresh tokens (does not commit)."""
+    await db.execute(
+        update(RefreshToken)
+        .where(
+            RefreshToken.user_id == user_id,
+            RefreshToken.token_hash == hash_refresh_token(refresh_token),
+            RefreshToken.revoked_at.is_(None)
+        )
+        .values(revoked_at=datetime.now(timezone.utc))
+    )
+
+
+async def revoke_user_refresh_tokens(db: AsyncSession, user_id: int) -> None:
+    """Revoke every active refresh token of a user (does not commit)."""
+    await db.execute(
+        update(RefreshToken)
+        .where(RefreshToken.user_id == user_id, RefreshToken.revoked_at.is_(None))
+        .values(revoked_at=datetime.now(timezone.utc))
+    )
+
+
+def purge_refresh_tokens(db: Session) -> int:
+    """Delete expired refresh tokens and ones revoked over REVOKED_REFRESH_TOKEN_RETENTION_DAYS ago (commits).
+
+    Revoked tokens are kept that long so their reuse is still detected.
+    Returns how many rows were deleted.
+    """
+    now = datetime.now(timezone.utc)
+    revoked_cutoff = now - timedelta(days=settings.REVOKED_REFRESH_TOKEN_RETENTION_DAYS)
+    result = db.execute(
+        delete(RefreshToken).where(
+            or_(RefreshToken.expires_at <= now, RefreshToken.revoked_at < revoked_cutoff)
+        )
+    )
+    db.commit()
+    return result.rowcount
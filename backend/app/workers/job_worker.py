@@ -0,0 +1,116 @@
+"""
+Background worker that runs queued jobs.
+
+Claims jobs from the ``jobs`` table with FOR UPDATE SKIP LOCKED and runs them
+on a thread pool of JOB_WORKER_THREADS, honouring each job type's
+concurrency within this process. The claim loop also refreshes the claims
+of the running jobs every JOB_HEARTBEAT_SECONDS. Run as many worker
+processes as the load needs.
+"""
+import time
+import logging
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.services import job_handlers  # noqa: F401  (registers the handlers)
+from app.services.job_queue import claim_job, get_job_types, heartbeat_jobs, run_job, worker_id
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class JobWorker:
+    """Claims and runs jobs, keeping per-type and total concurrency within bounds."""
+
+    def __init__(self, session_factory=SessionLocal, threads: Optional[int] = None):
+        self.session_factory = session_factory
+        self.threads = threads or settings.JOB_WORKER_THREADS
+        self.worker_id = worker_id()
+        self.job_types = get_job_types()
+        self._running = Counter()
+        self._lock = threading.Lock()
+        # Set whenever a job finishes so the claim loop can fill the freed slot immediately
+        self._slot_freed = threading.Event()
+
+    def _available_types(self):
+        with self._lock:
+            if sum(self._running.values()) >= self.threads:
+                return []
+            return [
+                job_type for job_type, registered in self.job_types.items()
+                if self._running[job_type] < registered.concurrency
+            ]
+
+    def _run(self, job) -> None:
+        try:
+            run_job(self.session_factory, job, self.worker_id)
+        except Exception:
+            logger.exception("Recording the outcome of job %s failed", job.id)
+        finally:
+            with self._lock:
+                self._running[job.job_type] -= 1
+            self._slot_freed.set()
+
+    def claim_available(self, executor: ThreadPoolExecutor) -> int:
+        """Claim jobs until the queue is empty or no slots are free; returns the number claimed."""
+        claimed = 0
+        while True:
+            job_types = self._available_types()
+            if not job_types:
+                return claimed
+            db = self.session_factory()
+            try:
+                job = claim_job(db, job_types, self.worker_id)
+            finally:
+                db.close()
+            if job is None:
+                return claimed
+            with self._lock:
+                self._running[job.job_type] += 1
+            executor.submit(self._run, job)
+            claimed += 1
+
+    def heartbeat(self) -> None:
+        """Refresh the claims of this worker's running jobs so they aren't reclaimed as stale."""
+        with self._lock:
+            if not sum(self._running.values()):
+                return
+        db = self.session_factory()
+        try:
+            heartbeat_jobs(db, self.worker_id)
+        finally:
+            db.close()
+
+    def run_forever(self) -> None:
+        logger.info(
+            "Job worker %s started: %d threads, job types %s",
+            self.worker_id, self.threads, ", ".join(sorted(self.job_types))
+        )
+        last_heartbeat = time.monotonic()
+        with ThreadPoolExecutor(max_workers=self.threads) as executor:
+            while True:
+                self._slot_freed.clear()
+                try:
+                    self.claim_available(executor)
+                except Exception:
+                    logger.exception("Claiming jobs failed")
+                if time.monotonic() - last_heartbeat >= settings.JOB_HEARTBEAT_SECONDS:
+                    try:
+                        self.heartbeat()
+                    except Exception:
+                        logger.exception("Refreshing job claims failed")
+                    last_heartbeat = time.monotonic()
+                self._slot_freed.wait(settings.JOB_POLL_INTERVAL_SECONDS)
+
+
+def main():
+    """Main worker loop."""
+    JobWorker().run_forever()
+
+
+if __name__ == "__main__":
+    main()
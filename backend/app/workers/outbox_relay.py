@@ -0,0 +1,67 @@
+"""
+Background worker that relays outbox events to their publishers.
+
+Gives committed ``outbox_events`` their commit-ordered positions (which also
+announces them to the API processes' live feeds), publishes unpublished events
+in position order, a batch at a time, and purges published events past
+OUTBOX_RETENTION_DAYS. Replicas are safe: transaction-level advisory locks let
+only one of them sequence, and one publish, at a time.
+"""
+import time
+import logging
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.services.outbox import get_outbox_publishers, purge_published_events, relay_batch, sequence_events
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Published events are purged this often
+PURGE_INTERVAL_SECONDS = 3600
+
+
+def relay_pending(session_factory=SessionLocal) -> int:
+    """Sequence and relay batches until the backlog is empty or a publisher fails; returns events published."""
+    published = 0
+    while True:
+        db = session_factory()
+        try:
+            # Sequenced first, so the live feed keeps up even while a publisher is failing
+            sequenced = sequence_events(db)
+            count = relay_batch(db)
+        finally:
+            db.close()
+        published += count
+        if sequenced < settings.OUTBOX_RELAY_BATCH_SIZE and count < settings.OUTBOX_RELAY_BATCH_SIZE:
+            return published
+
+
+def main():
+    """Main relay loop."""
+    logger.info("Outbox relay started: publishers %s", ", ".join(sorted(get_outbox_publishers())))
+    last_purge = 0.0
+
+    while True:
+        try:
+            relay_pending()
+        except Exception:
+            logger.exception("Relaying outbox events failed")
+
+        if time.monotonic() - last_purge >= PURGE_INTERVAL_SECONDS:
+            db = SessionLocal()
+            try:
+                purged = purge_published_events(db)
+                if purged:
+                    logger.info("Purged %d published outbox events", purged)
+            except Exception:
+                logger.exception("Purging outbox events failed")
+            finally:
+                db.close()
+            last_purge = time.monotonic()
+
+        time.sleep(settings.OUTBOX_RELAY_POLL_INTERVAL_SECONDS)
+
+
+if __name__ == "__main__":
+    main()
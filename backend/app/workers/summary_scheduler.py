@@ -1,47 +1,197 @@
 """
 Background worker for generating daily summaries.
+
+Any number of worker replicas can run: they elect a leader through a Postgres
+session-level advisory lock held on a dedicated connection, and only the
+leader generates summaries. If the leader exits or its connection drops, the
+lock is released and a follower takes over within
+DAILY_SUMMARY_LEADER_RETRY_SECONDS.
+
+The leader also enqueues the MAINTENANCE_JOBS for the job workers when it is
+elected and every MAINTENANCE_INTERVAL after, on a timer of their own, so
+they run whether or not summary generation succeeds.
 """
 import time
 import logging
-from datetime import datetime, timezone
+from datetime import date, datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
 
 from app.core.config import settings
-from app.db.session import SessionLocal
+from app.core.response_cache import invalidate_sync
+from app.db.models.daily_summary import DailySummary
+from app.db.session import SessionLocal, engine
+from app.services import job_handlers  # noqa: F401  (registers the handlers)
+from app.services.job_queue import enqueue_job
 from app.services.summary_service import create_daily_summary
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Advisory lock key identifying the summary scheduler leader
+SCHEDULER_LOCK_KEY = 0x4153_5343  # "ASSC"
+
+# Housekeeping job types enqueued once per MAINTENANCE_INTERVAL
+MAINTENANCE_JOBS = ("purge_refresh_tokens", "purge_finished_jobs")
+MAINTENANCE_INTERVAL = timedelta(days=1)
+
+
+class LeadershipLost(Exception):
+    """Raised when the leader's lock connection is no longer usable."""
+
+
+def _run_time(day: date) -> datetime:
+    return datetime(
+        day.year, day.month, day.day,
+        settings.DAILY_SUMMARY_RUN_HOUR_UTC, settings.DAILY_SUMMARY_RUN_MINUTE_UTC,
+        tzinfo=timezone.utc,
+    )
+
+
+def _next_run_at(now: datetime, last_run_date: Optional[date]) -> datetime:
+    """Return when the next summary is due: now if today's is overdue, else the next run time."""
+    if last_run_date != now.date():
+        return max(now, _run_time(now.date()))
+    return _run_time(now.date() + timedelta(days=1))
+
+
+def _try_acquire_leadership(bind: Engine) -> Optional[Connection]:
+    """Return a connection holding the scheduler lock, or None if another replica holds it.
+
+    Databases without advisory locks (SQLite in development) always elect
+    this process.
+    """
+    conn = bind.connect()
+    if bind.dialect.name != "postgresql":
+        return conn
+    try:
+        acquired = conn.execute(
+            text("SELECT pg_try_advisory_lock(:key)"), {"key": SCHEDULER_LOCK_KEY}
+        ).scalar()
+        # The lock is session-level; end the transaction so the connection doesn't sit idle in it
+        conn.commit()
+    except Exception:
+        conn.invalidate()
+        conn.close()
+        raise
+    if not acquired:
+        conn.close()
+        return None
+    return conn
+
+
+def _check_leadership(conn: Connection) -> None:
+    """Raise LeadershipLost if the lock connection has dropped (its lock went with it)."""
+    try:
+        conn.execute(text("SELECT 1"))
+        conn.commit()
+    except Exception as exc:
+        raise LeadershipLost() from exc
 
-def _should_run_today(now: datetime) -> bool:
-    run_hour = settings.DAILY_SUMMARY_RUN_HOUR_UTC
-    run_minute = settings.DAILY_SUMMARY_RUN_MINUTE_UTC
-    return (now.hour, now.minute) >= (run_hour, run_minute)
+
+def _release_leadership(conn: Connection) -> None:
+    try:
+        if conn.dialect.name == "postgresql":
+            conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": SCHEDULER_LOCK_KEY})
+            conn.commit()
+    except Exception:
+        # Discard the connection rather than return a possibly locked session to the pool
+        conn.invalidate()
+    finally:
+        conn.close()
+
+
+def _summary_exists(summary_date: date) -> bool:
+    db = SessionLocal()
+    try:
+        return db.query(DailySummary.id).filter(DailySummary.summary_date == summary_date).first() is not None
+    finally:
+        db.close()
+
+
+def _enqueue_maintenance(session_factory=SessionLocal) -> bool:
+    """Enqueue one job of each MAINTENANCE_JOBS type; returns whether they were committed."""
+    db = session_factory()
+    try:
+        for job_type in MAINTENANCE_JOBS:
+            enqueue_job(db, job_type)
+        db.commit()
+        return True
+    except Exception:
+        logger.exception("Enqueuing maintenance jobs failed")
+        return False
+    finally:
+        db.close()
+
+
+def _lead(conn: Connection) -> None:
+    """Generate summaries at each run time, and enqueue maintenance jobs, until leadership is lost."""
+    # Checked once per election; afterwards the leader tracks its own runs
+    today = datetime.now(timezone.utc).date()
+    last_run_date = today if _summary_exists(today) else None
+    next_maintenance_at = datetime.now(timezone.utc)
+
+    while True:
+        now = datetime.now(timezone.utc)
+        if now >= next_maintenance_at:
+            # Checked at least every heartbeat, which is precise enough for a daily purge
+            _check_leadership(conn)
+            if _enqueue_maintenance():
+                next_maintenance_at = now + MAINTENANCE_INTERVAL
+            else:
+                next_maintenance_at = now + timedelta(seconds=settings.DAILY_SUMMARY_RETRY_INTERVAL_SECONDS)
+
+        delay = (_next_run_at(now, last_run_date) - now).total_seconds()
+        if delay > 0:
+            # Wake at the run time, or earlier to heartbeat the lock connection
+            time.sleep(min(delay, settings.DAILY_SUMMARY_LEADER_HEARTBEAT_SECONDS))
+            _check_leadership(conn)
+            continue
+
+        _check_leadership(conn)
+        db = None
+        try:
+            db = SessionLocal()
+            summary = create_daily_summary(db, summary_date=now.date())
+            last_run_date = summary.summary_date
+            logger.info("Daily summary generated for %s", summary.summary_date)
+            invalidate_sync("daily_summaries")
+        except Exception:
+            logger.exception("Daily summary generation failed")
+            time.sleep(settings.DAILY_SUMMARY_RETRY_INTERVAL_SECONDS)
+        finally:
+            if db:
+                db.close()
 
 
 def main():
     """Main worker loop."""
     logger.info("Summary scheduler worker started")
-    last_run_date = None
 
     while True:
-        now = datetime.now(timezone.utc)
-        if _should_run_today(now) and last_run_date != now.date():
-            db = None
-            try:
-                db = SessionLocal()
-                summary = create_daily_summary(db, summary_date=now.date())
-                last_run_date = summary.summary_date
-                logger.info("Daily summary generated for %s", summary.summary_date)
-            except Exception:
-                logger.exception("Daily summary generation failed")
-                time.sleep(settings.DAILY_SUMMARY_RETRY_INTERVAL_SECONDS)
-                continue
-            finally:
-                if db:
-                    db.close()
-
-        time.sleep(settings.DAILY_SUMMARY_POLL_INTERVAL_SECONDS)
+        try:
+            conn = _try_acquire_leadership(engine)
+        except Exception:
+            logger.exception("Summary scheduler leader election failed")
+            conn = None
+        if conn is None:
+            time.sleep(settings.DAILY_SUMMARY_LEADER_RETRY_SECONDS)
+            continue
+
+        logger.info("Summary scheduler elected leader")
+        try:
+            _lead(conn)
+        except LeadershipLost:
+            logger.warning("Summary scheduler lost its leader lock connection")
+        except Exception:
+            logger.exception("Summary scheduler leader failed")
+            # Step down and back off so another replica (or this one) can retry
+            _release_leadership(conn)
+            time.sleep(settings.DAILY_SUMMARY_RETRY_INTERVAL_SECONDS)
+            continue
+        _release_leadership(conn)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,43 @@
+"""Add generated severity rank and ordering index to incidents
+
+Revision ID: 006_incident_severity_rank
+Revises: 005_daily_summaries
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '006_incident_severity_rank'
+down_revision = '005_daily_summaries'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Stored rank lets the incidents list order by severity inside the database
+    op.add_column(
+        'incidents',
+        sa.Column(
+            'severity_rank',
+            sa.SmallInteger(),
+            sa.Computed(
+                "CASE severity WHEN 'critical' THEN 0 WHEN 'high' THEN 1 "
+                "WHEN 'medium' THEN 2 ELSE 3 END",
+                persisted=True
+            ),
+            nullable=False
+        )
+    )
+    op.create_index(
+        'idx_incidents_archived_severity_rank_created_at',
+        'incidents',
+        ['archived', 'severity_rank', 'created_at'],
+        postgresql_ops={'created_at': 'DESC'}
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_incidents_archived_severity_rank_created_at', table_name='incidents')
+    op.drop_column('incidents', 'severity_rank')
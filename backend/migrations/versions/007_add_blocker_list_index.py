@@ -0,0 +1,28 @@
+"""Add composite ordering index for the blockers list
+
+Revision ID: 007_blocker_list_index
+Revises: 006_incident_severity_rank
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '007_blocker_list_index'
+down_revision = '006_incident_severity_rank'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'idx_blockers_archived_status_created_at',
+        'blockers',
+        ['archived', 'status', 'created_at'],
+        postgresql_ops={'created_at': 'DESC'}
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_blockers_archived_status_created_at', table_name='blockers')
@@ -0,0 +1,36 @@
+"""Add composite indexes for keyset pagination
+
+Revision ID: 008_keyset_pagination_indexes
+Revises: 007_blocker_list_index
+Create Date: 2026-10-16 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '008_keyset_pagination_indexes'
+down_revision = '007_blocker_list_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # (sort column, id) so cursor pages are a bounded index range scan
+    op.create_index(
+        'idx_status_updates_created_at_id',
+        'status_updates',
+        ['created_at', 'id'],
+        postgresql_ops={'created_at': 'DESC', 'id': 'DESC'}
+    )
+    op.create_index(
+        'idx_decisions_decision_date_id',
+        'decisions',
+        ['decision_date', 'id'],
+        postgresql_ops={'decision_date': 'DESC', 'id': 'DESC'}
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_decisions_decision_date_id', table_name='decisions')
+    op.drop_index('idx_status_updates_created_at_id', table_name='status_updates')
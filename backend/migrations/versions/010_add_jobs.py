@@ -0,0 +1,54 @@
+"""Add jobs table for the background job queue
+
+Revision ID: 010_jobs
+Revises: 009_refresh_tokens
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '010_jobs'
+down_revision = '009_refresh_tokens'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'jobs',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('job_type', sa.String(length=100), nullable=False),
+        sa.Column('payload', postgresql.JSONB(), nullable=False),
+        sa.Column('priority', sa.SmallInteger(), server_default=sa.text('0'), nullable=False),
+        sa.Column('status', sa.String(length=20), server_default='queued', nullable=False),
+        sa.Column('attempts', sa.Integer(), server_default=sa.text('0'), nullable=False),
+        sa.Column('max_attempts', sa.Integer(), server_default=sa.text('5'), nullable=False),
+        sa.Column('run_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('locked_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('locked_by', sa.String(length=100), nullable=True),
+        sa.Column('last_error', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+        sa.CheckConstraint(
+            "status IN ('queued', 'running', 'succeeded', 'failed')",
+            name='check_job_status'
+        ),
+        sa.PrimaryKeyConstraint('id')
+    )
+
+    # Claim order for runnable jobs; finished jobs stay out of the index
+    op.create_index(
+        'idx_jobs_claim',
+        'jobs',
+        ['job_type', 'priority', 'run_at'],
+        postgresql_ops={'priority': 'DESC'},
+        postgresql_where=sa.text("status IN ('queued', 'running')")
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_jobs_claim', table_name='jobs')
+    op.drop_table('jobs')
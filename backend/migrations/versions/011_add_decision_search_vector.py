@@ -0,0 +1,46 @@
+"""Add generated full-text search vector to decisions
+
+Revision ID: 011_decision_search_vector
+Revises: 010_jobs
+Create Date: 2026-10-16 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '011_decision_search_vector'
+down_revision = '010_jobs'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Weighted document: title (A), description (B), context and outcome (C)
+    op.add_column(
+        'decisions',
+        sa.Column(
+            'search_vector',
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+                "setweight(to_tsvector('english', coalesce(description, '')), 'B') || "
+                "setweight(to_tsvector('english', coalesce(context, '')), 'C') || "
+                "setweight(to_tsvector('english', coalesce(outcome, '')), 'C')",
+                persisted=True
+            ),
+            nullable=True
+        )
+    )
+    op.create_index(
+        'idx_decisions_search_vector',
+        'decisions',
+        ['search_vector'],
+        postgresql_using='gin'
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_decisions_search_vector', table_name='decisions')
+    op.drop_column('decisions', 'search_vector')
@@ -0,0 +1,39 @@
+"""Add trigram indexes for user search
+
+Revision ID: 012_user_trigram_indexes
+Revises: 011_decision_search_vector
+Create Date: 2026-10-16 16:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '012_user_trigram_indexes'
+down_revision = '011_decision_search_vector'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # Serve ILIKE '%term%' and similarity (%) on names and emails
+    op.create_index(
+        'idx_users_full_name_trgm',
+        'users',
+        ['full_name'],
+        postgresql_using='gin',
+        postgresql_ops={'full_name': 'gin_trgm_ops'}
+    )
+    op.create_index(
+        'idx_users_email_trgm',
+        'users',
+        ['email'],
+        postgresql_using='gin',
+        postgresql_ops={'email': 'gin_trgm_ops'}
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_users_email_trgm', table_name='users')
+    op.drop_index('idx_users_full_name_trgm', table_name='users')
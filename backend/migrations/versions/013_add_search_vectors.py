@@ -0,0 +1,59 @@
+"""Add generated full-text search vectors to status updates, incidents and blockers
+
+Revision ID: 013_search_vectors
+Revises: 012_user_trigram_indexes
+Create Date: 2026-10-16 17:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '013_search_vectors'
+down_revision = '012_user_trigram_indexes'
+branch_labels = None
+depends_on = None
+
+# Weighted documents (A ranks highest), matching the models
+_SEARCH_VECTORS = {
+    'status_updates': (
+        "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(content, '')), 'B')"
+    ),
+    'incidents': (
+        "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(description, '')), 'B') || "
+        "setweight(to_tsvector('english', coalesce(resolution_notes, '')), 'C')"
+    ),
+    'blockers': (
+        "setweight(to_tsvector('english', coalesce(description, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(impact, '')), 'B') || "
+        "setweight(to_tsvector('english', coalesce(resolution_notes, '')), 'C')"
+    ),
+}
+
+
+def upgrade() -> None:
+    for table, expression in _SEARCH_VECTORS.items():
+        op.add_column(
+            table,
+            sa.Column(
+                'search_vector',
+                postgresql.TSVECTOR(),
+                sa.Computed(expression, persisted=True),
+                nullable=True
+            )
+        )
+        op.create_index(
+            f'idx_{table}_search_vector',
+            table,
+            ['search_vector'],
+            postgresql_using='gin'
+        )
+
+
+def downgrade() -> None:
+    for table in reversed(list(_SEARCH_VECTORS)):
+        op.drop_index(f'idx_{table}_search_vector', table_name=table)
+        op.drop_column(table, 'search_vector')
@@ -0,0 +1,43 @@
+"""Add outbox_events table for the transactional outbox
+
+Revision ID: 014_outbox_events
+Revises: 013_search_vectors
+Create Date: 2026-10-16 18:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '014_outbox_events'
+down_revision = '013_search_vectors'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'outbox_events',
+        sa.Column('id', sa.BigInteger(), nullable=False),
+        sa.Column('collection', sa.String(length=50), nullable=False),
+        sa.Column('action', sa.String(length=50), nullable=False),
+        sa.Column('entity_id', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('published_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+
+    # The relay's backlog; published events stay out of the index
+    op.create_index(
+        'idx_outbox_events_unpublished',
+        'outbox_events',
+        ['id'],
+        postgresql_where=sa.text('published_at IS NULL')
+    )
+    op.create_index('idx_outbox_events_published_at', 'outbox_events', ['published_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('idx_outbox_events_published_at', table_name='outbox_events')
+    op.drop_index('idx_outbox_events_unpublished', table_name='outbox_events')
+    op.drop_table('outbox_events')
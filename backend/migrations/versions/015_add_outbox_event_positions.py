@@ -0,0 +1,59 @@
+"""Add commit-ordered positions to outbox_events
+
+Revision ID: 015_outbox_positions
+Revises: 014_outbox_events
+Create Date: 2026-10-16 20:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '015_outbox_positions'
+down_revision = '014_outbox_events'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('outbox_events', sa.Column('position', sa.BigInteger(), nullable=True))
+    op.execute('CREATE SEQUENCE outbox_events_position_seq')
+
+    # Existing rows keep their ids as positions, so clients' Last-Event-IDs still resume correctly
+    op.execute('UPDATE outbox_events SET position = id')
+    op.execute(
+        "SELECT setval('outbox_events_position_seq', COALESCE((SELECT MAX(id) FROM outbox_events), 0) + 1, false)"
+    )
+
+    # Committed events still waiting for a position
+    op.create_index(
+        'idx_outbox_events_unsequenced',
+        'outbox_events',
+        ['id'],
+        postgresql_where=sa.text('position IS NULL')
+    )
+    # Replay after a client's Last-Event-ID
+    op.create_index('idx_outbox_events_position', 'outbox_events', ['position'], unique=True)
+
+    # The relay's backlog is now read in position order
+    op.drop_index('idx_outbox_events_unpublished', table_name='outbox_events')
+    op.create_index(
+        'idx_outbox_events_unpublished',
+        'outbox_events',
+        ['position'],
+        postgresql_where=sa.text('published_at IS NULL')
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_outbox_events_unpublished', table_name='outbox_events')
+    op.create_index(
+        'idx_outbox_events_unpublished',
+        'outbox_events',
+        ['id'],
+        postgresql_where=sa.text('published_at IS NULL')
+    )
+    op.drop_index('idx_outbox_events_position', table_name='outbox_events')
+    op.drop_index('idx_outbox_events_unsequenced', table_name='outbox_events')
+    op.execute('DROP SEQUENCE outbox_events_position_seq')
+    op.drop_column('outbox_events', 'position')
@@ -0,0 +1,29 @@
+"""Add finished_at index for the jobs retention purge
+
+Revision ID: 016_jobs_finished_at
+Revises: 015_outbox_positions
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '016_jobs_finished_at'
+down_revision = '015_outbox_positions'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Retention purge of finished jobs
+    op.create_index(
+        'idx_jobs_finished_at',
+        'jobs',
+        ['finished_at'],
+        postgresql_where=sa.text("status IN ('succeeded', 'failed')")
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_jobs_finished_at', table_name='jobs')
@@ -1,33 +1,46 @@
 """
 Pytest configuration and fixtures for backend tests.
 """
+import os
+import tempfile
 import pytest
+
+# Cheap bcrypt cost for tests; must be set before app settings are loaded
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+
 import json
 from sqlalchemy import create_engine, event, TypeDecorator, String
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import NullPool
 from sqlalchemy.types import JSON
 from fastapi.testclient import TestClient
-from app.main import app
 from app.db.base import Base
 # Import all models to ensure they're registered with Base
-from app.db.models import user, status_update, incident, blocker, decision, daily_summary
+from app.db.models import user, status_update, incident, blocker, decision, daily_summary, refresh_token, job, outbox_event
 from app.db.models.user import User
 from app.core.security import get_password_hash
-from app.core.dependencies import get_db
 
 
-# Use in-memory SQLite for testing
-SQLALCHEMY_TEST_DATABASE_URL = "sqlite:///:memory:"
+# Use a temporary SQLite file so the sync fixture session and the app's
+# async (aiosqlite) session see the same database
+_db_fd, SQLALCHEMY_TEST_DATABASE_PATH = tempfile.mkstemp(suffix=".db")
+os.close(_db_fd)
+SQLALCHEMY_TEST_DATABASE_URL = f"sqlite:///{SQLALCHEMY_TEST_DATABASE_PATH}"
+SQLALCHEMY_TEST_ASYNC_DATABASE_URL = f"sqlite+aiosqlite:///{SQLALCHEMY_TEST_DATABASE_PATH}"
 
 engine = create_engine(
     SQLALCHEMY_TEST_DATABASE_URL,
     connect_args={"check_same_thread": False},
-    poolclass=StaticPool,
+    poolclass=NullPool,
 )
 
+# NullPool: TestClient runs each request on a fresh event loop
+async_engine = create_async_engine(SQLALCHEMY_TEST_ASYNC_DATABASE_URL, poolclass=NullPool)
+
 # SQLite compatibility: Enable foreign keys
 @event.listens_for(engine, "connect", insert=True)
+@event.listens_for(async_engine.sync_engine, "connect", insert=True)
 def set_sqlite_pragma(dbapi_conn, connection_record):
     """Enable foreign keys in SQLite."""
     cursor = dbapi_conn.cursor()
@@ -37,7 +50,7 @@ def set_sqlite_pragma(dbapi_conn, connection_record):
 # Replace PostgreSQL-specific types with SQLite-compatible ones
 # Import models first to ensure metadata is populated
 from sqlalchemy import ARRAY
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
 
 # Modify metadata tables to replace PostgreSQL types with SQLite-compatible ones
 # This must happen after all models are imported but before table creation
@@ -52,11 +65,32 @@ def patch_metadata_for_sqlite():
             # Replace JSONB with JSON  
             elif isinstance(original_type, JSONB):
                 column.type = JSON()
-
-# Apply the patch
+            # Full-text vectors are generated by Postgres expressions; keep a plain, unused column
+            elif isinstance(original_type, TSVECTOR):
+                column.type = String()
+                column.computed = None
+                column.server_default = None
+
+# Apply the patch before importing the app: routers build loader options at import
+# time, which configures the mappers with whatever column types are present
 patch_metadata_for_sqlite()
 
+from app.main import app
+from app.core.dependencies import get_db, get_async_db, clear_user_cache
+from app.core.pagination import clear_count_cache
+from app.core.response_cache import clear_response_cache
+
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+TestingAsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Remove the temporary SQLite database file."""
+    engine.dispose()
+    if os.path.exists(SQLALCHEMY_TEST_DATABASE_PATH):
+        os.remove(SQLALCHEMY_TEST_DATABASE_PATH)
 
 
 @pytest.fixture(scope="function")
@@ -80,10 +114,47 @@ def client(db_session):
         finally:
             pass
     
+    async def override_get_async_db():
+        async with TestingAsyncSessionLocal() as session:
+            yield session
+    
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
     test_client = TestClient(app)
     yield test_client
     app.dependency_overrides.clear()
+    clear_count_cache()
+    clear_user_cache()
+    clear_response_cache()
+
+
+@pytest.fixture
+def query_counter():
+    """Record SQL statements the API executes through the async engine."""
+    statements = []
+    
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+    
+    event.listen(async_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    event.remove(async_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.fixture
+def run_jobs():
+    """Return a function that runs queued jobs until none are due, as a job worker would."""
+    from concurrent.futures import ThreadPoolExecutor
+    from app.workers.job_worker import JobWorker
+    
+    def run():
+        worker = JobWorker(session_factory=TestingSessionLocal)
+        while True:
+            with ThreadPoolExecutor(max_workers=worker.threads) as executor:
+                if not worker.claim_available(executor):
+                    return
+    
+    return run
 
 
 @pytest.fixture
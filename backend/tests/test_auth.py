@@ -81,6 +81,24 @@ class TestLogin:
         assert "access_token" in data
         assert data["token_type"] == "bearer"
     
+    def test_login_verifies_password_on_hashing_pool(self, client, test_user):
+        """Test login dispatches bcrypt verification to the password hashing pool."""
+        before = client.get("/health").json()["password_hashing"]
+        
+        response = client.post(
+            "/api/auth/login",
+            data={
+                "username": test_user.email,
+                "password": "testpassword123"
+            }
+        )
+        assert response.status_code == status.HTTP_200_OK
+        
+        after = client.get("/health").json()["password_hashing"]
+        assert after["completed"] == before["completed"] + 1
+        assert after["queued"] == 0
+        assert after["running"] == 0
+    
     def test_login_invalid_email(self, client):
         """Test login with non-existent email."""
         response = client.post(
@@ -130,6 +148,130 @@ class TestLogin:
         assert "inactive" in response.json()["detail"].lower()
 
 
+class TestRefresh:
+    """Test refresh token endpoint."""
+    
+    def _login(self, client, user):
+        response = client.post(
+            "/api/auth/login",
+            data={"username": user.email, "password": "testpassword123"}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        return response.json()
+    
+    def test_login_returns_refresh_token(self, client, test_user):
+        """Test login issues a refresh token alongside a short-lived access token."""
+        data = self._login(client, test_user)
+        assert data["refresh_token"]
+        assert data["expires_in"] > 0
+    
+    def test_refresh_rotates_token(self, client, test_user):
+        """Test refreshing returns a new token pair and revokes the old refresh token."""
+        tokens = self._login(client, test_user)
+        
+        response = client.post("/api/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+        assert response.status_code == status.HTTP_200_OK
+        refreshed = response.json()
+        assert refreshed["refresh_token"] != tokens["refresh_token"]
+        
+        me = client.get(
+            "/api/users/me",
+            headers={"Authorization": f"Bearer {refreshed['access_token']}"}
+        )
+        assert me.status_code == status.HTTP_200_OK
+        assert me.json()["email"] == test_user.email
+        
+        reused = client.post("/api/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+        assert reused.status_code == status.HTTP_401_UNAUTHORIZED
+    
+    def test_refresh_token_reuse_revokes_all_sessions(self, client, test_user):
+        """Test presenting a rotated refresh token again revokes its replacement too."""
+        tokens = self._login(client, test_user)
+        other_session = self._login(client, test_user)
+        
+        refreshed = client.post("/api/auth/refresh", json={"refresh_token": tokens["refresh_token"]}).json()
+        reused = client.post("/api/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+        assert reused.status_code == status.HTTP_401_UNAUTHORIZED
+        
+        for token in (refreshed["refresh_token"], other_session["refresh_token"]):
+            response = client.post("/api/auth/refresh", json={"refresh_token": token})
+            assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    
+    def test_purge_refresh_tokens(self, client, test_user, db_session):
+        """Test expired and long-revoked refresh tokens are deleted, others kept."""
+        from datetime import datetime, timedelta, timezone
+        from app.db.models.refresh_token import RefreshToken
+        from app.services.token_service import purge_refresh_tokens
+        
+        now = datetime.now(timezone.utc)
+        for token_hash, expires_at, revoked_at in [
+            ("expired", now - timedelta(days=1), None),
+            ("revoked-long-ago", now + timedelta(days=1), now - timedelta(days=30)),
+            ("revoked-recently", now + timedelta(days=1), now - timedelta(hours=1)),
+            ("active", now + timedelta(days=1), None),
+        ]:
+            db_session.add(RefreshToken(
+                user_id=test_user.id,
+                token_hash=token_hash,
+                expires_at=expires_at,
+                revoked_at=revoked_at
+            ))
+        db_session.commit()
+        
+        assert purge_refresh_tokens(db_session) == 2
+        remaining = {token.token_hash for token in db_session.query(RefreshToken)}
+        assert remaining == {"revoked-recently", "active"}
+    
+    def test_refresh_invalid_token(self, client):
+        """Test refreshing with an unknown token fails."""
+        response = client.post("/api/auth/refresh", json={"refresh_token": "not-a-token"})
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    
+    def test_logout_revokes_refresh_token(self, client, test_user):
+        """Test logout revokes the refresh token it is given."""
+        tokens = self._login(client, test_user)
+        headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+        
+        response = client.post(
+            "/api/auth/logout",
+            headers=headers,
+            json={"refresh_token": tokens["refresh_token"]}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        
+        response = client.post("/api/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    
+    def test_logout_all_revokes_every_session(self, client, test_user):
+        """Test logout-all revokes all of the user's refresh tokens."""
+        first = self._login(client, test_user)
+        second = self._login(client, test_user)
+        
+        response = client.post(
+            "/api/auth/logout-all",
+            headers={"Authorization": f"Bearer {first['access_token']}"}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        
+        for tokens in (first, second):
+            response = client.post("/api/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+            assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    
+    def test_password_change_revokes_refresh_tokens(self, client, test_user):
+        """Test changing the password revokes existing refresh tokens."""
+        tokens = self._login(client, test_user)
+        
+        response = client.post(
+            "/api/users/me/change-password",
+            headers={"Authorization": f"Bearer {tokens['access_token']}"},
+            json={"current_password": "testpassword123", "new_password": "newpassword456"}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        
+        response = client.post("/api/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
 class TestLogout:
     """Test logout endpoint."""
     
@@ -177,3 +319,51 @@ class TestGetCurrentUser:
             headers={"Authorization": "Bearer invalid_token"}
         )
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    
+    def test_get_current_user_cached(self, client, auth_headers, query_counter):
+        """Test repeated authenticated requests skip the users lookup."""
+        client.get("/api/users/me", headers=auth_headers)
+        query_counter.clear()
+        
+        response = client.get("/api/users/me", headers=auth_headers)
+        assert response.status_code == status.HTTP_200_OK
+        assert not any("FROM users" in statement for statement in query_counter)
+    
+    def test_cached_user_excludes_password_hash(self, client, auth_headers, test_user):
+        """Test only the profile snapshot is cached, not the ORM row."""
+        from app.core.dependencies import CurrentUser, _user_cache
+        
+        client.get("/api/users/me", headers=auth_headers)
+        cached = _user_cache.get(test_user.id)
+        assert isinstance(cached, CurrentUser)
+        assert not hasattr(cached, "password_hash")
+    
+    def test_profile_update_invalidates_cached_user(self, client, auth_headers):
+        """Test the cached user is refreshed after a profile change."""
+        client.get("/api/users/me", headers=auth_headers)
+        
+        response = client.patch(
+            "/api/users/me",
+            headers=auth_headers,
+            json={"email": "renamed@example.com"}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        
+        response = client.get("/api/users/me", headers=auth_headers)
+        assert response.json()["email"] == "renamed@example.com"
+    
+    def test_password_change_invalidates_cached_user(self, client, auth_headers):
+        """Test the cached password hash is not reused after a password change."""
+        response = client.post(
+            "/api/users/me/change-password",
+            headers=auth_headers,
+            json={"current_password": "testpassword123", "new_password": "newpassword456"}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        
+        response = client.post(
+            "/api/users/me/change-password",
+            headers=auth_headers,
+            json={"current_password": "testpassword123", "new_password": "otherpassword789"}
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
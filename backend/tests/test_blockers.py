@@ -3,6 +3,7 @@ Tests for blocker endpoints.
 """
 import pytest
 from fastapi import status
+from datetime import datetime, timezone
 
 
 class TestCreateBlocker:
@@ -181,6 +182,39 @@ class TestGetBlockers:
         data = response.json()
         assert data["total"] == 1
         assert data["items"][0]["status"] == "active"
+    
+    def test_get_blockers_active_first_then_newest(self, client, auth_headers, test_user, db_session):
+        """Test blockers are ordered active first, then newest first, across pages."""
+        from app.db.models.blocker import Blocker
+        
+        # Create test blockers, one day apart
+        for i, blocker_status in enumerate(["resolved", "active", "resolved", "active"]):
+            blocker = Blocker(
+                description=f"Blocker {i}",
+                impact=f"Impact {i}",
+                status=blocker_status,
+                reported_by_id=test_user.id,
+                created_at=datetime(2024, 1, 1 + i, tzinfo=timezone.utc)
+            )
+            db_session.add(blocker)
+        db_session.commit()
+        
+        response = client.get(
+            "/api/blockers?limit=3",
+            headers=auth_headers
+        )
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["total"] == 4
+        assert [item["description"] for item in data["items"]] == ["Blocker 3", "Blocker 1", "Blocker 2"]
+        
+        response = client.get(
+            "/api/blockers?limit=3&page=2",
+            headers=auth_headers
+        )
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert [item["description"] for item in data["items"]] == ["Blocker 0"]
 
 
 class TestGetBlocker:
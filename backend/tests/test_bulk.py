@@ -0,0 +1,176 @@
+"""
+Tests for bulk create and bulk update endpoints.
+"""
+from datetime import datetime, timezone
+from fastapi import status
+from app.core.config import settings
+from app.db.models.blocker import Blocker
+from app.db.models.decision import DecisionAuditLog, DecisionParticipant
+from app.db.models.incident import Incident
+from app.db.models.outbox_event import OutboxEvent
+
+
+class TestBulkCreate:
+    """Test creating many items in one request."""
+
+    def test_bulk_create_status_updates(self, client, auth_headers):
+        """Test items are created and their ids returned in request order."""
+        items = [{"title": f"Update {i}", "content": "c", "tags": ["import"]} for i in range(25)]
+        response = client.post("/api/status/bulk", headers=auth_headers, json={"items": items})
+        assert response.status_code == status.HTTP_201_CREATED
+        data = response.json()
+        assert data["created"] == 25
+        assert data["ids"] == sorted(data["ids"])
+
+        listed = client.get("/api/status?limit=100", headers=auth_headers).json()
+        assert listed["total"] == 25
+        assert {item["id"]: item["title"] for item in listed["items"]}[data["ids"][3]] == "Update 3"
+
+    def test_bulk_create_incidents_reports_item_errors(self, client, auth_headers, test_user, db_session):
+        """Test an invalid reference rejects the whole batch and names the item."""
+        items = [
+            {"title": "Valid", "description": "d", "assigned_to_id": test_user.id},
+            {"title": "Bad", "description": "d", "assigned_to_id": 999},
+        ]
+        response = client.post("/api/incidents/bulk", headers=auth_headers, json={"items": items})
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        assert response.json()["detail"] == [{
+            "loc": ["body", "items", 1, "assigned_to_id"],
+            "msg": "Assigned user not found",
+            "type": "not_found",
+        }]
+        assert db_session.query(Incident).count() == 0
+
+        response = client.post("/api/incidents/bulk", headers=auth_headers, json={"items": items[:1]})
+        assert response.status_code == status.HTTP_201_CREATED
+        incident = db_session.get(Incident, response.json()["ids"][0])
+        assert (incident.status, incident.severity, incident.reported_by_id) == ("open", "medium", test_user.id)
+
+    def test_bulk_create_validates_item_shape(self, client, auth_headers):
+        """Test schema errors point at the failing item and empty batches are rejected."""
+        response = client.post(
+            "/api/blockers/bulk", headers=auth_headers,
+            json={"items": [{"description": "ok", "impact": "i"}, {"description": "no impact"}]}
+        )
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        assert response.json()["detail"][0]["loc"] == ["body", "items", 1, "impact"]
+
+        response = client.post("/api/blockers/bulk", headers=auth_headers, json={"items": []})
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    def test_bulk_create_blockers_records_changes(self, client, auth_headers, db_session):
+        """Test each created item gets an outbox event."""
+        response = client.post(
+            "/api/blockers/bulk", headers=auth_headers,
+            json={"items": [{"description": f"Blocked {i}", "impact": "i"} for i in range(3)]}
+        )
+        ids = response.json()["ids"]
+        assert db_session.query(Blocker).filter(Blocker.status == "active").count() == 3
+        events = db_session.query(OutboxEvent).order_by(OutboxEvent.id).all()
+        assert [(e.collection, e.action, e.entity_id) for e in events] == [
+            ("blockers", "created", blocker_id) for blocker_id in ids
+        ]
+
+    def test_bulk_create_decisions_with_participants(self, client, auth_headers, admin_headers, test_user, test_admin, db_session, run_jobs):
+        """Test participants, audit entries and the summary are written for every item."""
+        client.post("/api/summaries/generate", headers=admin_headers)
+        today = datetime.now(timezone.utc).date().isoformat()
+        decision = {"description": "d", "context": "c", "outcome": "o", "decision_date": today}
+        response = client.post(
+            "/api/decisions/bulk", headers=auth_headers,
+            json={"items": [
+                {**decision, "title": "One", "participant_ids": [test_admin.id, test_admin.id]},
+                {**decision, "title": "Two", "participant_ids": [test_user.id, test_admin.id]},
+                {**decision, "title": "Three"},
+            ]}
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+        ids = response.json()["ids"]
+
+        participants = db_session.query(DecisionParticipant).order_by(DecisionParticipant.id).all()
+        assert [(p.decision_id, p.user_id) for p in participants] == [
+            (ids[0], test_admin.id), (ids[1], test_user.id), (ids[1], test_admin.id)
+        ]
+        assert db_session.query(DecisionAuditLog).filter(DecisionAuditLog.change_type == "created").count() == 3
+
+        run_jobs()
+        summary = client.post("/api/summaries/generate?incremental=true", headers=admin_headers).json()
+        assert [d["id"] for d in summary["content"]["recent_decisions"]] == ids[::-1]
+
+        response = client.post(
+            "/api/decisions/bulk", headers=auth_headers,
+            json={"items": [{**decision, "title": "Bad", "participant_ids": [999]}]}
+        )
+        assert response.json()["detail"][0]["loc"] == ["body", "items", 0, "participant_ids"]
+
+
+def _create(client, auth_headers, collection, items):
+    response = client.post(f"/api/{collection}/bulk", headers=auth_headers, json={"items": items})
+    return response.json()["ids"]
+
+
+class TestBulkUpdate:
+    """Test archiving and changing the status of many items in one request."""
+
+    def test_bulk_archive_incidents_by_ids(self, client, auth_headers, db_session):
+        """Test selected incidents are archived and already archived ones aren't counted."""
+        ids = _create(client, auth_headers, "incidents", [{"title": f"I{i}", "description": "d"} for i in range(3)])
+        client.patch(f"/api/incidents/{ids[0]}/archive", headers=auth_headers)
+
+        response = client.patch("/api/incidents/bulk/archive", headers=auth_headers, json={"ids": ids[:2]})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {"affected": 1}
+
+        listed = client.get("/api/incidents", headers=auth_headers).json()
+        assert [item["id"] for item in listed["items"]] == [ids[2]]
+
+        response = client.patch("/api/incidents/bulk/unarchive", headers=auth_headers, json={"ids": ids})
+        assert response.json() == {"affected": 2}
+        events = db_session.query(OutboxEvent).filter(OutboxEvent.action.in_(["archived", "unarchived"])).count()
+        assert events == 4
+
+    def test_bulk_archive_blockers_by_filter_in_chunks(self, client, auth_headers, db_session, query_counter, monkeypatch):
+        """Test a filter selects rows across several chunked UPDATE statements."""
+        monkeypatch.setattr(settings, "BULK_UPDATE_CHUNK_SIZE", 2)
+        ids = _create(client, auth_headers, "blockers", [{"description": f"B{i}", "impact": "i"} for i in range(6)])
+        resolved = client.patch("/api/blockers/bulk/resolve", headers=auth_headers, json={"ids": ids[:5]}).json()
+        assert resolved == {"affected": 5}
+
+        query_counter.clear()
+        response = client.patch(
+            "/api/blockers/bulk/archive", headers=auth_headers,
+            json={"filter": {"status": ["resolved"], "resolved_before": "2999-01-01T00:00:00Z"}}
+        )
+        assert response.json() == {"affected": 5}
+        assert sum(s.lstrip().upper().startswith("UPDATE BLOCKERS") for s in query_counter) == 3
+
+        db_session.expire_all()
+        archived = {b.id for b in db_session.query(Blocker).filter(Blocker.archived.is_(True))}
+        assert archived == set(ids[:5])
+
+    def test_bulk_incident_status_change(self, client, auth_headers, admin_headers, db_session, run_jobs):
+        """Test status changes set resolved_at and keep today's summary current."""
+        client.post("/api/summaries/generate", headers=admin_headers)
+        ids = _create(client, auth_headers, "incidents", [
+            {"title": "A", "description": "d", "severity": "critical"},
+            {"title": "B", "description": "d", "severity": "low"},
+        ])
+
+        response = client.patch(
+            "/api/incidents/bulk/status", headers=auth_headers,
+            json={"filter": {"severity": ["critical"]}, "status": "resolved", "resolution_notes": "Fixed"}
+        )
+        assert response.json() == {"affected": 1}
+        incident = db_session.get(Incident, ids[0])
+        assert (incident.status, incident.resolution_notes) == ("resolved", "Fixed")
+        assert incident.resolved_at is not None
+
+        run_jobs()
+        summary = client.post("/api/summaries/generate?incremental=true", headers=admin_headers).json()
+        assert [i["id"] for i in summary["content"]["incidents"]] == [ids[1]]
+
+    def test_bulk_update_selection_validation(self, client, auth_headers):
+        """Test exactly one of ids or a non-empty filter is required."""
+        for body in ({}, {"ids": [1], "filter": {"archived": False}}, {"filter": {}}, {"ids": []}):
+            response = client.patch("/api/incidents/bulk/archive", headers=auth_headers, json=body)
+            assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
@@ -0,0 +1,60 @@
+"""
+Tests for the aggregated dashboard endpoint.
+"""
+from datetime import date
+from fastapi import status
+from app.db.models.blocker import Blocker
+from app.db.models.decision import Decision
+from app.db.models.incident import Incident
+from app.db.models.status_update import StatusUpdate
+
+
+class TestDashboard:
+    """Test GET /api/dashboard."""
+
+    def test_dashboard_contents(self, client, auth_headers, db_session, test_user):
+        """Test counts cover only open, unarchived items and recent lists are newest first."""
+        db_session.add_all([
+            Incident(title="A", description="d", severity="critical", reported_by_id=test_user.id),
+            Incident(title="B", description="d", severity="high", status="in_progress", reported_by_id=test_user.id),
+            Incident(title="C", description="d", severity="high", status="resolved", reported_by_id=test_user.id),
+            Incident(title="D", description="d", severity="low", reported_by_id=test_user.id, archived=True),
+            Blocker(description="Active", impact="i", reported_by_id=test_user.id),
+            Blocker(description="Done", impact="i", status="resolved", reported_by_id=test_user.id),
+        ])
+        for i in range(3):
+            db_session.add(StatusUpdate(user_id=test_user.id, title=f"Update {i}", content="c"))
+            db_session.add(Decision(
+                created_by_id=test_user.id, title=f"Decision {i}", description="d", context="c",
+                outcome="o", decision_date=date(2024, 1, i + 1)
+            ))
+        db_session.commit()
+
+        response = client.get("/api/dashboard?limit=2", headers=auth_headers)
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["open_incidents"] == 2
+        assert data["open_incidents_by_severity"] == {"critical": 1, "high": 1, "medium": 0, "low": 0}
+        assert data["active_blockers"] == 1
+        assert len(data["recent_status_updates"]) == 2
+        assert data["recent_status_updates"][0]["user"]["id"] == test_user.id
+        assert [d["title"] for d in data["recent_decisions"]] == ["Decision 2", "Decision 1"]
+
+    def test_dashboard_cached_until_write(self, client, auth_headers, query_counter):
+        """Test the dashboard is served from cache until a shown collection changes."""
+        client.get("/api/dashboard", headers=auth_headers)
+        query_counter.clear()
+        client.get("/api/dashboard", headers=auth_headers)
+        assert not any("FROM incidents" in statement for statement in query_counter)
+
+        client.post(
+            "/api/incidents", headers=auth_headers,
+            json={"title": "Outage", "description": "d", "severity": "critical"}
+        )
+        response = client.get("/api/dashboard", headers=auth_headers)
+        assert response.json()["open_incidents_by_severity"]["critical"] == 1
+
+    def test_requires_auth(self, client):
+        """Test the dashboard requires authentication."""
+        response = client.get("/api/dashboard")
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
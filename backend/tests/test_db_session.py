@@ -0,0 +1,21 @@
+"""
+Tests for database engine configuration.
+"""
+from app.db.session import get_async_database_url
+
+
+class TestAsyncDatabaseUrl:
+    """Test deriving the asyncpg URL from DATABASE_URL."""
+
+    def test_translates_libpq_parameters(self):
+        """Test sslmode is renamed for asyncpg and libpq-only parameters are dropped."""
+        url = get_async_database_url(
+            "postgresql://user:p%40ss@db:5432/asyncops?sslmode=require&connect_timeout=5&application_name=api"
+        )
+        assert url == "postgresql+asyncpg://user:p%40ss@db:5432/asyncops?ssl=require&timeout=5"
+
+    def test_override_and_other_databases(self):
+        """Test an explicit async URL wins and non-Postgres URLs are left alone."""
+        assert get_async_database_url("postgresql://db/x", "postgresql+asyncpg://other/y") == "postgresql+asyncpg://other/y"
+        assert get_async_database_url("postgres://db/x") == "postgresql+asyncpg://db/x"
+        assert get_async_database_url("sqlite:///./app.db") == "sqlite:///./app.db"
@@ -0,0 +1,169 @@
+"""
+Tests for the live change feed.
+"""
+import asyncio
+import json
+from types import SimpleNamespace
+from fastapi import status
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from app.api.v1.endpoints.events import _event_stream
+from app.db.models.outbox_event import OutboxEvent
+from app.services.change_feed import ChangeFeed, change_feed, record_change
+
+
+def _drain(queue):
+    changes = []
+    while not queue.empty():
+        change = queue.get_nowait()
+        if change is not None:
+            # Outbox ids and positions depend on what else the test wrote; only their order matters here
+            change.pop("event_id")
+            change.pop("position")
+        changes.append(change)
+    return changes
+
+
+class TestChangeFeed:
+    """Test change events published by write handlers."""
+
+    def test_writes_publish_after_commit(self, client, auth_headers):
+        """Test create, status and archive handlers each publish one change."""
+        queue = change_feed.subscribe()
+        try:
+            response = client.post(
+                "/api/incidents", headers=auth_headers,
+                json={"title": "Outage", "description": "d", "severity": "high"}
+            )
+            incident_id = response.json()["id"]
+            client.patch(f"/api/incidents/{incident_id}/status", headers=auth_headers, json={"status": "resolved"})
+            client.patch(f"/api/incidents/{incident_id}/archive", headers=auth_headers)
+        finally:
+            change_feed.unsubscribe(queue)
+
+        assert _drain(queue) == [
+            {"collection": "incidents", "action": "created", "id": incident_id},
+            {"collection": "incidents", "action": "status_changed", "id": incident_id},
+            {"collection": "incidents", "action": "archived", "id": incident_id},
+        ]
+
+    def test_rolled_back_change_is_not_published(self):
+        """Test a change recorded in a transaction that rolls back is never announced."""
+        async def record(finish):
+            engine = create_async_engine("sqlite+aiosqlite://")
+            async with engine.begin() as conn:
+                await conn.run_sync(OutboxEvent.__table__.create)
+            try:
+                async with AsyncSession(engine) as db:
+                    await record_change(db, "decisions", "updated", 1)
+                    await finish(db)
+            finally:
+                await engine.dispose()
+
+        queue = change_feed.subscribe()
+        try:
+            asyncio.run(record(lambda db: db.rollback()))
+            assert _drain(queue) == []
+            asyncio.run(record(lambda db: db.commit()))
+            assert _drain(queue) == [{"collection": "decisions", "action": "updated", "id": 1}]
+        finally:
+            change_feed.unsubscribe(queue)
+
+    def test_lagging_subscriber_is_disconnected(self):
+        """Test a full queue is replaced by the end-of-stream marker."""
+        feed = ChangeFeed(queue_size=2)
+        queue = feed.subscribe()
+        for i in range(3):
+            feed.publish({"collection": "blockers", "action": "updated", "id": i})
+        assert _drain(queue) == [None]
+        assert len(feed) == 0
+
+
+class TestEventStream:
+    """Test the /api/events endpoint."""
+
+    def test_requires_token(self, client):
+        """Test the stream needs a bearer header or ticket."""
+        response = client.get("/api/events")
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+        response = client.get("/api/events?ticket=not-a-ticket")
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_ticket_only_opens_streams(self, client, auth_headers, monkeypatch):
+        """Test a ticket opens a stream resuming from ``after``, and isn't interchangeable with access tokens."""
+        from app.api.v1.endpoints import events
+
+        response = client.post("/api/events/ticket", headers=auth_headers)
+        assert response.status_code == status.HTTP_200_OK
+        ticket = response.json()["ticket"]
+        assert response.json()["expires_in"] == events.settings.EVENTS_TICKET_EXPIRE_SECONDS
+
+        resumed_after = []
+
+        async def missed_changes(db, position):
+            resumed_after.append(position)
+            return [], False
+
+        def stream(request, queue, missed, reset):
+            change_feed.unsubscribe(queue)
+            return iter(())
+
+        monkeypatch.setattr(events, "_missed_changes", missed_changes)
+        monkeypatch.setattr(events, "_event_stream", stream)
+        assert client.get(f"/api/events?ticket={ticket}&after=7").status_code == status.HTTP_200_OK
+        assert resumed_after == [7]
+
+        response = client.get("/api/users/me", headers={"Authorization": f"Bearer {ticket}"})
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        access_token = auth_headers["Authorization"].split()[1]
+        response = client.get(f"/api/events?ticket={access_token}")
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_stream_format(self):
+        """Test replayed and live changes are framed as SSE events, without repeats."""
+        async def collect():
+            request = SimpleNamespace(is_disconnected=lambda: asyncio.sleep(0, result=False))
+            queue = change_feed.subscribe()
+            # Event 3 committed after event 4, so it was positioned after it
+            missed = [{"event_id": 4, "position": 10, "collection": "decisions", "action": "created", "id": 7}]
+            queue.put_nowait(missed[0])
+            queue.put_nowait({"event_id": 3, "position": 11, "collection": "decisions", "action": "updated", "id": 7})
+            queue.put_nowait(None)
+            return [chunk async for chunk in _event_stream(request, queue, missed)]
+
+        chunks = asyncio.run(collect())
+        assert chunks[0].startswith("retry: ")
+        assert chunks[1] == "id: 10\nevent: change\ndata: " + json.dumps(
+            {"event_id": 4, "position": 10, "collection": "decisions", "action": "created", "id": 7}
+        ) + "\n\n"
+        assert chunks[2].startswith("id: 11\n")
+        assert len(chunks) == 3
+        assert len(change_feed) == 0
+
+    def test_replay_after_last_event_id(self, client, auth_headers, db_session, monkeypatch):
+        """Test missed events are read from the outbox in commit order, or a reset is sent when too many were missed."""
+        from app.api.v1.endpoints import events
+
+        for i in range(3):
+            client.post("/api/status", headers=auth_headers, json={"title": f"t{i}", "content": "c"})
+        outbox_events = db_session.query(OutboxEvent).order_by(OutboxEvent.id).all()
+        ids = [event.id for event in outbox_events]
+        # The first event's transaction committed last, so it was positioned after the others
+        outbox_events[0].position = outbox_events[-1].position + 1
+        db_session.commit()
+
+        captured = {}
+
+        def capture(request, queue, missed, reset):
+            change_feed.unsubscribe(queue)
+            captured.update(missed=missed, reset=reset)
+            return iter(())
+
+        monkeypatch.setattr(events, "_event_stream", capture)
+        client.get("/api/events", headers={**auth_headers, "Last-Event-ID": str(ids[1])})
+        assert [change["event_id"] for change in captured["missed"]] == [ids[2], ids[0]]
+        assert captured["reset"] is False
+
+        monkeypatch.setattr(events.settings, "OUTBOX_REPLAY_LIMIT", 1)
+        client.get("/api/events", headers={**auth_headers, "Last-Event-ID": str(ids[1])})
+        assert captured == {"missed": [], "reset": True}
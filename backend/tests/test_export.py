@@ -0,0 +1,88 @@
+"""
+Tests for the streaming export endpoints.
+"""
+import csv
+import io
+import json
+from fastapi import status
+from app.core.config import settings
+
+
+def _bulk_create(client, auth_headers, collection, items):
+    response = client.post(f"/api/{collection}/bulk", headers=auth_headers, json={"items": items})
+    return response.json()["ids"]
+
+
+def _ndjson(response):
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+class TestExport:
+    """Test exporting whole collections as NDJSON and CSV."""
+
+    def test_export_incidents_ndjson_with_list_filters(self, client, auth_headers, test_user, monkeypatch):
+        """Test every matching row is streamed, across several cursor batches."""
+        monkeypatch.setattr(settings, "EXPORT_BATCH_SIZE", 2)
+        ids = _bulk_create(client, auth_headers, "incidents", [
+            {"title": f"Outage {i}", "description": "d", "severity": "critical" if i % 2 else "low"}
+            for i in range(7)
+        ])
+
+        response = client.get("/api/incidents/export?severity=critical", headers=auth_headers)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        assert 'filename="incidents.ndjson"' in response.headers["content-disposition"]
+        rows = _ndjson(response)
+        assert [row["id"] for row in rows] == ids[1::2]
+        assert rows[0]["title"] == "Outage 1"
+        assert rows[0]["reported_by_id"] == test_user.id
+        assert rows[0]["archived"] is False
+        assert rows[0]["resolved_at"] is None
+
+        client.patch("/api/incidents/bulk/archive", headers=auth_headers, json={"ids": ids[:3]})
+        archived = _ndjson(client.get("/api/incidents/export?archived=true", headers=auth_headers))
+        assert [row["id"] for row in archived] == ids[:3]
+
+    def test_export_status_updates_csv(self, client, auth_headers):
+        """Test CSV has a header row, JSON-encoded lists and neutralized formulas."""
+        _bulk_create(client, auth_headers, "status", [
+            {"title": "=HYPERLINK(\"x\")", "content": "line one\nline two", "tags": ["ops", "db"]},
+            {"title": "Untagged", "content": "c"},
+        ])
+
+        response = client.get("/api/status/export?format=csv", headers=auth_headers)
+        assert response.headers["content-type"].startswith("text/csv")
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert list(rows[0]) == ["id", "title", "content", "tags", "user_id", "created_at", "updated_at"]
+        assert rows[0]["title"] == "'=HYPERLINK(\"x\")"
+        assert rows[0]["content"] == "line one\nline two"
+        assert json.loads(rows[0]["tags"]) == ["ops", "db"]
+        assert rows[1]["tags"] == ""
+
+        response = client.get("/api/status/export?format=csv&tags=ops", headers=auth_headers)
+        assert len(list(csv.DictReader(io.StringIO(response.text)))) == 1
+
+    def test_export_decisions_and_blockers(self, client, auth_headers):
+        """Test decision and blocker exports apply their list filters."""
+        decision = {"description": "d", "context": "c", "outcome": "o", "decision_date": "2024-03-01"}
+        _bulk_create(client, auth_headers, "decisions", [
+            {**decision, "title": "Adopt Postgres", "tags": ["db"]},
+            {**decision, "title": "Adopt React", "tags": ["frontend"]},
+        ])
+        rows = _ndjson(client.get("/api/decisions/export?tag=db", headers=auth_headers))
+        assert [(row["title"], row["decision_date"], row["tags"]) for row in rows] == [
+            ("Adopt Postgres", "2024-03-01", ["db"])
+        ]
+
+        ids = _bulk_create(client, auth_headers, "blockers", [
+            {"description": f"Blocked {i}", "impact": "i"} for i in range(2)
+        ])
+        client.patch("/api/blockers/bulk/resolve", headers=auth_headers, json={"ids": ids[:1]})
+        rows = _ndjson(client.get("/api/blockers/export?status=active", headers=auth_headers))
+        assert [row["id"] for row in rows] == ids[1:]
+
+    def test_export_validation(self, client, auth_headers):
+        """Test authentication is required and unknown formats are rejected."""
+        assert client.get("/api/incidents/export").status_code == status.HTTP_401_UNAUTHORIZED
+        response = client.get("/api/incidents/export?format=xlsx", headers=auth_headers)
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
@@ -184,6 +184,102 @@ class TestGetIncidents:
         assert data["total"] == 1
         assert data["items"][0]["severity"] == "critical"
     
+    def test_get_incidents_ordered_by_severity_then_newest(self, client, auth_headers, test_user, db_session):
+        """Test incidents are ordered critical first, then newest first, across pages."""
+        from app.db.models.incident import Incident
+        
+        for i, severity in enumerate(["low", "critical", "medium", "high", "critical"]):
+            db_session.add(Incident(
+                title=f"{severity} {i}",
+                description="Test",
+                severity=severity,
+                reported_by_id=test_user.id,
+                created_at=datetime(2024, 1, 1 + i, tzinfo=timezone.utc)
+            ))
+        db_session.commit()
+        
+        response = client.get("/api/incidents?limit=3", headers=auth_headers)
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["total"] == 5
+        assert [item["title"] for item in data["items"]] == ["critical 4", "critical 1", "high 3"]
+        
+        response = client.get("/api/incidents?limit=3&page=2", headers=auth_headers)
+        assert [item["title"] for item in response.json()["items"]] == ["medium 2", "low 0"]
+    
+    def test_get_incidents_cursor_pagination(self, client, auth_headers, test_user, db_session):
+        """Test walking incidents with next_cursor keeps severity-then-newest order."""
+        from app.db.models.incident import Incident
+        
+        for i, severity in enumerate(["low", "critical", "medium", "high", "critical"]):
+            db_session.add(Incident(
+                title=f"{severity} {i}",
+                description="Test",
+                severity=severity,
+                reported_by_id=test_user.id,
+                created_at=datetime(2024, 1, 1 + i, tzinfo=timezone.utc)
+            ))
+        db_session.commit()
+        
+        titles = []
+        response = client.get("/api/incidents?limit=2", headers=auth_headers)
+        while True:
+            assert response.status_code == status.HTTP_200_OK
+            data = response.json()
+            titles.extend(item["title"] for item in data["items"])
+            if not data["next_cursor"]:
+                break
+            response = client.get(
+                f"/api/incidents?limit=2&cursor={data['next_cursor']}",
+                headers=auth_headers
+            )
+        
+        assert titles == ["critical 4", "critical 1", "high 3", "medium 2", "low 0"]
+    
+    def test_get_incidents_count_strategies(self, client, auth_headers, test_user, db_session):
+        """Test the exact, estimated, cached and none total strategies."""
+        from app.db.models.incident import Incident
+        from app.core.response_cache import clear_response_cache
+        
+        def add_incidents(n):
+            for i in range(n):
+                db_session.add(Incident(
+                    title=f"Incident {i}",
+                    description="Test",
+                    severity="medium",
+                    reported_by_id=test_user.id
+                ))
+            db_session.commit()
+        
+        add_incidents(3)
+        
+        for strategy in ["exact", "estimated", "cached"]:
+            response = client.get(f"/api/incidents?count={strategy}", headers=auth_headers)
+            assert response.status_code == status.HTTP_200_OK
+            assert response.json()["total"] == 3
+        
+        response = client.get("/api/incidents?count=none&limit=2", headers=auth_headers)
+        data = response.json()
+        assert data["total"] is None
+        assert data["has_more"] is True
+        assert len(data["items"]) == 2
+        
+        # Cached totals are reused for the same filter set until the TTL expires
+        add_incidents(2)
+        # Rows written outside the API don't invalidate cached responses; expire them
+        clear_response_cache()
+        response = client.get("/api/incidents?count=cached", headers=auth_headers)
+        assert response.json()["total"] == 3
+        response = client.get("/api/incidents?count=exact", headers=auth_headers)
+        assert response.json()["total"] == 5
+        response = client.get("/api/incidents?count=cached&severity=medium", headers=auth_headers)
+        assert response.json()["total"] == 5
+    
+    def test_get_incidents_invalid_count_strategy(self, client, auth_headers):
+        """Test an unknown count strategy is rejected."""
+        response = client.get("/api/incidents?count=sometimes", headers=auth_headers)
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    
     def test_get_incidents_filter_by_assigned_user(self, client, auth_headers, test_user, test_admin, db_session):
         """Test filtering incidents by assigned user."""
         from app.db.models.incident import Incident
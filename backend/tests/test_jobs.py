@@ -0,0 +1,179 @@
+"""
+Tests for the background job queue and worker.
+"""
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+from fastapi import status
+from app.db.models.daily_summary import DailySummary
+from app.db.models.job import Job
+from app.services.job_queue import claim_job, enqueue_job, job_handler, purge_finished_jobs, _job_types
+from app.workers.job_worker import JobWorker
+from tests.conftest import TestingSessionLocal
+
+
+@pytest.fixture
+def flaky_job():
+    """Register a job type that fails on its first attempt."""
+    calls = []
+
+    @job_handler("flaky", concurrency=1, max_attempts=2)
+    def flaky(db, payload):
+        calls.append(payload)
+        if len(calls) == 1:
+            raise RuntimeError("temporary failure")
+
+    yield calls
+    _job_types.pop("flaky", None)
+
+
+def _drain(worker):
+    executor = ThreadPoolExecutor(max_workers=worker.threads)
+    claimed = worker.claim_available(executor)
+    executor.shutdown(wait=True)
+    return claimed
+
+
+class TestJobQueue:
+    """Test claiming, retries and completion."""
+
+    def test_claim_order_and_skip_future_jobs(self, db_session, flaky_job):
+        """Test jobs are claimed by priority and not before run_at."""
+        now = datetime.now(timezone.utc)
+        low = enqueue_job(db_session, "flaky", priority=0)
+        high = enqueue_job(db_session, "flaky", priority=5)
+        enqueue_job(db_session, "flaky", priority=10, run_at=now + timedelta(hours=1))
+        db_session.commit()
+
+        assert claim_job(db_session, ["flaky"], "w1").id == high.id
+        job = claim_job(db_session, ["flaky"], "w1")
+        assert job.id == low.id
+        assert job.status == "running"
+        assert job.attempts == 1
+        assert claim_job(db_session, ["flaky"], "w1") is None
+
+    def test_failed_attempt_is_retried_with_backoff(self, db_session, flaky_job):
+        """Test a failing job is requeued for later and succeeds on retry."""
+        job = enqueue_job(db_session, "flaky", payload={"n": 1})
+        db_session.commit()
+        worker = JobWorker(session_factory=TestingSessionLocal, threads=2)
+
+        assert _drain(worker) == 1
+        db_session.refresh(job)
+        assert job.status == "queued"
+        assert "temporary failure" in job.last_error
+        assert job.run_at.replace(tzinfo=timezone.utc) > datetime.now(timezone.utc)
+
+        # Not due yet
+        assert _drain(worker) == 0
+
+        job.run_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+        db_session.commit()
+        assert _drain(worker) == 1
+        db_session.refresh(job)
+        assert job.status == "succeeded"
+        assert job.attempts == 2
+        assert flaky_job == [{"n": 1}, {"n": 1}]
+
+    def test_per_type_concurrency(self, db_session, flaky_job):
+        """Test a worker claims no more jobs of a type than its concurrency."""
+        for _ in range(3):
+            enqueue_job(db_session, "flaky")
+        db_session.commit()
+        worker = JobWorker(session_factory=TestingSessionLocal, threads=4)
+        worker._running["flaky"] = 1
+
+        assert worker.claim_available(ThreadPoolExecutor(max_workers=1)) == 0
+
+    def test_stale_running_job_is_reclaimed(self, db_session, flaky_job):
+        """Test a job whose worker died is claimed again after the lock timeout."""
+        job = enqueue_job(db_session, "flaky")
+        db_session.commit()
+        claim_job(db_session, ["flaky"], "dead-worker")
+        assert claim_job(db_session, ["flaky"], "w2") is None
+
+        job = db_session.get(Job, job.id)
+        job.locked_at = datetime.now(timezone.utc) - timedelta(days=1)
+        db_session.commit()
+        reclaimed = claim_job(db_session, ["flaky"], "w2")
+        assert reclaimed.locked_by == "w2"
+        assert reclaimed.attempts == 2
+
+    def test_stale_job_without_attempts_left_fails(self, db_session, flaky_job):
+        """Test an orphaned job on its last attempt is failed rather than reclaimed."""
+        job = enqueue_job(db_session, "flaky")
+        db_session.commit()
+        claim_job(db_session, ["flaky"], "dead-worker")
+
+        job = db_session.get(Job, job.id)
+        job.attempts = job.max_attempts
+        job.locked_at = datetime.now(timezone.utc) - timedelta(days=1)
+        db_session.commit()
+        assert claim_job(db_session, ["flaky"], "w2") is None
+
+        db_session.refresh(job)
+        assert job.status == "failed"
+        assert job.locked_at is None
+        assert "no attempts are left" in job.last_error
+
+    def test_heartbeat_keeps_claim_fresh(self, db_session, flaky_job):
+        """Test a worker's heartbeat stops its long-running job being reclaimed."""
+        job = enqueue_job(db_session, "flaky")
+        db_session.commit()
+        worker = JobWorker(session_factory=TestingSessionLocal)
+        claim_job(db_session, ["flaky"], worker.worker_id)
+        worker._running["flaky"] = 1
+
+        job = db_session.get(Job, job.id)
+        job.locked_at = datetime.now(timezone.utc) - timedelta(days=1)
+        db_session.commit()
+        worker.heartbeat()
+
+        assert claim_job(db_session, ["flaky"], "w2") is None
+        db_session.refresh(job)
+        assert job.locked_by == worker.worker_id
+
+    def test_purge_keeps_recent_and_unfinished_jobs(self, db_session, flaky_job):
+        """Test only succeeded and failed jobs past the retention period are purged."""
+        long_ago = datetime.now(timezone.utc) - timedelta(days=30)
+        jobs = [enqueue_job(db_session, "flaky") for _ in range(4)]
+        jobs[0].status, jobs[0].finished_at = "succeeded", long_ago
+        jobs[1].status, jobs[1].finished_at = "failed", long_ago
+        jobs[2].status, jobs[2].finished_at = "succeeded", datetime.now(timezone.utc)
+        db_session.commit()
+
+        assert purge_finished_jobs(db_session) == 2
+        db_session.expire_all()
+        assert [job.id for job in db_session.query(Job).order_by(Job.id)] == [jobs[2].id, jobs[3].id]
+
+
+class TestJobEndpoints:
+    """Test job API endpoints."""
+
+    def test_queue_and_run_summary_job(self, client, admin_headers, db_session):
+        """Test an admin can queue a summary job that a worker then runs."""
+        response = client.post(
+            "/api/jobs", headers=admin_headers,
+            json={"job_type": "generate_daily_summary", "payload": {"summary_date": "2024-01-01"}}
+        )
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        job_id = response.json()["id"]
+        assert response.json()["status"] == "queued"
+
+        assert _drain(JobWorker(session_factory=TestingSessionLocal)) == 1
+
+        response = client.get(f"/api/jobs/{job_id}", headers=admin_headers)
+        assert response.json()["status"] == "succeeded"
+        assert db_session.query(DailySummary).filter(DailySummary.summary_date == date(2024, 1, 1)).count() == 1
+
+    def test_unknown_job_type(self, client, admin_headers):
+        """Test queueing an unregistered job type is rejected."""
+        response = client.post("/api/jobs", headers=admin_headers, json={"job_type": "nope"})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_jobs_admin_only(self, client, auth_headers):
+        """Test members cannot queue jobs."""
+        response = client.post(
+            "/api/jobs", headers=auth_headers, json={"job_type": "generate_daily_summary"}
+        )
+        assert response.status_code == status.HTTP_403_FORBIDDEN
@@ -0,0 +1,106 @@
+"""
+Tests for the transactional outbox and its relay.
+"""
+import pytest
+from app.db.models.outbox_event import OutboxEvent
+from app.services import outbox
+from app.services.outbox import purge_published_events, relay_batch, sequence_events
+
+
+@pytest.fixture
+def published(monkeypatch):
+    """Replace the registered publishers with one recording each batch."""
+    batches = []
+    monkeypatch.setattr(outbox, "_publishers", {"test": batches.append})
+    return batches
+
+
+def _outbox(db_session):
+    db_session.expire_all()
+    return db_session.query(OutboxEvent).order_by(OutboxEvent.id).all()
+
+
+class TestOutbox:
+    """Test outbox rows are written with each change."""
+
+    def test_changes_write_outbox_rows(self, client, auth_headers, db_session):
+        """Test each mutation adds one outbox row in order."""
+        response = client.post(
+            "/api/blockers", headers=auth_headers, json={"description": "Waiting", "impact": "Slips"}
+        )
+        blocker_id = response.json()["id"]
+        client.patch(f"/api/blockers/{blocker_id}/resolve", headers=auth_headers, json={})
+
+        events = _outbox(db_session)
+        assert [(e.collection, e.action, e.entity_id) for e in events] == [
+            ("blockers", "created", blocker_id),
+            ("blockers", "resolved", blocker_id),
+        ]
+        assert all(e.published_at is None for e in events)
+
+    def test_rejected_change_writes_nothing(self, client, auth_headers, db_session):
+        """Test a failed request leaves no outbox row."""
+        client.patch("/api/blockers/999/resolve", headers=auth_headers, json={})
+        assert _outbox(db_session) == []
+
+
+class TestOutboxRelay:
+    """Test relaying outbox batches to publishers."""
+
+    def _add_events(self, db_session, count):
+        for i in range(count):
+            db_session.add(OutboxEvent(collection="incidents", action="updated", entity_id=i))
+        db_session.commit()
+
+    def test_relays_in_order_and_marks_published(self, db_session, published):
+        """Test batches arrive oldest first and aren't relayed twice."""
+        self._add_events(db_session, 3)
+        assert relay_batch(db_session) == 0
+        assert sequence_events(db_session) == 3
+
+        assert relay_batch(db_session, batch_size=2) == 2
+        assert relay_batch(db_session, batch_size=2) == 1
+        assert relay_batch(db_session, batch_size=2) == 0
+        assert [[event["id"] for event in batch] for batch in published] == [[0, 1], [2]]
+        assert all(event.published_at is not None for event in _outbox(db_session))
+
+    def test_relays_in_commit_order(self, db_session, published):
+        """Test events are relayed by position, and an unsequenced event with a lower id doesn't block or precede them."""
+        self._add_events(db_session, 3)
+        # Event 0's transaction committed last, after events 1 and 2 were sequenced
+        late = _outbox(db_session)[0]
+        db_session.query(OutboxEvent).filter(OutboxEvent.id != late.id).update(
+            {OutboxEvent.position: OutboxEvent.id + 10}, synchronize_session=False
+        )
+        db_session.commit()
+
+        assert relay_batch(db_session) == 2
+        # What the PostgreSQL sequencer does once the late transaction is visible
+        late.position = max(event.position for event in _outbox(db_session) if event.position) + 1
+        db_session.commit()
+        assert relay_batch(db_session) == 1
+        assert [[event["id"] for event in batch] for batch in published] == [[1, 2], [0]]
+
+    def test_failed_publish_is_retried(self, db_session, monkeypatch):
+        """Test a publisher error leaves the batch unpublished for the next attempt."""
+        self._add_events(db_session, 1)
+        sequence_events(db_session)
+
+        def fail(batch):
+            raise RuntimeError("webhook down")
+
+        monkeypatch.setattr(outbox, "_publishers", {"test": fail})
+        with pytest.raises(RuntimeError):
+            relay_batch(db_session)
+        assert _outbox(db_session)[0].published_at is None
+
+    def test_purge_keeps_recent_and_unpublished_events(self, db_session, published, monkeypatch):
+        """Test only published events past the retention period are purged."""
+        self._add_events(db_session, 2)
+        sequence_events(db_session)
+        relay_batch(db_session, batch_size=1)
+
+        assert purge_published_events(db_session) == 0
+        monkeypatch.setattr(outbox.settings, "OUTBOX_RETENTION_DAYS", -1)
+        assert purge_published_events(db_session) == 1
+        assert [event.entity_id for event in _outbox(db_session)] == [1]
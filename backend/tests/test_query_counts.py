@@ -0,0 +1,128 @@
+"""
+Tests that list endpoints issue a fixed number of queries regardless of page size.
+"""
+import pytest
+from fastapi import status
+from datetime import date
+
+
+def _count_queries(client, query_counter, url, headers):
+    query_counter.clear()
+    response = client.get(url, headers=headers)
+    assert response.status_code == status.HTTP_200_OK
+    return len(query_counter), response.json()
+
+
+class TestListQueryCounts:
+    """Relationship loading must not add a query per row (N+1)."""
+    
+    def test_incidents_query_count(self, client, auth_headers, test_user, test_admin, db_session, query_counter):
+        """Test incidents list loads reporter and assignee with the page."""
+        from app.db.models.incident import Incident
+        
+        for i in range(10):
+            db_session.add(Incident(
+                title=f"Incident {i}",
+                description="Test",
+                severity="high",
+                reported_by_id=test_user.id,
+                assigned_to_id=test_admin.id
+            ))
+        db_session.commit()
+        
+        # current user + count + page
+        count, data = _count_queries(client, query_counter, "/api/incidents", auth_headers)
+        assert len(data["items"]) == 10
+        assert data["items"][0]["assigned_to"]["id"] == test_admin.id
+        assert count == 3
+    
+    def test_blockers_query_count(self, client, auth_headers, test_user, db_session, query_counter):
+        """Test blockers list loads reporters with the page."""
+        from app.db.models.blocker import Blocker
+        
+        for i in range(10):
+            db_session.add(Blocker(
+                description=f"Blocker {i}",
+                impact="Test",
+                reported_by_id=test_user.id
+            ))
+        db_session.commit()
+        
+        count, data = _count_queries(client, query_counter, "/api/blockers", auth_headers)
+        assert len(data["items"]) == 10
+        assert data["items"][0]["reported_by"]["id"] == test_user.id
+        assert count == 3
+    
+    def test_status_updates_query_count(self, client, auth_headers, test_user, db_session, query_counter):
+        """Test status updates list loads authors with the page."""
+        from app.db.models.status_update import StatusUpdate
+        
+        for i in range(10):
+            db_session.add(StatusUpdate(
+                title=f"Update {i}",
+                content="Test",
+                user_id=test_user.id
+            ))
+        db_session.commit()
+        
+        count, data = _count_queries(client, query_counter, "/api/status", auth_headers)
+        assert len(data["items"]) == 10
+        assert data["items"][0]["user"]["id"] == test_user.id
+        assert count == 3
+    
+    def test_decisions_query_count(self, client, auth_headers, test_user, test_admin, db_session, query_counter):
+        """Test decisions list loads creators, participants and their users in fixed queries."""
+        from app.db.models.decision import Decision, DecisionParticipant
+        
+        for i in range(10):
+            decision = Decision(
+                title=f"Decision {i}",
+                description="Test",
+                context="Test",
+                outcome="Test",
+                decision_date=date(2024, 1, 1 + i),
+                created_by_id=test_user.id
+            )
+            db_session.add(decision)
+            db_session.flush()
+            db_session.add(DecisionParticipant(decision_id=decision.id, user_id=test_user.id))
+            db_session.add(DecisionParticipant(decision_id=decision.id, user_id=test_admin.id))
+        db_session.commit()
+        
+        # current user + count + page + participants (with users)
+        count, data = _count_queries(client, query_counter, "/api/decisions", auth_headers)
+        assert len(data["items"]) == 10
+        assert len(data["items"][0]["participants"]) == 2
+        assert data["items"][0]["participants"][0]["user"] is not None
+        assert count == 4
+    
+    def test_decision_audit_query_count(self, client, auth_headers, test_user, db_session, query_counter):
+        """Test decision audit trail loads the changing users with the entries."""
+        from app.db.models.decision import Decision, DecisionAuditLog
+        
+        decision = Decision(
+            title="Decision",
+            description="Test",
+            context="Test",
+            outcome="Test",
+            decision_date=date(2024, 1, 1),
+            created_by_id=test_user.id
+        )
+        db_session.add(decision)
+        db_session.flush()
+        for i in range(10):
+            db_session.add(DecisionAuditLog(
+                decision_id=decision.id,
+                changed_by_id=test_user.id,
+                change_type="updated",
+                field_name="title"
+            ))
+        db_session.commit()
+        
+        # current user + decision + audit entries
+        count, data = _count_queries(
+            client, query_counter, f"/api/decisions/{decision.id}/audit", auth_headers
+        )
+        assert len(data["items"]) == 10
+        assert data["items"][0]["changed_by"]["id"] == test_user.id
+        assert count == 3
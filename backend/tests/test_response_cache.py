@@ -0,0 +1,64 @@
+"""
+Tests for the read endpoint response cache.
+"""
+from fastapi import status
+
+
+class TestResponseCache:
+    """Test cached list responses and their invalidation."""
+
+    def test_hit_skips_queries_regardless_of_param_order(self, client, auth_headers, query_counter):
+        """Test a repeated request, with parameters in any order, runs no list queries."""
+        client.get("/api/incidents?severity=high&limit=5", headers=auth_headers)
+        query_counter.clear()
+        response = client.get("/api/incidents?limit=5&severity=high", headers=auth_headers)
+        assert response.status_code == status.HTTP_200_OK
+        assert not any("FROM incidents" in statement for statement in query_counter)
+
+    def test_write_invalidates(self, client, auth_headers):
+        """Test a create through the API is visible on the next read."""
+        assert client.get("/api/incidents", headers=auth_headers).json()["total"] == 0
+        client.post(
+            "/api/incidents", headers=auth_headers,
+            json={"title": "Outage", "description": "d", "severity": "high"}
+        )
+        assert client.get("/api/incidents", headers=auth_headers).json()["total"] == 1
+
+    def test_summaries_invalidated_by_summary_jobs(self, client, auth_headers, admin_headers, run_jobs):
+        """Test the summary list reflects today's summary being updated by a status update."""
+        client.post("/api/summaries/generate", headers=admin_headers)
+        before = client.get("/api/summaries", headers=auth_headers).json()["items"][0]
+        client.post("/api/status", headers=auth_headers, json={"title": "t", "content": "c"})
+        client.get("/api/summaries", headers=auth_headers)
+        run_jobs()
+        after = client.get("/api/summaries", headers=auth_headers).json()["items"][0]
+        assert after["status_updates_count"] == before["status_updates_count"] + 1
+
+    def test_summaries_bypass_the_in_process_cache(self, client, auth_headers, query_counter):
+        """Test summary responses aren't cached per process, where job invalidations can't reach them."""
+        client.get("/api/summaries", headers=auth_headers)
+        query_counter.clear()
+        client.get("/api/summaries", headers=auth_headers)
+        assert any("FROM daily_summaries" in statement for statement in query_counter)
+
+    def test_users_invalidated_by_registration(self, client, auth_headers):
+        """Test a newly registered user is immediately assignable."""
+        before = client.get("/api/users/for-assignment", headers=auth_headers).json()
+        client.post(
+            "/api/auth/register",
+            json={"email": "new.user@example.com", "password": "securepassword123", "full_name": "New User"}
+        )
+        after = client.get("/api/users/for-assignment", headers=auth_headers).json()
+        assert len(after) == len(before) + 1
+
+    def test_auth_still_required(self, client):
+        """Test cached endpoints still run authentication."""
+        response = client.get("/api/incidents")
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_openapi_hides_cache_parameter(self, client):
+        """Test the injected request parameter isn't documented as a query parameter."""
+        schema = client.get("/openapi.json").json()
+        parameters = [p["name"] for p in schema["paths"]["/api/incidents"]["get"]["parameters"]]
+        assert "severity" in parameters
+        assert "cache_request" not in parameters
@@ -0,0 +1,88 @@
+"""
+Tests for the cross-entity search endpoint.
+"""
+from datetime import date
+from fastapi import status
+from app.db.models.blocker import Blocker
+from app.db.models.decision import Decision
+from app.db.models.incident import Incident
+from app.db.models.status_update import StatusUpdate
+
+
+def _add_searchable(db_session, user):
+    db_session.add_all([
+        StatusUpdate(user_id=user.id, title="Deploy pipeline migrated", content="Moved to the new runner"),
+        Incident(title="Deploy failed", description="Rollback needed", severity="high", reported_by_id=user.id),
+        Incident(
+            title="Old deploy outage", description="Resolved", severity="low",
+            reported_by_id=user.id, archived=True
+        ),
+        Blocker(description="Waiting on deploy credentials", impact="Release slips", reported_by_id=user.id),
+        Decision(
+            created_by_id=user.id, title="Freeze deploys on Fridays",
+            description="Fewer weekend pages", context="c", outcome="o", decision_date=date(2024, 1, 5)
+        ),
+        Decision(
+            created_by_id=user.id, title="Adopt OpenAPI", description="Generate clients", context="c", outcome="o",
+            decision_date=date(2024, 1, 6)
+        ),
+    ])
+    db_session.commit()
+
+
+class TestSearch:
+    """Test GET /api/search."""
+
+    def test_search_across_types(self, client, auth_headers, db_session, test_user):
+        """Test hits from every type are returned together, excluding archived items."""
+        _add_searchable(db_session, test_user)
+
+        response = client.get("/api/search?q=deploy", headers=auth_headers)
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["total"] == 4
+        assert data["has_more"] is False
+        assert sorted(hit["type"] for hit in data["items"]) == ["blocker", "decision", "incident", "status_update"]
+        assert "Old deploy outage" not in [hit["title"] for hit in data["items"]]
+
+    def test_types_filter_and_paging(self, client, auth_headers, db_session, test_user):
+        """Test types narrows the searched tables and pages report the overall total."""
+        _add_searchable(db_session, test_user)
+
+        response = client.get("/api/search?q=deploy&types=incidents,decisions&limit=1", headers=auth_headers)
+        data = response.json()
+        assert data["total"] == 2
+        assert data["has_more"] is True
+        assert len(data["items"]) == 1
+
+        response = client.get("/api/search?q=deploy&types=incidents,decisions&limit=1&page=2", headers=auth_headers)
+        data = response.json()
+        assert data["has_more"] is False
+        assert {hit["type"] for hit in data["items"]} <= {"incident", "decision"}
+
+    def test_unknown_type_rejected(self, client, auth_headers):
+        """Test an unknown type is a 400."""
+        response = client.get("/api/search?q=deploy&types=wikis", headers=auth_headers)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_single_query(self, client, auth_headers, db_session, test_user, query_counter):
+        """Test every type is searched in one statement."""
+        _add_searchable(db_session, test_user)
+
+        client.get("/api/search?q=deploy", headers=auth_headers)
+        searches = [s for s in query_counter if "UNION ALL" in s]
+        assert len(searches) == 1
+
+    def test_wildcards_match_literally(self, client, auth_headers, db_session, test_user):
+        """Test %, _ and backslash in the query aren't treated as LIKE wildcards."""
+        _add_searchable(db_session, test_user)
+        db_session.add_all([
+            StatusUpdate(user_id=test_user.id, title="Error rate at 5% today", content="c"),
+            StatusUpdate(user_id=test_user.id, title="Renamed max_conn", content="c"),
+            StatusUpdate(user_id=test_user.id, title="Fixed C:\\temp path", content="c"),
+        ])
+        db_session.commit()
+
+        for q, title in [("%", "Error rate at 5% today"), ("_", "Renamed max_conn"), ("\\", "Fixed C:\\temp path")]:
+            data = client.get("/api/search", params={"q": q}, headers=auth_headers).json()
+            assert [hit["title"] for hit in data["items"]] == [title]
@@ -115,6 +115,41 @@ class TestGetStatusUpdates:
         assert data["page"] == 1
         assert data["total"] == 5
     
+    def test_get_status_updates_cursor_pagination(self, client, auth_headers, test_user, db_session):
+        """Test walking status updates with next_cursor, including created_at ties."""
+        from app.db.models.status_update import StatusUpdate
+        
+        base = datetime(2024, 1, 1, 12, 0, 0)
+        # Updates 1 and 2 share a timestamp; id breaks the tie
+        for i, minutes in enumerate([0, 1, 1, 2, 3]):
+            db_session.add(StatusUpdate(
+                title=f"Status Update {i}",
+                content=f"Content {i}",
+                user_id=test_user.id,
+                created_at=base + timedelta(minutes=minutes)
+            ))
+        db_session.commit()
+        
+        titles = []
+        response = client.get("/api/status?limit=2", headers=auth_headers)
+        while True:
+            assert response.status_code == status.HTTP_200_OK
+            data = response.json()
+            titles.extend(item["title"] for item in data["items"])
+            if not data["next_cursor"]:
+                break
+            response = client.get(
+                f"/api/status?limit=2&cursor={data['next_cursor']}",
+                headers=auth_headers
+            )
+        
+        assert titles == [f"Status Update {i}" for i in [4, 3, 2, 1, 0]]
+    
+    def test_get_status_updates_invalid_cursor(self, client, auth_headers):
+        """Test a malformed cursor is rejected."""
+        response = client.get("/api/status?cursor=not-a-cursor", headers=auth_headers)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+    
     def test_get_status_updates_filter_by_author(self, client, auth_headers, test_user, test_admin, db_session):
         """Test filtering status updates by author."""
         from app.db.models.status_update import StatusUpdate
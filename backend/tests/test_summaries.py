@@ -0,0 +1,315 @@
+"""
+Tests for daily summary generation and endpoints.
+"""
+import pytest
+from fastapi import status
+from datetime import date, datetime, timedelta, timezone
+from app.db.models.status_update import StatusUpdate
+from app.db.models.incident import Incident
+from app.db.models.blocker import Blocker
+from app.db.models.decision import Decision
+from app.services.summary_service import create_daily_summary
+
+
+@pytest.fixture
+def summary_data(db_session, test_user):
+    """Activity spread inside and outside the summary windows."""
+    now = datetime.now(timezone.utc)
+    db_session.add_all([
+        StatusUpdate(user_id=test_user.id, title="Recent update", content="c", created_at=now - timedelta(hours=1)),
+        StatusUpdate(user_id=test_user.id, title="Old update", content="c", created_at=now - timedelta(days=3)),
+        Incident(title="Minor", description="d", severity="low", status="open", reported_by_id=test_user.id),
+        Incident(title="Outage", description="d", severity="critical", status="in_progress", reported_by_id=test_user.id),
+        Incident(title="Fixed", description="d", severity="critical", status="resolved", reported_by_id=test_user.id),
+        Blocker(description="Waiting on API key", impact="i", status="active", reported_by_id=test_user.id),
+        Blocker(description="Done", impact="i", status="resolved", reported_by_id=test_user.id),
+        Decision(
+            title="Recent decision", description="d", context="c", outcome="o",
+            decision_date=now.date() - timedelta(days=2), created_by_id=test_user.id
+        ),
+        Decision(
+            title="Old decision", description="d", context="c", outcome="o",
+            decision_date=now.date() - timedelta(days=30), created_by_id=test_user.id
+        ),
+    ])
+    db_session.commit()
+
+
+class TestBuildSummary:
+    """Test summary content generation."""
+
+    def test_summary_content_and_statistics(self, db_session, test_user, summary_data):
+        """Test summary lists and statistics cover only the summary windows."""
+        summary = create_daily_summary(db_session)
+        content = summary.content
+
+        assert [u["title"] for u in content["status_updates"]] == ["Recent update"]
+        assert content["status_updates"][0]["author"] == test_user.full_name
+        assert [i["title"] for i in content["incidents"]] == ["Outage", "Minor"]
+        assert [b["description"] for b in content["blockers"]] == ["Waiting on API key"]
+        assert [d["title"] for d in content["recent_decisions"]] == ["Recent decision"]
+        assert content["statistics"] == {
+            "total_status_updates": 1,
+            "critical_incidents": 1,
+            "active_blockers": 1,
+            "decisions_last_7_days": 1,
+        }
+        assert summary.incidents_count == 2
+        assert summary.summary_date == datetime.now(timezone.utc).date()
+
+    def test_summary_generation_query_count(self, db_session, summary_data):
+        """Test generation runs a fixed number of queries regardless of row counts."""
+        from sqlalchemy import event
+        from tests.conftest import engine
+
+        statements = []
+
+        def count_statement(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith("SELECT"):
+                statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", count_statement)
+        try:
+            create_daily_summary(db_session, summary_date=date(2024, 1, 1))
+        finally:
+            event.remove(engine, "before_cursor_execute", count_statement)
+
+        # Existing-summary lookup, one aggregate, four projections, refresh after insert
+        assert len(statements) == 7
+
+
+class TestSummaryEndpoints:
+    """Test summary API endpoints."""
+
+    def test_generate_summary_admin(self, client, admin_headers, summary_data):
+        """Test admins can generate a summary."""
+        response = client.post("/api/summaries/generate", headers=admin_headers)
+        assert response.status_code == status.HTTP_201_CREATED
+        data = response.json()
+        assert data["incidents_count"] == 2
+        assert data["content"]["statistics"]["critical_incidents"] == 1
+
+    def test_generate_summary_member_forbidden(self, client, auth_headers):
+        """Test members cannot generate summaries."""
+        response = client.post("/api/summaries/generate", headers=auth_headers)
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+class TestIncrementalSummary:
+    """Test changes recorded by mutation endpoints keep today's summary current."""
+
+    def _today_summary(self, client, admin_headers):
+        response = client.post("/api/summaries/generate", headers=admin_headers)
+        assert response.status_code == status.HTTP_201_CREATED
+        return response.json()
+
+    def _regenerate_incrementally(self, client, admin_headers, run_jobs):
+        run_jobs()
+        response = client.post("/api/summaries/generate?incremental=true", headers=admin_headers)
+        assert response.status_code == status.HTTP_201_CREATED
+        return response.json()
+
+    def test_writes_queue_summary_changes(self, client, auth_headers, admin_headers, db_session, query_counter):
+        """Test a write records a job instead of updating the summary row, and only once the summary exists."""
+        from app.db.models.job import Job
+
+        client.post("/api/status", headers=auth_headers, json={"title": "Before", "content": "c"})
+        assert db_session.query(Job).count() == 0
+
+        self._today_summary(client, admin_headers)
+        query_counter.clear()
+        incident = client.post(
+            "/api/incidents", headers=auth_headers,
+            json={"title": "Outage", "description": "d", "severity": "critical"}
+        ).json()
+
+        assert not any(statement.lstrip().upper().startswith("UPDATE DAILY_SUMMARIES") for statement in query_counter)
+        job = db_session.query(Job).filter(Job.job_type == "apply_summary_changes").one()
+        assert job.payload == {"kind": "incident", "ids": [incident["id"]]}
+
+    def test_incident_events_update_summary(self, client, auth_headers, admin_headers, run_jobs):
+        """Test incident create, resolve and archive are applied to the summary."""
+        self._today_summary(client, admin_headers)
+
+        low = client.post(
+            "/api/incidents", headers=auth_headers,
+            json={"title": "Slow page", "description": "d", "severity": "low"}
+        ).json()
+        critical = client.post(
+            "/api/incidents", headers=auth_headers,
+            json={"title": "Outage", "description": "d", "severity": "critical"}
+        ).json()
+
+        summary = self._regenerate_incrementally(client, admin_headers, run_jobs)
+        assert [i["id"] for i in summary["content"]["incidents"]] == [critical["id"], low["id"]]
+        assert summary["incidents_count"] == 2
+        assert summary["content"]["statistics"]["critical_incidents"] == 1
+
+        client.patch(f"/api/incidents/{critical['id']}/status", headers=auth_headers, json={"status": "resolved"})
+        client.patch(f"/api/incidents/{low['id']}/archive", headers=auth_headers)
+
+        summary = self._regenerate_incrementally(client, admin_headers, run_jobs)
+        assert summary["content"]["incidents"] == []
+        assert summary["incidents_count"] == 0
+        assert summary["content"]["statistics"]["critical_incidents"] == 0
+
+    def test_status_and_decision_events_update_summary(self, client, auth_headers, admin_headers, run_jobs):
+        """Test status updates and decisions are added, edited and removed."""
+        self._today_summary(client, admin_headers)
+
+        update = client.post(
+            "/api/status", headers=auth_headers, json={"title": "Shipped", "content": "c"}
+        ).json()
+        client.patch(f"/api/status/{update['id']}", headers=auth_headers, json={"title": "Shipped v2"})
+        decision = client.post(
+            "/api/decisions", headers=auth_headers,
+            json={
+                "title": "Adopt FastAPI", "description": "d", "context": "c", "outcome": "o",
+                "decision_date": datetime.now(timezone.utc).date().isoformat()
+            }
+        ).json()
+
+        summary = self._regenerate_incrementally(client, admin_headers, run_jobs)
+        assert [u["title"] for u in summary["content"]["status_updates"]] == ["Shipped v2"]
+        assert [d["id"] for d in summary["content"]["recent_decisions"]] == [decision["id"]]
+
+        client.delete(f"/api/status/{update['id']}", headers=auth_headers)
+        client.delete(f"/api/decisions/{decision['id']}", headers=auth_headers)
+
+        summary = self._regenerate_incrementally(client, admin_headers, run_jobs)
+        assert summary["status_updates_count"] == 0
+        assert summary["decisions_count"] == 0
+
+    def test_incremental_summary_matches_full_rebuild(self, client, auth_headers, admin_headers, run_jobs):
+        """Test the maintained summary equals a from-scratch rebuild."""
+        self._today_summary(client, admin_headers)
+
+        client.post("/api/blockers", headers=auth_headers, json={"description": "Waiting on keys", "impact": "i"})
+        resolved = client.post(
+            "/api/blockers", headers=auth_headers, json={"description": "Waiting on review", "impact": "i"}
+        ).json()
+        client.patch(f"/api/blockers/{resolved['id']}/resolve", headers=auth_headers, json={})
+        client.post("/api/incidents", headers=auth_headers, json={"title": "Outage", "description": "d", "severity": "high"})
+
+        incremental = self._regenerate_incrementally(client, admin_headers, run_jobs)
+        response = client.post("/api/summaries/generate?force_update=true", headers=admin_headers)
+        rebuilt = response.json()
+        assert incremental["content"] == rebuilt["content"]
+
+
+class TestHistoricalSummary:
+    """Test summaries for past dates and range backfills."""
+
+    @pytest.fixture
+    def history(self, db_session, test_user):
+        """Activity around 2024-03-10 (summaries are taken at the scheduled run time)."""
+        run_at = datetime(2024, 3, 10, 9, 0, tzinfo=timezone.utc)
+        db_session.add_all([
+            StatusUpdate(user_id=test_user.id, title="That morning", content="c", created_at=run_at - timedelta(hours=2)),
+            StatusUpdate(user_id=test_user.id, title="That afternoon", content="c", created_at=run_at + timedelta(hours=5)),
+            Incident(
+                title="Resolved later", description="d", severity="critical", status="resolved",
+                reported_by_id=test_user.id, created_at=run_at - timedelta(days=1),
+                resolved_at=run_at + timedelta(days=1)
+            ),
+            Incident(
+                title="Reported later", description="d", severity="high", status="open",
+                reported_by_id=test_user.id, created_at=run_at + timedelta(days=2)
+            ),
+            Decision(
+                title="That week", description="d", context="c", outcome="o",
+                decision_date=date(2024, 3, 8), created_by_id=test_user.id
+            ),
+            Decision(
+                title="Next week", description="d", context="c", outcome="o",
+                decision_date=date(2024, 3, 15), created_by_id=test_user.id
+            ),
+        ])
+        db_session.commit()
+
+    def test_past_summary_uses_its_own_window(self, db_session, history):
+        """Test a past date's summary reflects the data as of that day."""
+        summary = create_daily_summary(db_session, summary_date=date(2024, 3, 10))
+        content = summary.content
+
+        assert [u["title"] for u in content["status_updates"]] == ["That morning"]
+        assert [i["title"] for i in content["incidents"]] == ["Resolved later"]
+        assert content["statistics"]["critical_incidents"] == 1
+        assert [d["title"] for d in content["recent_decisions"]] == ["That week"]
+
+    def test_backfill_range_and_resume(self, client, admin_headers, history, run_jobs):
+        """Test backfill queues a job per missing date and skips existing summaries on re-run."""
+        params = {"start_date": "2024-03-09", "end_date": "2024-03-12"}
+        client.post("/api/summaries/generate?summary_date=2024-03-10", headers=admin_headers)
+
+        response = client.post("/api/summaries/backfill", headers=admin_headers, params=params)
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        data = response.json()
+        assert data["queued"] == ["2024-03-09", "2024-03-11", "2024-03-12"]
+        assert data["skipped"] == ["2024-03-10"]
+        job = client.get(f"/api/jobs/{data['job_ids'][1]}", headers=admin_headers).json()
+        assert (job["job_type"], job["status"]) == ("generate_daily_summary", "queued")
+        assert job["payload"] == {"summary_date": "2024-03-11", "force_update": False}
+
+        run_jobs()
+        summaries = client.get(
+            "/api/summaries", headers=admin_headers,
+            params={"start_date": "2024-03-09", "end_date": "2024-03-12"}
+        ).json()
+        counts = {s["summary_date"]: s["status_updates_count"] for s in summaries["items"]}
+        assert counts == {"2024-03-09": 0, "2024-03-10": 1, "2024-03-11": 1, "2024-03-12": 0}
+
+        response = client.post("/api/summaries/backfill", headers=admin_headers, params=params)
+        assert response.json()["job_ids"] == []
+        assert len(response.json()["skipped"]) == 4
+
+    def test_backfill_rejects_invalid_range(self, client, admin_headers):
+        """Test backfill validates the date range."""
+        response = client.post(
+            "/api/summaries/backfill", headers=admin_headers,
+            params={"start_date": "2024-03-12", "end_date": "2024-03-09"}
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+        response = client.post(
+            "/api/summaries/backfill", headers=admin_headers,
+            params={"start_date": "2020-01-01", "end_date": "2024-01-01"}
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+class TestSummaryScheduler:
+    """Test scheduler run times and leader election."""
+
+    def test_next_run_at(self, monkeypatch):
+        """Test the scheduler wakes at the run time and runs an overdue summary immediately."""
+        from app.core.config import settings
+        from app.workers.summary_scheduler import _next_run_at
+
+        monkeypatch.setattr(settings, "DAILY_SUMMARY_RUN_HOUR_UTC", 9)
+        monkeypatch.setattr(settings, "DAILY_SUMMARY_RUN_MINUTE_UTC", 30)
+        early = datetime(2024, 3, 10, 6, 0, tzinfo=timezone.utc)
+        late = datetime(2024, 3, 10, 12, 0, tzinfo=timezone.utc)
+
+        assert _next_run_at(early, None) == datetime(2024, 3, 10, 9, 30, tzinfo=timezone.utc)
+        assert _next_run_at(late, date(2024, 3, 9)) == late
+        assert _next_run_at(late, date(2024, 3, 10)) == datetime(2024, 3, 11, 9, 30, tzinfo=timezone.utc)
+
+    def test_maintenance_jobs_enqueued_without_a_summary(self, db_session):
+        """Test maintenance jobs are enqueued on their own, not as part of summary generation."""
+        from tests.conftest import TestingSessionLocal
+        from app.db.models.job import Job
+        from app.workers.summary_scheduler import MAINTENANCE_JOBS, _enqueue_maintenance
+
+        assert _enqueue_maintenance(TestingSessionLocal) is True
+        assert [job.job_type for job in db_session.query(Job).order_by(Job.id)] == list(MAINTENANCE_JOBS)
+
+    def test_leadership_without_advisory_locks(self, db_session):
+        """Test databases without advisory locks elect every process."""
+        from tests.conftest import engine
+        from app.workers.summary_scheduler import _check_leadership, _release_leadership, _try_acquire_leadership
+
+        conn = _try_acquire_leadership(engine)
+        assert conn is not None
+        _check_leadership(conn)
+        _release_leadership(conn)
@@ -0,0 +1,73 @@
+"""
+Tests for tag filters and tag facet counts.
+"""
+from fastapi import status
+from app.db.models.status_update import StatusUpdate
+
+
+def _add_updates(db_session, user, *tag_lists):
+    for i, tags in enumerate(tag_lists):
+        db_session.add(StatusUpdate(user_id=user.id, title=f"Update {i}", content="c", tags=tags))
+    db_session.commit()
+
+
+class TestTagFilters:
+    """Test multi-tag filtering on status updates."""
+
+    def test_all_and_any_matching(self, client, auth_headers, db_session, test_user):
+        """Test tag_match=all requires every tag and tag_match=any at least one."""
+        _add_updates(db_session, test_user, ["api", "backend"], ["api"], ["frontend"], None)
+
+        response = client.get("/api/status?tags=api&tags=backend", headers=auth_headers)
+        assert response.status_code == status.HTTP_200_OK
+        assert [u["title"] for u in response.json()["items"]] == ["Update 0"]
+
+        response = client.get("/api/status?tags=backend&tags=frontend&tag_match=any", headers=auth_headers)
+        assert sorted(u["title"] for u in response.json()["items"]) == ["Update 0", "Update 2"]
+
+    def test_postgres_filters_use_array_operators(self):
+        """Test Postgres filters compile to the GIN-indexable @> and && operators."""
+        from types import SimpleNamespace
+        from sqlalchemy.dialects import postgresql
+        from app.core.tags import tag_filter
+
+        db = SimpleNamespace(bind=SimpleNamespace(dialect=postgresql.dialect()))
+        all_sql = str(tag_filter(db, StatusUpdate.tags, ["a", "b"], "all").compile(dialect=postgresql.dialect()))
+        any_sql = str(tag_filter(db, StatusUpdate.tags, ["a", "b"], "any").compile(dialect=postgresql.dialect()))
+        assert all_sql.startswith("status_updates.tags @>")
+        assert any_sql.startswith("status_updates.tags &&")
+
+
+class TestTagFacets:
+    """Test the tag facet endpoint."""
+
+    def test_tag_counts(self, client, auth_headers, db_session, test_user):
+        """Test tags are counted and ordered by usage."""
+        _add_updates(db_session, test_user, ["api", "backend"], ["api"], ["frontend"])
+
+        response = client.get("/api/tags?collection=status_updates", headers=auth_headers)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {
+            "collection": "status_updates",
+            "tags": [
+                {"tag": "api", "count": 2},
+                {"tag": "backend", "count": 1},
+                {"tag": "frontend", "count": 1},
+            ],
+        }
+
+    def test_tag_counts_cached_until_collection_changes(self, client, auth_headers, query_counter):
+        """Test counts are served from the response cache until the collection changes."""
+        client.get("/api/tags?collection=status_updates", headers=auth_headers)
+        query_counter.clear()
+        client.get("/api/tags?collection=status_updates", headers=auth_headers)
+        assert not any("GROUP BY" in statement for statement in query_counter)
+
+        client.post("/api/status", headers=auth_headers, json={"title": "t", "content": "c", "tags": ["ops"]})
+        response = client.get("/api/tags?collection=status_updates", headers=auth_headers)
+        assert response.json()["tags"] == [{"tag": "ops", "count": 1}]
+
+    def test_unknown_collection(self, client, auth_headers):
+        """Test only tagged collections can be counted."""
+        response = client.get("/api/tags?collection=incidents", headers=auth_headers)
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
@@ -0,0 +1,60 @@
+"""
+Tests for user listing and search endpoints.
+"""
+from fastapi import status
+from app.db.models.user import User
+
+
+def _add_users(db_session, *names):
+    for name in names:
+        db_session.add(User(
+            email=f"{name.lower().replace(' ', '.')}@example.com",
+            password_hash="x",
+            full_name=name,
+            role="member",
+            is_active=True
+        ))
+    db_session.commit()
+
+
+class TestUserSearch:
+    """Test searching users by name or email."""
+
+    def test_admin_list_search(self, client, admin_headers, db_session):
+        """Test the admin list filters by name or email."""
+        _add_users(db_session, "Alice Johnson", "Bob Smith")
+
+        response = client.get("/api/users?search=johnson", headers=admin_headers)
+        assert response.status_code == status.HTTP_200_OK
+        assert [u["full_name"] for u in response.json()] == ["Alice Johnson"]
+
+        response = client.get("/api/users?search=bob.smith", headers=admin_headers)
+        assert [u["full_name"] for u in response.json()] == ["Bob Smith"]
+
+    def test_assignment_picker_search_is_limited(self, client, auth_headers, db_session):
+        """Test the assignment picker searches and caps results when given a term."""
+        _add_users(db_session, "Sam One", "Sam Two", "Sam Three")
+
+        response = client.get("/api/users/for-assignment?search=sam&limit=2", headers=auth_headers)
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.json()) == 2
+
+        response = client.get("/api/users/for-assignment", headers=auth_headers)
+        assert len(response.json()) == 4
+
+    def test_trigram_search_query(self):
+        """Test the Postgres search matches and ranks through trigram operators."""
+        from sqlalchemy import select
+        from sqlalchemy.dialects import postgresql
+        from app.core.search import trigram_matches, trigram_rank
+
+        columns = (User.full_name, User.email)
+        sql = str(
+            select(User.id)
+            .where(trigram_matches(columns, "jonson"))
+            .order_by(trigram_rank(columns, "jonson").desc())
+            .compile(dialect=postgresql.dialect())
+        )
+        assert "users.full_name ILIKE" in sql
+        assert "users.full_name %" in sql
+        assert "greatest(similarity(users.full_name" in sql
@@ -30,6 +30,7 @@ export const AuthProvider: React.FC<{ children: ReactNode }> = ({ children }) =>
           // Token is invalid or expired, clear it
           console.log('Invalid token, clearing storage', error)
           localStorage.removeItem('token')
+          localStorage.removeItem('refreshToken')
           setToken(null)
           setUser(null)
         })
@@ -44,6 +45,7 @@ export const AuthProvider: React.FC<{ children: ReactNode }> = ({ children }) =>
       const response = await authService.login(email, password)
       setToken(response.access_token)
       localStorage.setItem('token', response.access_token)
+      localStorage.setItem('refreshToken', response.refresh_token)
       
       // Fetch user info
       const userData = await authService.getCurrentUser(response.access_token)
@@ -55,9 +57,15 @@ export const AuthProvider: React.FC<{ children: ReactNode }> = ({ children }) =>
   }
 
   const logout = () => {
+    // Revoke the refresh token server-side; local state is cleared regardless
+    const storedToken = localStorage.getItem('token')
+    if (storedToken) {
+      authService.logout(storedToken, localStorage.getItem('refreshToken')).catch(() => {})
+    }
     setToken(null)
     setUser(null)
     localStorage.removeItem('token')
+    localStorage.removeItem('refreshToken')
   }
 
   return (
@@ -1,8 +1,42 @@
+import { useState, useEffect } from 'react'
 import { Link } from 'react-router-dom'
 import { useAuth } from '../contexts/AuthContext'
+import { dashboardService } from '../services/dashboardService'
+import { eventsService } from '../services/eventsService'
+import { Dashboard as DashboardData } from '../types/dashboard'
+
+// Changes arriving within this window share one overview reload
+const RELOAD_DELAY_MS = 1500
 
 const Dashboard = () => {
   const { user, logout } = useAuth()
+  const [overview, setOverview] = useState<DashboardData | null>(null)
+
+  useEffect(() => {
+    // One request for all landing page counts and recent items
+    const loadOverview = () =>
+      dashboardService
+        .getDashboard()
+        .then(setOverview)
+        .catch((err) => console.error('Failed to load dashboard:', err))
+    loadOverview()
+    // Reload when something changes instead of polling. A bulk write sends one event per item,
+    // so a burst is coalesced into a single reload at the end of the window.
+    let reloadTimer: ReturnType<typeof setTimeout> | undefined
+    const scheduleReload = () => {
+      if (reloadTimer === undefined) {
+        reloadTimer = setTimeout(() => {
+          reloadTimer = undefined
+          loadOverview()
+        }, RELOAD_DELAY_MS)
+      }
+    }
+    const unsubscribe = eventsService.subscribe(scheduleReload)
+    return () => {
+      clearTimeout(reloadTimer)
+      unsubscribe()
+    }
+  }, [])
 
   return (
     <div style={{ padding: '2rem', maxWidth: '1200px', margin: '0 auto' }}>
@@ -53,6 +87,34 @@ const Dashboard = () => {
           </div>
         </div>
 
+        {overview && (
+          <div style={{
+            backgroundColor: 'white',
+            padding: '2rem',
+            borderRadius: '8px',
+            boxShadow: '0 2px 4px rgba(0,0,0,0.1)',
+            marginBottom: '2rem'
+          }}>
+            <h3 style={{ marginBottom: '0.5rem' }}>At a Glance</h3>
+            <p>
+              <strong>Open incidents:</strong> {overview.open_incidents} (
+              {overview.open_incidents_by_severity.critical} critical,{' '}
+              {overview.open_incidents_by_severity.high} high)
+            </p>
+            <p><strong>Active blockers:</strong> {overview.active_blockers}</p>
+            {overview.recent_status_updates.length > 0 && (
+              <p>
+                <strong>Latest update:</strong> {overview.recent_status_updates[0].title}
+              </p>
+            )}
+            {overview.recent_decisions.length > 0 && (
+              <p>
+                <strong>Latest decision:</strong> {overview.recent_decisions[0].title}
+              </p>
+            )}
+          </div>
+        )}
+
         <div style={{
           display: 'grid',
           gridTemplateColumns: 'repeat(auto-fit, minmax(250px, 1fr))',
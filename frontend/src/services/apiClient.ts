@@ -26,18 +26,70 @@ export const apiClient = axios.create({
   },
 })
 
+const isAuthRoute = (url?: string) =>
+  !!url &&
+  (url.includes('/api/auth/login') ||
+    url.includes('/api/auth/register') ||
+    url.includes('/api/auth/refresh'))
+
 apiClient.interceptors.request.use((config) => {
   const token = localStorage.getItem('token')
-  const isAuthRoute =
-    config.url?.includes('/api/auth/login') || config.url?.includes('/api/auth/register')
 
-  if (token && !isAuthRoute) {
+  if (token && !isAuthRoute(config.url)) {
     config.headers.Authorization = config.headers.Authorization ?? `Bearer ${token}`
   }
 
   return config
 })
 
+// Single in-flight refresh shared by all requests that hit a 401 at the same time
+let refreshPromise: Promise<string> | null = null
+
+const refreshAccessToken = (): Promise<string> => {
+  if (!refreshPromise) {
+    const refreshToken = localStorage.getItem('refreshToken')
+    refreshPromise = (
+      refreshToken
+        ? axios
+            .post(`${API_BASE_URL}/api/auth/refresh`, { refresh_token: refreshToken })
+            .then((response) => {
+              localStorage.setItem('token', response.data.access_token)
+              localStorage.setItem('refreshToken', response.data.refresh_token)
+              return response.data.access_token as string
+            })
+        : Promise.reject(new Error('No refresh token'))
+    ).finally(() => {
+      refreshPromise = null
+    })
+  }
+  return refreshPromise
+}
+
+apiClient.interceptors.response.use(
+  (response) => response,
+  async (error) => {
+    const config = error.config
+    if (
+      axios.isAxiosError(error) &&
+      error.response?.status === 401 &&
+      config &&
+      !config._retried &&
+      !isAuthRoute(config.url)
+    ) {
+      config._retried = true
+      try {
+        const token = await refreshAccessToken()
+        config.headers.Authorization = `Bearer ${token}`
+        return apiClient(config)
+      } catch {
+        localStorage.removeItem('token')
+        localStorage.removeItem('refreshToken')
+      }
+    }
+    return Promise.reject(error)
+  }
+)
+
 export const getApiErrorMessage = (
   error: unknown,
   fallback = 'Something went wrong. Please try again.'
@@ -46,6 +46,18 @@ export const authService = {
     }
   },
 
+  async logout(token: string, refreshToken: string | null): Promise<void> {
+    await apiClient.post(
+      '/api/auth/logout',
+      refreshToken ? { refresh_token: refreshToken } : undefined,
+      {
+        headers: {
+          Authorization: `Bearer ${token}`,
+        },
+      }
+    )
+  },
+
   async register(email: string, password: string, fullName: string): Promise<User> {
     const response = await apiClient.post<User>('/api/auth/register', {
       email,
@@ -0,0 +1,11 @@
+import { Dashboard } from '../types/dashboard'
+import { apiClient } from './apiClient'
+
+export const dashboardService = {
+  async getDashboard(limit?: number): Promise<Dashboard> {
+    const response = await apiClient.get<Dashboard>('/api/dashboard', {
+      params: limit ? { limit } : undefined,
+    })
+    return response.data
+  },
+}
@@ -0,0 +1,63 @@
+import { ChangeEvent } from '../types/changeEvent'
+import { apiClient } from './apiClient'
+
+// Delay before opening a new stream once one has been closed for good
+const RECONNECT_DELAY_MS = 5000
+
+export const eventsService = {
+  // Calls onChange for every committed change; returns a function that closes the stream.
+  // EventSource can't send headers, so each connection puts a short-lived stream ticket in the URL.
+  // Tickets are requested through apiClient, which refreshes an expired access token first.
+  subscribe(onChange: (change: ChangeEvent) => void): () => void {
+    let source: EventSource | null = null
+    let lastPosition = ''
+    let retryTimer: ReturnType<typeof setTimeout> | undefined
+    let closed = false
+
+    const retry = () => {
+      // Logged out (the refresh failed): nothing to reconnect as
+      if (!closed && localStorage.getItem('token')) {
+        retryTimer = setTimeout(open, RECONNECT_DELAY_MS)
+      }
+    }
+
+    const open = async () => {
+      try {
+        const { data } = await apiClient.post<{ ticket: string }>('/api/events/ticket')
+        if (closed) {
+          return
+        }
+        const url = new URL('/api/events', apiClient.defaults.baseURL || window.location.origin)
+        url.searchParams.set('ticket', data.ticket)
+        if (lastPosition) {
+          // A new EventSource doesn't send Last-Event-ID, so resume explicitly
+          url.searchParams.set('after', lastPosition)
+        }
+        const current = new EventSource(url.toString())
+        source = current
+        current.addEventListener('change', (event) => {
+          const message = event as MessageEvent
+          lastPosition = message.lastEventId || lastPosition
+          onChange(JSON.parse(message.data) as ChangeEvent)
+        })
+        current.onerror = () => {
+          // EventSource retries dropped connections itself, with the same URL. Once the ticket has
+          // expired that retry is rejected and it gives up, so reconnect with a fresh ticket.
+          if (current.readyState === EventSource.CLOSED) {
+            current.close()
+            retry()
+          }
+        }
+      } catch {
+        retry()
+      }
+    }
+
+    open()
+    return () => {
+      closed = true
+      clearTimeout(retryTimer)
+      source?.close()
+    }
+  },
+}
@@ -0,0 +1,5 @@
+export interface ChangeEvent {
+  collection: 'status_updates' | 'incidents' | 'blockers' | 'decisions'
+  action: string
+  id: number
+}
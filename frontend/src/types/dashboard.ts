@@ -0,0 +1,18 @@
+import { Decision } from './decision'
+import { StatusUpdate } from './statusUpdate'
+
+export interface IncidentSeverityCounts {
+  critical: number
+  high: number
+  medium: number
+  low: number
+}
+
+export interface Dashboard {
+  open_incidents: number
+  open_incidents_by_severity: IncidentSeverityCounts
+  active_blockers: number
+  recent_status_updates: StatusUpdate[]
+  recent_decisions: Decision[]
+  generated_at: string
+}
@@ -11,4 +11,6 @@ export interface User {
 export interface LoginResponse {
   access_token: string
   token_type: string
+  refresh_token: string
+  expires_in: number
 }